@@ -0,0 +1,225 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from app.download import (
+    MDB_FILLED_URL,
+    TABLES_URL,
+    download_file,
+    download_txt_to_import,
+)
+from logger import log
+
+CACHE_SCHEME = "cache://"
+DEFAULT_CACHE_DIRECTORY = os.path.join(Path.home(), ".cache", "loglan_converter")
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    sha256: str
+    size: int
+    etag: str | None
+    last_modified: str | None
+    fetched: float
+    accessed: float
+
+
+class DownloadCache:
+    """
+    Content-addressed cache of downloaded files.
+    Blobs are stored once per SHA-256 under `objects/`, the index maps every
+    URL to its blob and validators. The least recently used entries are
+    evicted when the total size of blobs exceeds `max_size`.
+    """
+
+    INDEX = "index.json"
+    OBJECTS = "objects"
+    VIEWS = "views"
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        max_age: float = 0,
+        link: bool = False,
+    ):
+        """
+        Parameters:
+            directory (str): Cache directory, LOD_CACHE_DIR or ~/.cache by default.
+            max_size (int): Maximum total size of cached blobs in bytes.
+            max_age (float): Seconds an entry is used without revalidation.
+            link (bool): Hardlink blobs instead of copying them on materialize.
+                Only safe for files that are never modified in place.
+        """
+        self.directory = (
+            directory or os.environ.get("LOD_CACHE_DIR") or DEFAULT_CACHE_DIRECTORY
+        )
+        self.max_size = max_size
+        self.max_age = max_age
+        self.link = link
+        self._lock = threading.Lock()
+        Path(self.directory, self.OBJECTS).mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(directory="{self.directory}")'
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.directory, self.INDEX)
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.directory, self.OBJECTS, sha256[:2], sha256)
+
+    def view_directory(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, self.VIEWS, digest)
+
+    def lookup(self, url: str) -> CacheEntry | None:
+        """
+        Returns the entry for the URL if its blob is present.
+        """
+        with self._lock:
+            index = self._read_index()
+            data = index.get(url)
+            if not data:
+                return None
+            entry = CacheEntry(**data)
+            if not os.path.exists(self.blob_path(entry.sha256)):
+                index.pop(url)
+                self._write_index(index)
+                return None
+            return entry
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.fetched < self.max_age
+
+    def store(
+        self, url: str, path: str, sha256: str, validators: dict | None = None
+    ) -> CacheEntry:
+        """
+        Adds a downloaded file to the cache and evicts old entries if needed.
+        """
+        validators = validators or {}
+        blob = self.blob_path(sha256)
+        if not os.path.exists(blob):
+            Path(blob).parent.mkdir(parents=True, exist_ok=True)
+            temporary = f"{blob}.{os.getpid()}.{threading.get_ident()}.tmp"
+            shutil.copyfile(path, temporary)
+            os.replace(temporary, blob)
+
+        now = time.time()
+        entry = CacheEntry(
+            url=url,
+            sha256=sha256,
+            size=os.path.getsize(blob),
+            etag=validators.get("etag"),
+            last_modified=validators.get("last_modified"),
+            fetched=now,
+            accessed=now,
+        )
+        with self._lock:
+            index = self._read_index()
+            index[url] = entry._asdict()
+            self._evict(index)
+            self._write_index(index)
+        return entry
+
+    def touch(self, entry: CacheEntry, revalidated: bool = False) -> CacheEntry:
+        now = time.time()
+        entry = entry._replace(
+            accessed=now, fetched=now if revalidated else entry.fetched
+        )
+        with self._lock:
+            index = self._read_index()
+            if entry.url in index:
+                index[entry.url] = entry._asdict()
+                self._write_index(index)
+        return entry
+
+    def materialize(self, entry: CacheEntry, path: str):
+        """
+        Places the cached content of the entry at the given path.
+        """
+        if os.path.exists(path):
+            os.remove(path)
+        blob = self.blob_path(entry.sha256)
+        if self.link:
+            try:
+                os.link(blob, path)
+                return
+            except OSError:
+                log.debug("Cannot link %s, copying instead", blob)
+        shutil.copyfile(blob, path)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._total_size(self._read_index())
+
+    def clear(self):
+        with self._lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            Path(self.directory, self.OBJECTS).mkdir(parents=True, exist_ok=True)
+
+    def _total_size(self, index: dict) -> int:
+        blobs = {data["sha256"]: data["size"] for data in index.values()}
+        return sum(blobs.values())
+
+    def _evict(self, index: dict):
+        by_access = sorted(index.values(), key=lambda data: data["accessed"])
+        while by_access and self._total_size(index) > self.max_size:
+            data = by_access.pop(0)
+            index.pop(data["url"])
+            log.info("Evicting %s from cache", data["url"])
+            if not any(d["sha256"] == data["sha256"] for d in index.values()):
+                blob = self.blob_path(data["sha256"])
+                if os.path.exists(blob):
+                    os.remove(blob)
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write_index(self, index: dict):
+        temporary = f"{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(index, file)
+        os.replace(temporary, self.index_path)
+
+
+def resolve_cached_source(
+    source_type: str, path: str, cache: DownloadCache | None = None
+) -> str:
+    """
+    Resolves a `cache://[url]` source path to a local path for the
+    `text` and `access` source types, downloading into the cache if needed.
+    Without a URL the default LOD GitHub location is used.
+    Any other path is returned unchanged.
+    """
+    if not path.startswith(CACHE_SCHEME):
+        return path
+
+    url = path[len(CACHE_SCHEME) :]
+    if source_type == "text":
+        cache = cache or DownloadCache(link=True)
+        directory = cache.view_directory(url or TABLES_URL)
+        download_txt_to_import(directory, url or TABLES_URL, cache=cache)
+        return directory
+    if source_type == "access":
+        cache = cache or DownloadCache()
+        directory = cache.view_directory(url or MDB_FILLED_URL)
+        return download_file(url or MDB_FILLED_URL, directory, cache=cache).path
+
+    raise ValueError(f"Cached sources are not supported for type '{source_type}'")
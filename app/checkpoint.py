@@ -0,0 +1,249 @@
+"""
+This module records the progress of a database import in the target itself.
+
+Import steps mark themselves complete, and long steps mark every committed
+batch, in the same transaction as their data. A resumed import then skips
+completed stages and the batches already committed by an interrupted one.
+The progress table lives in its own MetaData, so recreating the dictionary
+tables does not touch it.
+
+Classes:
+    Checkpoint: Reads and writes the progress of the import stages.
+    CheckpointedImport: Runs the import stages of a database interface.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterator, Sequence, TypeVar
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Engine,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    select,
+)
+from sqlalchemy.orm import Session
+
+from logger import logging, logging_time
+
+if TYPE_CHECKING:
+    from app.storage import Storage
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
+
+BATCH_SIZE = 1000
+T = TypeVar("T")
+
+progress_metadata = MetaData()
+progress_table = Table(
+    "import_progress",
+    progress_metadata,
+    Column("stage", String(64), primary_key=True),
+    Column("batches", Integer, nullable=False, default=0),
+    Column("completed", Boolean, nullable=False, default=False),
+    Column("updated", DateTime, nullable=False),
+)
+
+
+class Checkpoint:
+    """
+    Progress of the import stages, stored in the import_progress table.
+    Without an engine it records nothing and every stage is pending,
+    which is the behaviour of an import that cannot be resumed.
+    Methods:
+        completed: Whether a stage is complete.
+        batches: Yields the batches of a stage that are not committed yet.
+        mark: Records a committed batch or a complete stage in a session.
+    """
+
+    def __init__(self, engine: Engine | None = None, resume: bool = False):
+        """
+        Parameters:
+            engine (Engine | None): Engine of the import target.
+            resume (bool): Keep the recorded progress. A new import clears it.
+        """
+        self.engine = engine
+        self._progress: dict[str, tuple[int, bool]] = {}
+        if engine is None:
+            return
+
+        progress_metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            if not resume:
+                connection.execute(progress_table.delete())
+            rows = connection.execute(select(progress_table)).all()
+        self._progress = {row.stage: (row.batches, row.completed) for row in rows}
+        if resume and self._progress:
+            log.info("Resuming import, completed stages: %s", self.completed_stages)
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: Whether progress is recorded, that is, an engine is set.
+        """
+        return self.engine is not None
+
+    @property
+    def started(self) -> bool:
+        """
+        Returns:
+            bool: Whether any progress is recorded in the target.
+        """
+        return bool(self._progress)
+
+    @property
+    def completed_stages(self) -> list[str]:
+        """
+        Returns:
+            list[str]: Names of the stages recorded as complete.
+        """
+        return [stage for stage, (_, done) in self._progress.items() if done]
+
+    def completed(self, stage: str) -> bool:
+        """
+        Parameters:
+            stage (str): Name of the stage.
+        Returns:
+            bool: Whether the stage is recorded as complete.
+        """
+        return self._progress.get(stage, (0, False))[1]
+
+    def batches(
+        self, stage: str, items: Sequence[T], batch_size: int = BATCH_SIZE
+    ) -> Iterator[tuple[int, Sequence[T]]]:
+        """
+        Splits items into numbered batches, skipping those already committed.
+        Parameters:
+            stage (str): Name of the stage.
+            items (Sequence): Items processed by the stage, in a stable order.
+            batch_size (int): Number of items per batch.
+        Yields:
+            tuple[int, Sequence]: The batch number and its items.
+        """
+        done = self._progress.get(stage, (0, False))[0]
+        if done:
+            log.info("Skipping %s committed batches of %s", done, stage)
+        for number, start in enumerate(range(0, len(items), batch_size)):
+            if number >= done:
+                yield number, items[start : start + batch_size]
+
+    def mark(self, session: Session, stage: str, batch: int | None = None):
+        """
+        Records progress in the session, to be committed with the stage data.
+        Parameters:
+            session (Session): Session of the stage.
+            stage (str): Name of the stage.
+            batch (int | None): Number of the committed batch,
+                or None when the whole stage is complete.
+        """
+        if not self.enabled:
+            return
+
+        batches, completed = self._progress.get(stage, (0, False))
+        if batch is None:
+            completed = True
+        else:
+            batches = batch + 1
+        values = {"batches": batches, "completed": completed, "updated": datetime.now()}
+
+        updated = session.execute(
+            progress_table.update()
+            .where(progress_table.c.stage == stage)
+            .values(**values)
+        )
+        if not updated.rowcount:
+            session.execute(progress_table.insert().values(stage=stage, **values))
+        self._progress[stage] = (batches, completed)
+
+
+class CheckpointedImport:
+    """
+    Import stages of the database interfaces, shared by those whose connector
+    has an engine, a resume flag and a batch_session. The stages record their
+    progress in a Checkpoint, and a resumed import skips the completed ones.
+    Methods:
+        import_data: Runs the stages that are not complete yet.
+        import_stages: Returns the stages of an import with their names.
+        commit_batches: Processes the items of a stage in committed batches.
+        finish_import: Called once every stage is complete.
+    """
+
+    # pylint: disable=no-member
+    checkpoint: Checkpoint
+
+    @logging_time
+    def import_data(self, data: Storage) -> None:
+        """
+        Runs the import stages, recording their progress in the database.
+        When the connector resumes an import, completed stages are skipped,
+        and without any recorded progress the tables are recreated first.
+        """
+        self.checkpoint = Checkpoint(self.connector.engine, self.connector.resume)
+        if self.connector.resume and not self.checkpoint.started:
+            # the kept tables hold rows of an import that recorded no progress
+            log.warning("No progress recorded to resume, importing from scratch")
+            self.connector.recreate_tables()
+        for stage, step in self.import_stages(data):
+            if self.checkpoint.completed(stage):
+                log.info("Skipping completed stage %s", stage)
+                continue
+            step()
+        self.finish_import()
+
+    def import_stages(self, data: Storage) -> list[tuple[str, partial]]:
+        """
+        Returns:
+            list[tuple[str, partial]]: The stages of an import, in order,
+                with the names their progress is recorded under.
+        """
+        simple_stages = [
+            (
+                f"import_{class_name}",
+                partial(self.import_simple_class, data, class_name),
+            )
+            for class_name in self.SIMPLE_CLASSES
+        ]
+        return simple_stages + [
+            ("import_words", partial(self.import_words, data)),
+            ("import_definitions", partial(self.import_definitions, data, "en")),
+            ("add_keys", partial(self.add_keys)),
+            ("link_keys", partial(self.link_keys)),
+            ("link_authors", partial(self.link_authors, data)),
+            ("link_complexes", partial(self.link_complexes, data)),
+            ("link_affixes", partial(self.link_affixes, data)),
+        ]
+
+    def commit_batches(
+        self,
+        session: Session,
+        stage: str,
+        items: Sequence[T],
+        process: Callable[[Sequence[T]], None],
+    ):
+        """
+        Processes the batches of a stage not committed yet, committing each
+        one with its progress.
+        Parameters:
+            session (Session): Session of the stage.
+            stage (str): Name of the stage.
+            items (Sequence): Items processed by the stage, in a stable order.
+            process (Callable): Processes the items of a batch in the session.
+        """
+        for batch, chunk in self.checkpoint.batches(stage, items):
+            process(chunk)
+            self.checkpoint.mark(session, stage, batch)
+            session.commit()
+
+    def finish_import(self):
+        """
+        Completes the import after its last stage, when the connector needs to.
+        """
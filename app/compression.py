@@ -0,0 +1,97 @@
+"""
+This module opens files through an optional gzip or zstd compression layer.
+
+The compression of a file is recognised by its suffix (.gz, .zst). zstd needs
+the optional `zstandard` package, which also compresses with several threads.
+
+Functions:
+    detect_compression: Returns the compression of a path from its suffix.
+    compressed_path: Adds the suffix of a compression to a path.
+    open_compressed: Opens a file for streaming reads or writes.
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib
+import io
+from typing import IO
+
+COMPRESSIONS = ("gzip", "zstd")
+SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def detect_compression(path: str) -> str | None:
+    """
+    Returns:
+        str | None: "gzip" or "zstd" for a path with their suffix, else None.
+    """
+    for compression, suffix in SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def compressed_path(path: str, compression: str | None) -> str:
+    """
+    Returns:
+        str: The path with the suffix of the compression, if any.
+    """
+    return f"{path}{SUFFIXES[compression]}" if compression else path
+
+
+def open_compressed(
+    path: str,
+    mode: str = "rb",
+    compression: str | None = None,
+    level: int | None = None,
+    threads: int = 0,
+) -> IO:
+    """
+    Opens a file, compressed according to its suffix unless compression is given.
+    Parameters:
+        path (str): Path to the file.
+        mode (str): "rb", "wb", "rt" or "wt". Text modes use UTF-8.
+        compression (str | None): "gzip", "zstd" or None to detect it.
+        level (int | None): Compression level, the library default if None.
+        threads (int): zstd worker threads for writing, 0 for none
+            and -1 for one per CPU. gzip always uses one thread.
+    Returns:
+        IO: A binary or text file object.
+    Raises:
+        ValueError: If the compression or mode is unknown.
+        ImportError: If zstd is requested but zstandard is not installed.
+    """
+    if mode not in ("rb", "wb", "rt", "wt"):
+        raise ValueError(f"Unsupported mode '{mode}'.")
+    compression = compression or detect_compression(path)
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}'.")
+
+    text = mode.endswith("t")
+    binary_mode = mode[0] + "b"
+    if compression == "gzip":
+        file = gzip.open(path, binary_mode, compresslevel=9 if level is None else level)
+    elif compression == "zstd":
+        file = _open_zstd(path, binary_mode, level, threads)
+    elif text:
+        # pylint: disable-next=consider-using-with
+        return open(path, mode, encoding="utf-8")
+    else:
+        # pylint: disable-next=consider-using-with, unspecified-encoding
+        file = open(path, binary_mode)
+
+    if text:
+        return io.TextIOWrapper(file, encoding="utf-8")
+    return file
+
+
+def _open_zstd(path: str, mode: str, level: int | None, threads: int) -> IO:
+    zstandard = importlib.import_module("zstandard")
+    if mode == "rb":
+        # the zstd reader cannot iterate lines by itself
+        return io.BufferedReader(zstandard.open(path, mode))
+    compressor = zstandard.ZstdCompressor(
+        level=3 if level is None else level, threads=threads
+    )
+    return zstandard.open(path, mode, cctx=compressor)
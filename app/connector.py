@@ -2,7 +2,7 @@
 from abc import ABC, abstractmethod
 
 from sqlalchemy import Engine
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 
 
 class DatabaseConnector(ABC):
@@ -10,6 +10,9 @@ class DatabaseConnector(ABC):
 
     path: str
     engine: Engine
+    session_factory: sessionmaker
+
+    ENGINE_OPTIONS: dict = {}
 
     @property
     @abstractmethod
@@ -0,0 +1,115 @@
+"""
+This module parses the fixed-format dates of the dictionary tables.
+
+Event dates, setting timestamps and word years are written in a few fixed
+formats and repeat a lot, so results are memoised and the known formats are
+parsed by splitting the string instead of `datetime.strptime`. Anything the
+fast parsers do not recognise or cannot build, such as a 13th month, falls
+back to `strptime`, so invalid values raise its usual ValueError messages.
+
+Functions:
+    parse_datetime: Parses a string in the given format, cached.
+    parse_event_date: Parses a CommonEvent.DATE_FORMAT date.
+    parse_setting_date: Parses a CommonSetting.DATE_FORMAT timestamp.
+    parse_year: Parses a four digit year into the date of its first day.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Callable
+
+from app.models.common import CommonEvent, CommonSetting
+
+CACHE_SIZE = 4096
+YEAR_FORMAT = "%Y"
+
+
+def _digits(parts: list[str], widths: tuple[int, ...]) -> list[int] | None:
+    if len(parts) != len(widths):
+        return None
+    for part, width in zip(parts, widths):
+        if not part.isascii() or not part.isdigit() or not 0 < len(part) <= width:
+            return None
+    return [int(part) for part in parts]
+
+
+def _event_date(value: str) -> datetime | None:
+    numbers = _digits(value.split("/"), (2, 2, 4))
+    if numbers is None or numbers[2] < 1000:
+        return None
+    month, day, year = numbers
+    return datetime(year, month, day)
+
+
+def _setting_date(value: str) -> datetime | None:
+    day_part, _, time_part = value.partition(" ")
+    numbers = _digits(day_part.split("."), (2, 2, 4))
+    clock = _digits(time_part.split(":"), (2, 2, 2))
+    if numbers is None or clock is None or numbers[2] < 1000:
+        return None
+    day, month, year = numbers
+    return datetime(year, month, day, *clock)
+
+
+def _year(value: str) -> datetime | None:
+    if len(value) != 4 or not value.isascii() or not value.isdigit():
+        return None
+    return datetime(int(value), 1, 1)
+
+
+FAST_PARSERS: dict[str, Callable[[str], datetime | None]] = {
+    CommonEvent.DATE_FORMAT: _event_date,
+    CommonSetting.DATE_FORMAT: _setting_date,
+    YEAR_FORMAT: _year,
+}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_datetime(value: str, date_format: str) -> datetime:
+    """
+    Parses a string like datetime.strptime, with a fast path for known formats.
+    Parameters:
+        value (str): The string to parse.
+        date_format (str): A strptime format.
+    Returns:
+        datetime: The parsed value.
+    Raises:
+        ValueError: If the string does not match the format.
+    """
+    fast_parser = FAST_PARSERS.get(date_format)
+    try:
+        parsed = fast_parser(value) if fast_parser else None
+    except ValueError:
+        parsed = None
+    return parsed or datetime.strptime(value, date_format)
+
+
+def parse_event_date(value: str) -> datetime:
+    """
+    Parses a LexEvent date such as "01/31/1975" (CommonEvent.DATE_FORMAT).
+    Raises:
+        ValueError: If the value is not such a date.
+    """
+    return parse_datetime(value, CommonEvent.DATE_FORMAT)
+
+
+def parse_setting_date(value: str) -> datetime:
+    """
+    Parses a Settings timestamp such as "31.01.2024 12:00:00"
+    (CommonSetting.DATE_FORMAT).
+    Raises:
+        ValueError: If the value is not such a timestamp.
+    """
+    return parse_datetime(value, CommonSetting.DATE_FORMAT)
+
+
+def parse_year(value: str) -> date:
+    """
+    Returns:
+        date: January 1st of a four digit year such as "1975".
+    Raises:
+        ValueError: If the value is not a year.
+    """
+    return parse_datetime(value, YEAR_FORMAT).date()
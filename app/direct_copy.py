@@ -0,0 +1,121 @@
+"""
+This module copies a dictionary between databases sharing the loglan_core models.
+
+Postgres and SQLite store the same tables, so a copy between them does not
+need the text-shaped Storage: every table of BaseModel.metadata, association
+tables included, is read with batched Core selects and written with batched
+inserts in dependency order. Primary keys are copied as they are, and
+Postgres sequences are moved past the copied ids afterwards.
+
+Functions:
+    database_identity: Identifies the database a type and path point to.
+    copy_database: Copies all tables from one connector to another.
+    copy_table: Copies the rows of one table in batches.
+    reset_sequences: Moves Postgres serial sequences past the copied ids.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Iterable
+
+from loglan_core.base import BaseModel
+from sqlalchemy import Connection, Table, func, make_url, select
+
+from app.connector import DatabaseConnector
+from app.instrumentation import metrics
+from logger import logging, logging_time
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
+
+BATCH_SIZE = 5000
+POSTGRES_PORT = 5432
+
+
+def database_identity(type_name: str, path: str) -> tuple | None:
+    """
+    Returns a key equal for every path of the same database: the resolved
+    file of a SQLite path, or the host, port and name of a Postgres URL.
+    Returns:
+        tuple | None: The key, or None for an in-memory SQLite database,
+            which is never shared.
+    """
+    if type_name == "sqlite":
+        if path in ("", ":memory:"):
+            return None
+        return type_name, os.path.realpath(path)
+    url = make_url(path)
+    host = url.host or url.query.get("host") or "localhost"
+    return type_name, host, url.port or POSTGRES_PORT, url.database
+
+
+def copy_table(
+    source: Connection, target: Connection, table: Table, batch_size: int = BATCH_SIZE
+) -> int:
+    """
+    Copies the rows of a table in primary key order.
+    Returns:
+        int: Number of copied rows.
+    """
+    query = select(table).order_by(*table.primary_key.columns)
+    result = source.execution_options(yield_per=batch_size).execute(query)
+    copied = 0
+    for rows in result.mappings().partitions(batch_size):
+        target.execute(table.insert(), [dict(row) for row in rows])
+        copied += len(rows)
+    return copied
+
+
+def reset_sequences(
+    connection: Connection, tables: Iterable[Table], schema: str | None = None
+):
+    """
+    Sets the serial sequence of every autoincrement primary key to the
+    largest copied id, so rows added later do not collide with copied ones.
+    Parameters:
+        connection (Connection): Postgres connection of the target.
+        tables (Iterable[Table]): The copied tables.
+        schema (str | None): Schema of the tables if not the default one.
+    """
+    for table in tables:
+        column = table.autoincrement_column
+        if column is None:
+            continue
+        name = f'"{schema}"."{table.name}"' if schema else f'"{table.name}"'
+        largest = func.max(column)
+        connection.execute(
+            select(
+                func.setval(
+                    func.pg_get_serial_sequence(name, column.name),
+                    func.coalesce(largest, 1),
+                    largest.is_not(None),
+                )
+            ).select_from(table)
+        )
+
+
+@logging_time
+def copy_database(
+    source: DatabaseConnector,
+    target: DatabaseConnector,
+    batch_size: int = BATCH_SIZE,
+) -> dict[str, int]:
+    """
+    Copies every table of the loglan_core models from source to target
+    in a single target transaction. The target tables must exist and be empty.
+    Returns:
+        dict[str, int]: Number of copied rows by table name.
+    """
+    tables = BaseModel.metadata.sorted_tables
+    counts = {}
+    with source.engine.connect() as reader, target.engine.begin() as writer:
+        for table in tables:
+            with metrics.stage(f"copy_{table.name}"):
+                counts[table.name] = copy_table(reader, writer, table, batch_size)
+                metrics.add_rows(counts[table.name])
+            log.info("Copied %s %s rows", counts[table.name], table.name)
+
+        if target.engine.dialect.name == "postgresql":
+            reset_sequences(writer, tables, getattr(target, "shadow_schema", None))
+    return counts
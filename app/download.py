@@ -1,49 +1,355 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from __future__ import annotations
+
+import codecs
+import hashlib
+import http.client
+import json
 import os
+import time
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple
 
 from app.properties import ClassName
+from logger import log
+
+if TYPE_CHECKING:
+    from app.cache import CacheEntry, DownloadCache
+
+TABLES_URL = "https://raw.githubusercontent.com/torrua/LOD/master/tables/"
+MDB_FILLED_URL = "https://github.com/torrua/LOD/raw/master/source/LoglanDictionary.mdb"
+MDB_EMPTY_URL = (
+    "https://github.com/torrua/LOD/raw/master/source/LoglanDictionaryTemplate.mdb"
+)
+
+CHUNK_SIZE = 64 * 1024
+MAX_WORKERS = 8
+RETRIES = 3
+BACKOFF = 0.5
+TIMEOUT = 30
+
+META_SUFFIX = ".meta.json"
+PART_SUFFIX = ".part"
+
+RETRYABLE_ERRORS = (
+    urllib.error.URLError,
+    http.client.HTTPException,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+class DownloadStatus:  # pylint: disable=too-few-public-methods
+    downloaded = "downloaded"
+    resumed = "resumed"
+    cached = "cached"
+    not_modified = "not-modified"
+
 
+class DownloadResult(NamedTuple):
+    url: str
+    path: str
+    status: str
+    sha256: str
 
-def download_txt_to_import(output_directory: str):
+
+def table_urls(base_url: str = TABLES_URL) -> list[str]:
+    base_url = base_url if base_url.endswith("/") else f"{base_url}/"
+    return [f"{base_url}{name}.txt" for name in ClassName()]
+
+
+def download_txt_to_import(
+    output_directory: str,
+    base_url: str = TABLES_URL,
+    expected_hashes: dict[str, str] | None = None,
+    cache: DownloadCache | None = None,
+) -> list[DownloadResult]:
     """
     Downloads RAW text files from GitHub repository
     :return:
     """
+    return download_files(
+        table_urls(base_url), output_directory, expected_hashes, cache=cache
+    )
+
+
+def stream_lines(source: str, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Yields lines of a remote text file as its bytes arrive,
+    decoding them incrementally without keeping the whole file.
+    :param source: URL of the file
+    :param encoding: text encoding of the file
+    :return: lines without line breaks
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tail = ""
+    with urllib.request.urlopen(source, timeout=TIMEOUT) as response:
+        while chunk := response.read(CHUNK_SIZE):
+            lines = (tail + decoder.decode(chunk)).split("\n")
+            tail = lines.pop()
+            yield from lines
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
 
+
+def download_files(
+    sources: Iterable[str],
+    output_directory: str,
+    expected_hashes: dict[str, str] | None = None,
+    max_workers: int = MAX_WORKERS,
+    cache: DownloadCache | None = None,
+) -> list[DownloadResult]:
+    """
+    Downloads several files concurrently into one directory.
+    :param sources: URLs of the files
+    :param output_directory: directory to save the files to
+    :param expected_hashes: optional mapping of URL to its expected SHA-256
+    :param max_workers: number of parallel downloads
+    :param cache: optional DownloadCache consulted before the network
+    :return: results in the order of the sources
+    """
+    Path(output_directory).mkdir(parents=True, exist_ok=True)
+    expected_hashes = expected_hashes or {}
+    sources = list(sources)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                download_file,
+                source,
+                output_directory,
+                expected_hashes.get(source),
+                cache=cache,
+            )
+            for source in sources
+        ]
+        return [future.result() for future in futures]
+
+
+def download_file(
+    source: str,
+    output_directory: str,
+    expected_sha256: str | None = None,
+    retries: int = RETRIES,
+    cache: DownloadCache | None = None,
+) -> DownloadResult:
+    """
+    Downloads a file, skipping it if the server reports it unchanged
+    and resuming a previously interrupted transfer where possible.
+    :param source: URL of the file
+    :param output_directory: directory to save the file to
+    :param expected_sha256: optional hash the downloaded content must match
+    :param retries: number of attempts for transient network errors
+    :param cache: optional DownloadCache consulted before the network
+    :return: DownloadResult
+    :raises ValueError: if the content does not match expected_sha256
+    """
     Path(output_directory).mkdir(parents=True, exist_ok=True)
-    files = [
-        f"https://raw.githubusercontent.com/torrua/LOD/master/tables/{name}.txt"
-        for name in ClassName()
-    ]
+    path = os.path.join(output_directory, os.path.basename(source))
+
+    for attempt in range(1, retries + 1):
+        try:
+            return _download(source, path, expected_sha256, cache)
+        except urllib.error.HTTPError as err:
+            if err.code < 500 or attempt == retries:
+                raise
+            _wait_retry(source, err, attempt, retries)
+        except RETRYABLE_ERRORS as err:
+            if attempt == retries:
+                raise
+            _wait_retry(source, err, attempt, retries)
+
+    raise ValueError(f"Invalid number of retries: {retries}")
+
+
+def _wait_retry(source: str, err: Exception, attempt: int, retries: int):
+    log.warning(
+        "Download of %s failed (%s), attempt %s of %s", source, err, attempt, retries
+    )
+    time.sleep(BACKOFF * 2 ** (attempt - 1))
+
+
+def _download(
+    source: str,
+    path: str,
+    expected_sha256: str | None,
+    cache: DownloadCache | None = None,
+    conditional: bool = True,
+) -> DownloadResult:
+    part_path = f"{path}{PART_SUFFIX}"
+    entry = cache.lookup(source) if cache is not None and conditional else None
+    if entry and cache.is_fresh(entry):
+        return _from_cache(source, path, expected_sha256, cache, entry)
 
-    for file in files:
-        download_file(file, output_directory)
+    if entry:
+        meta = entry._asdict()
+    else:
+        meta = read_meta(path) if conditional and os.path.exists(path) else {}
+    request = urllib.request.Request(source, headers=_request_headers(meta, part_path))
+    try:
+        response = urllib.request.urlopen(request, timeout=TIMEOUT)
+    except urllib.error.HTTPError as err:
+        if err.code == 304 and entry:
+            entry = cache.touch(entry, revalidated=True)
+            return _from_cache(source, path, expected_sha256, cache, entry)
+        if err.code == 304:
+            return _not_modified(source, path, meta, expected_sha256)
+        if err.code == 416:
+            remove_files(part_path, f"{part_path}{META_SUFFIX}")
+            return _download(source, path, expected_sha256, cache, conditional)
+        raise
 
+    with response:
+        resumed, validators, sha256 = _stream_to(response, source, part_path)
+    _verify(source, part_path, sha256, expected_sha256)
 
-def download_file(source, output_directory: str):
-    filename = os.path.basename(source)
-    urllib.request.urlretrieve(source, f"{output_directory}{filename}")
+    os.replace(part_path, path)
+    write_meta(path, {**validators, "sha256": sha256})
+    remove_files(f"{part_path}{META_SUFFIX}")
+    if cache is not None:
+        cache.store(source, path, sha256, validators)
 
+    status = DownloadStatus.resumed if resumed else DownloadStatus.downloaded
+    log.info("%s %s", status.capitalize(), source)
+    return DownloadResult(source, path, status, sha256)
 
-def download_mdb_filled(output_directory: str):
+
+def _request_headers(meta: dict, part_path: str) -> dict[str, str]:
+    """
+    Returns:
+        dict[str, str]: Conditional headers for the validators of the local
+            copy, and a range request continuing the partial download, if any.
+    """
+    headers = conditional_headers(meta)
+    part_meta = read_meta(part_path) if os.path.exists(part_path) else {}
+    offset = os.path.getsize(part_path) if part_meta else 0
+    validator = part_meta.get("etag") or part_meta.get("last_modified")
+    if offset and validator:
+        headers.update({"Range": f"bytes={offset}-", "If-Range": validator})
+    return headers
+
+
+def _stream_to(response, source: str, part_path: str) -> tuple[bool, dict, str]:
+    """
+    Writes the response body to the partial file, appending to it when
+    the server resumes the download, and records its validators.
+    Returns:
+        tuple[bool, dict, str]: Whether the download was resumed, the
+            validators of the response and the SHA-256 of the whole file.
+    """
+    resumed = response.status == 206
+    validators = {
+        "url": source,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    write_meta(part_path, validators)
+
+    hasher = file_hash(part_path) if resumed else hashlib.sha256()
+    with open(part_path, "ab" if resumed else "wb") as file:
+        while chunk := response.read(CHUNK_SIZE):
+            file.write(chunk)
+            hasher.update(chunk)
+    return resumed, validators, hasher.hexdigest()
+
+
+def _verify(source: str, part_path: str, sha256: str, expected_sha256: str | None):
+    """
+    Removes the partial file and raises if its hash is not the expected one.
+    Raises:
+        ValueError: On a checksum mismatch.
+    """
+    if expected_sha256 and sha256 != expected_sha256:
+        remove_files(part_path, f"{part_path}{META_SUFFIX}")
+        raise ValueError(
+            f"Checksum mismatch for {source}: expected {expected_sha256}, got {sha256}"
+        )
+
+
+def _not_modified(
+    source: str, path: str, meta: dict, expected_sha256: str | None
+) -> DownloadResult:
+    sha256 = meta.get("sha256") or file_hash(path).hexdigest()
+    if expected_sha256 and sha256 != expected_sha256:
+        log.warning("Local copy of %s does not match expected hash", source)
+        return _download(source, path, expected_sha256, conditional=False)
+
+    log.info("Not modified %s", source)
+    return DownloadResult(source, path, DownloadStatus.not_modified, sha256)
+
+
+def _from_cache(
+    source: str,
+    path: str,
+    expected_sha256: str | None,
+    cache: DownloadCache,
+    entry: CacheEntry,
+) -> DownloadResult:
+    if expected_sha256 and entry.sha256 != expected_sha256:
+        log.warning("Cached copy of %s does not match expected hash", source)
+        return _download(source, path, expected_sha256, cache, conditional=False)
+
+    cache.materialize(cache.touch(entry), path)
+    write_meta(path, {**entry._asdict(), "url": source})
+    log.info("Cached %s", source)
+    return DownloadResult(source, path, DownloadStatus.cached, entry.sha256)
+
+
+def conditional_headers(meta: dict) -> dict[str, str]:
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def file_hash(path: str):
+    hasher = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher
+
+
+def read_meta(path: str) -> dict:
+    try:
+        with open(f"{path}{META_SUFFIX}", "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_meta(path: str, meta: dict):
+    with open(f"{path}{META_SUFFIX}", "w", encoding="utf-8") as file:
+        json.dump(meta, file)
+
+
+def remove_files(*paths: str):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def download_mdb_filled(
+    output_directory: str, cache: DownloadCache | None = None
+) -> DownloadResult:
     """
     Downloads filled mdb file from GitHub repository
     :return:
     """
-    download_file(
-        "https://github.com/torrua/LOD/raw/master/source/LoglanDictionary.mdb",
-        output_directory,
-    )
+    return download_file(MDB_FILLED_URL, output_directory, cache=cache)
 
 
-def download_mdb_empty(output_directory: str):
+def download_mdb_empty(
+    output_directory: str, cache: DownloadCache | None = None
+) -> DownloadResult:
     """
     Downloads empty mdb file (template) from GitHub repository
     :return:
     """
-    download_file(
-        "https://github.com/torrua/LOD/raw/master/source/LoglanDictionaryTemplate.mdb",
-        output_directory,
-    )
+    return download_file(MDB_EMPTY_URL, output_directory, cache=cache)
@@ -0,0 +1,196 @@
+"""
+This module collects performance metrics of a conversion: per-stage timings,
+row counts, rows per second, database round trips and peak memory.
+
+The collector is disabled by default and costs next to nothing until
+`metrics.enable()` is called, e.g. by the `--profile` option of convert.py.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_current_stage: ContextVar[StageRecord | None] = ContextVar(
+    "current_stage", default=None
+)
+
+
+class StageRecord:  # pylint: disable=too-many-instance-attributes
+    """Metrics of a single execution of a stage."""
+
+    def __init__(self, name: str, parent: StageRecord | None):
+        self.name = name
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent else 0
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        self.rows = 0
+        self.round_trips = 0
+        self.peak_memory = 0
+
+    def as_dict(self) -> dict:
+        """
+        Returns:
+            dict: The metrics of the stage as reported, with its throughput.
+        """
+        return {
+            "name": self.name,
+            "parent": self.parent.name if self.parent else None,
+            "depth": self.depth,
+            "duration": round(self.duration, 6),
+            "rows": self.rows,
+            "rows_per_second": (
+                round(self.rows / self.duration, 1) if self.duration else None
+            ),
+            "round_trips": self.round_trips,
+            "peak_memory": self.peak_memory,
+        }
+
+
+class Instrumentation:
+    """
+    Collector of stage metrics.
+    Methods:
+        enable: Starts collecting metrics, optionally tracing memory.
+        stage: Context manager measuring a stage.
+        add_rows: Adds processed rows to the current stage.
+        instrument_engine: Counts database round trips of an engine.
+        report: Returns collected metrics as a dict.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.track_memory = False
+        self.records: list[StageRecord] = []
+        self._open: list[StageRecord] = []
+        self._lock = threading.Lock()
+        self._started = 0.0
+
+    def enable(self, track_memory: bool = False):
+        """
+        Clears collected metrics and starts collecting new ones.
+        Parameters:
+            track_memory (bool): Trace peak memory with tracemalloc,
+                which slows down allocations.
+        """
+        self.reset()
+        self.enabled = True
+        self.track_memory = track_memory
+        self._started = time.perf_counter()
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        """
+        Stops collecting metrics and tracing memory. Collected ones are kept.
+        """
+        self.enabled = False
+        if self.track_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def reset(self):
+        """
+        Clears the collected stages.
+        """
+        with self._lock:
+            self.records = []
+            self._open = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageRecord | None]:
+        """
+        Measures the enclosed block as a stage nested into the current one.
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        record = StageRecord(name, _current_stage.get())
+        with self._lock:
+            self._flush_peak()
+            self.records.append(record)
+            self._open.append(record)
+        token = _current_stage.set(record)
+        try:
+            yield record
+        finally:
+            _current_stage.reset(token)
+            record.duration = time.perf_counter() - record.started
+            with self._lock:
+                self._flush_peak()
+                self._open.remove(record)
+
+    def add_rows(self, count: int):
+        """
+        Adds processed rows to the current stage of the context.
+        Parameters:
+            count (int): Number of rows.
+        """
+        record = _current_stage.get()
+        if self.enabled and record is not None:
+            with self._lock:
+                record.rows += count
+
+    def count_round_trip(self, *_):
+        """
+        Counts a statement in the current stage and in every enclosing one.
+        Receives the arguments of a before_cursor_execute event.
+        """
+        record = _current_stage.get()
+        while self.enabled and record is not None:
+            record.round_trips += 1
+            record = record.parent
+
+    def instrument_engine(self, engine):
+        """
+        Registers a listener counting statements sent by the engine.
+        """
+        # imported here so the CLI does not load SQLAlchemy before a backend does
+        from sqlalchemy import event  # pylint: disable=import-outside-toplevel
+
+        event.listen(engine, "before_cursor_execute", self.count_round_trip)
+
+    def _flush_peak(self):
+        """Attributes the peak memory since the last flush to all open stages."""
+        if not (self.track_memory and tracemalloc.is_tracing()):
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        for record in self._open:
+            record.peak_memory = max(record.peak_memory, peak)
+        tracemalloc.reset_peak()
+
+    def report(self) -> dict:
+        """
+        Returns:
+            dict: The total duration, peak memory and round trips,
+                with the metrics of every stage in the order they started.
+        """
+        with self._lock:
+            self._flush_peak()
+            return {
+                "duration": round(time.perf_counter() - self._started, 6),
+                "peak_memory": max((r.peak_memory for r in self.records), default=0),
+                "round_trips": sum(r.round_trips for r in self.records if not r.depth),
+                "stages": [record.as_dict() for record in self.records],
+            }
+
+    def write_report(self, path: str = "-"):
+        """
+        Writes the JSON report to the path, or to stdout for "-".
+        """
+        content = json.dumps(self.report(), indent=2)
+        if path == "-":
+            sys.stdout.write(f"{content}\n")
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+
+
+metrics = Instrumentation()
@@ -2,6 +2,9 @@
 from abc import ABC, abstractmethod
 
 from app.connector import DatabaseConnector
+from app.instrumentation import metrics
+from app.profiling import profiler
+from app.properties import ValidationMode
 from app.storage import Storage
 from logger import logging
 
@@ -35,16 +38,26 @@ class DatabaseInterface(ABC):
         """
 
     @staticmethod
-    def default_export(connector: DatabaseConnector, data_getter):
-        """Default way to export data from the database to a Storage object."""
+    def default_export(
+        connector: DatabaseConnector,
+        data_getter,
+        validation: str = ValidationMode.sampled,
+    ):
+        """
+        Default way to export data from the database to a Storage object.
+        The data_getter returns the rows of a model for a session.
+        The database schema guarantees the types of the exported rows,
+        so they are only sampled for validation by default.
+        """
         s = Storage()
-        with connector.session as session:
+        section = f"populate_storage_{connector.__class__.__name__}"
+        with connector.session as session, profiler.section(section):
             for container, class_ in zip(s.containers, connector.table_order.values()):
-                objects = session.query(class_).all()
-                log.info("Exporting %s", class_.__name__)
-
-                data = data_getter(objects)
-                container.extend(data)
+                with metrics.stage(f"export_{container.name}"):
+                    log.info("Exporting %s", class_.__name__)
+                    data = data_getter(session, class_)
+                    container.ingest(data, validation)
+                    metrics.add_rows(len(container))
 
                 log.info("Exported %s %s items\n", len(container), class_.__name__)
         return s
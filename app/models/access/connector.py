@@ -6,6 +6,7 @@ from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.connector import DatabaseConnector
+from app.instrumentation import metrics
 from app.models.access.functions import db_compress_file, db_clear_content
 from app.models.access.model.author import AccessAuthor
 from app.models.access.model.definition import AccessDefinition
@@ -24,10 +25,17 @@ class AccessDatabaseConnector(DatabaseConnector):
         r"DRIVER={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={};ExtendedAnsiSQL=1;"
     )
 
-    def __init__(self, path: str, importing: bool = False):
+    ENGINE_OPTIONS = {
+        "pool_pre_ping": True,
+        "query_cache_size": 1200,
+    }
+
+    def __init__(self, path: str, importing: bool = False, **engine_options):
         self.is_path(path)
         self.path = path
-        self.engine = self.get_engine(self.path)
+        self.engine = self.get_engine(self.path, **engine_options)
+        self.session_factory = sessionmaker(bind=self.engine)
+        metrics.instrument_engine(self.engine)
 
         if importing:
             log.info("Clearing database")
@@ -37,12 +45,12 @@ class AccessDatabaseConnector(DatabaseConnector):
             db_compress_file(self)
 
     @classmethod
-    def get_engine(cls, path: str) -> Engine:
+    def get_engine(cls, path: str, **engine_options) -> Engine:
         connection_string = cls.DRIVER.format(path)
         connection_url = (
             f"access+pyodbc:///?odbc_connect={quote_plus(connection_string)}"
         )
-        return create_engine(connection_url)
+        return create_engine(connection_url, **{**cls.ENGINE_OPTIONS, **engine_options})
 
     @property
     def table_order(self):
@@ -59,7 +67,7 @@ class AccessDatabaseConnector(DatabaseConnector):
 
     @property
     def session(self) -> Session:
-        return sessionmaker(bind=self.engine)()
+        return self.session_factory()
 
     @staticmethod
     def is_path(path: str):
@@ -1,7 +1,8 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+import importlib
 import os
+from typing import Callable, Hashable, Iterable
 
-import win32com.client
 from sqlalchemy import MetaData
 
 from app.connector import DatabaseConnector
@@ -31,15 +32,30 @@ def db_compress_file(connector: DatabaseConnector):
     connector.engine.dispose()
 
     dst_db = connector.path.replace(".mdb", "_temp.mdb")
-    os_app = win32com.client.Dispatch("Access.Application")
+    # imported here so the module loads on systems without pywin32
+    win32com_client = importlib.import_module("win32com.client")
+    os_app = win32com_client.Dispatch("Access.Application")
     os_app.compactRepair(connector.path, dst_db)
     os_app.Application.Quit()
     os.remove(connector.path)
     os.rename(dst_db, connector.path)
 
 
-def get_unique_values(objects):
-    unique_items = {}
-    for item in objects:
-        unique_items[str(item)] = item
-    return list(unique_items.values())
+def unique_rows(
+    rows: Iterable[list], key: Callable[[list], Hashable]
+) -> tuple[list[list], list[Hashable]]:
+    """
+    Drops rows with repeated keys before any model is built.
+    A repeated key keeps the position of its first row and the value of its last.
+    :param rows: Raw rows of a table
+    :param key: Function returning the key of a row
+    :return: Unique rows and the keys of the dropped duplicates
+    """
+    unique_items: dict[Hashable, list] = {}
+    duplicates = []
+    for row in rows:
+        row_key = key(row)
+        if row_key in unique_items:
+            duplicates.append(row_key)
+        unique_items[row_key] = row
+    return list(unique_items.values()), duplicates
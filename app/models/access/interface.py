@@ -1,7 +1,8 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from app.instrumentation import metrics
 from app.interface import DatabaseInterface
 from app.models.access.connector import AccessDatabaseConnector
-from app.models.access.functions import get_unique_values
+from app.models.access.functions import unique_rows
 from app.storage import Storage
 from logger import logging, logging_time
 
@@ -18,8 +19,8 @@ class AccessInterface(DatabaseInterface):
         return self.default_export(self.connector, self.get_data_from_objects)
 
     @staticmethod
-    def get_data_from_objects(objects):
-        return [obj.export_data() for obj in objects]
+    def get_data_from_objects(session, class_):
+        return [obj.export_data() for obj in session.query(class_).all()]
 
     @logging_time
     def import_data(self, data: Storage):
@@ -33,19 +34,27 @@ class AccessInterface(DatabaseInterface):
                 container = data.container_by_name(model_name)
                 model = self.connector.table_order.get(model_name)
                 log.info("Start to process %s objects", model.__name__)
-                objects = [model(**model.import_data(item)) for item in container]
                 log.info(
-                    "Total number of %s objects - %s", model.__name__, len(objects)
+                    "Total number of %s objects - %s", model.__name__, len(container)
                 )
-                objects = get_unique_values(objects)
+                rows, duplicates = unique_rows(container, model.row_key)
+                if duplicates:
+                    log.warning(
+                        "Dropped %s duplicate %s rows, keys: %s",
+                        len(duplicates),
+                        model.__name__,
+                        duplicates[:10],
+                    )
                 log.info(
                     "Total number of unique %s objects - %s",
                     model.__name__,
-                    len(objects),
+                    len(rows),
                 )
+                objects = [model(**model.import_data(item)) for item in rows]
                 log.info("Add %s objects to Database", model.__name__)
                 session.bulk_save_objects(objects)
                 log.debug("Commit Database changes")
                 session.commit()
+                metrics.add_rows(len(objects))
                 log.info("Finish to process %s objects\n", model.__name__)
         log.info("Finish to fill tables with dictionary data\n")
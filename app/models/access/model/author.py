@@ -12,6 +12,7 @@ class AccessAuthor(BaseModel):
 
     __tablename__ = "Author"
     sort_name = "Author"
+    key_columns = (0,)
 
     id = Column(Integer, primary_key=True)
     abbreviation = Column(String(64), unique=True, nullable=False)
@@ -9,6 +9,9 @@ class BaseModel(DeclarativeBase):
 
     __abstract__ = True
 
+    # indexes of the exported columns identifying a row, the whole row if empty
+    key_columns: tuple[int, ...] = ()
+
     def __repr__(self):
         """
         Special method that returns a string representation of the object.
@@ -43,6 +46,16 @@ class BaseModel(DeclarativeBase):
     def export_data(self):
         pass
 
+    @classmethod
+    def row_key(cls, item: list) -> tuple:
+        """
+        Returns the natural key of a raw row, used to drop duplicates.
+        Rows without a natural key compare by all values, empty ones as None.
+        """
+        if cls.key_columns:
+            return tuple(item[index] for index in cls.key_columns)
+        return tuple(cls.von(value) for value in item)
+
     @staticmethod
     def value_or_none(value):
         return value if value else None
@@ -11,6 +11,7 @@ class AccessEvent(BaseModel):
 
     __tablename__ = "LexEvent"
     sort_name = "Event"
+    key_columns = (0,)
 
     id = Column("EVT", Integer, primary_key=True)
     name = Column("Event", String(64), nullable=False)
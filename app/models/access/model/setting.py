@@ -1,8 +1,7 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
-from datetime import datetime
-
 from sqlalchemy import Column, DateTime, Integer, String
 
+from app.dates import parse_setting_date
 from app.models.access.model.base import BaseModel
 from app.models.common import CommonSetting
 
@@ -14,6 +13,7 @@ class AccessSetting(BaseModel):
 
     __tablename__ = "Settings"
     sort_name = "Settings"
+    key_columns = (0,)
 
     date = Column("DateModified", DateTime, primary_key=True)
     db_version = Column("DBVersion", Integer, nullable=False)
@@ -31,7 +31,7 @@ class AccessSetting(BaseModel):
     @staticmethod
     def import_data(item: list[str]):
         return {
-            "date": datetime.strptime(item[0], CommonSetting.DATE_FORMAT),
+            "date": parse_setting_date(item[0]),
             "db_version": int(item[1]),
             "last_word_id": int(item[2]),
             "db_release": item[3],
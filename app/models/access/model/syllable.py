@@ -11,6 +11,7 @@ class AccessSyllable(BaseModel):
 
     __tablename__ = "Syllable"
     sort_name = "Syllable"
+    key_columns = (0,)
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column("characters", String(8), primary_key=True)
@@ -11,6 +11,7 @@ class AccessWord(BaseModel):
 
     __tablename__ = "Words"
     sort_name = "Word"
+    key_columns = (0,)
 
     word_id = Column("WID", Integer, nullable=False, primary_key=True)
     type_ = Column("Type", String(16), nullable=False)
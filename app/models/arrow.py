@@ -0,0 +1,55 @@
+"""
+Conversions between TableContainer rows and Arrow tables,
+shared by the columnar backends (Parquet, DuckDB). Requires pyarrow.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import pyarrow
+
+from app.properties import TableProperties
+from app.table_container import TableContainer
+from app.table_container_functions import prepared_types
+
+ARROW_TYPES = {
+    bool: pyarrow.bool_(),
+    int: pyarrow.int64(),
+    str: pyarrow.string(),
+}
+
+
+def table_schema(table_properties: TableProperties) -> pyarrow.Schema:
+    """
+    Builds the Arrow schema of a table from its pattern and column names.
+    Columns whose types include None are nullable.
+    """
+    fields = []
+    for name, types in zip(table_properties.columns, table_properties.pattern):
+        types = prepared_types(types)
+        value_type = next(t for t in types if t is not type(None))
+        fields.append(
+            pyarrow.field(name, ARROW_TYPES[value_type], nullable=type(None) in types)
+        )
+    return pyarrow.schema(fields)
+
+
+def container_to_arrow(
+    container: TableContainer, table_properties: TableProperties
+) -> pyarrow.Table:
+    """Transposes the rows of a container into a typed Arrow table."""
+    schema = table_schema(table_properties)
+    columns = list(zip(*container)) or [()] * len(schema)
+    return pyarrow.Table.from_arrays(
+        [
+            pyarrow.array(column, type=field.type)
+            for column, field in zip(columns, schema)
+        ],
+        schema=schema,
+    )
+
+
+def arrow_rows(table: pyarrow.Table) -> Iterator[tuple[Any, ...]]:
+    """Yields the rows of an Arrow table as tuples of python values."""
+    return zip(*(column.to_pylist() for column in table.columns))
@@ -0,0 +1,110 @@
+"""
+Validation checks of dictionary data as SQL queries against DuckDB tables.
+
+Usage:
+    python -m app.models.duckdb.checks dictionary.duckdb [check_name ...]
+
+Every check selects the offending rows, so an empty result means the data
+passes it. They follow the checks of app.models.postgres.checks and add
+referential checks that the flat tables do not enforce by themselves.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import duckdb
+from loglan_core import Definition
+
+from logger import log
+
+APPROVED_CASE_TAGS = ", ".join(f"'{tag}'" for tag in Definition.APPROVED_CASE_TAGS)
+
+CHECKS = {
+    "words_with_unknown_type": """
+        SELECT w.old_id, w.type FROM "Words" w
+        ANTI JOIN "Type" t ON t.type_ = w.type
+    """,
+    "words_with_unknown_author": """
+        SELECT a.old_id, a.abbreviation
+        FROM (
+            SELECT old_id, unnest(string_split(split_part(source, ' ', 1), '/'))
+                AS abbreviation
+            FROM "Words"
+        ) a
+        ANTI JOIN "Author" au ON au.abbreviation = a.abbreviation
+    """,
+    "spells_without_word": """
+        SELECT s.old_id, s.name FROM "WordSpell" s
+        ANTI JOIN "Words" w ON w.old_id = s.old_id
+    """,
+    "spells_with_unknown_event": """
+        SELECT s.old_id, s.name, s.event_start_id, s.event_end_id
+        FROM "WordSpell" s
+        WHERE s.event_start_id NOT IN (SELECT event_id FROM "LexEvent")
+           OR (s.event_end_id <> 9999
+               AND s.event_end_id NOT IN (SELECT event_id FROM "LexEvent"))
+    """,
+    "definitions_without_word": """
+        SELECT d.word_old_id, d.position FROM "WordDefinition" d
+        ANTI JOIN "Words" w ON w.old_id = d.word_old_id
+    """,
+    "duplicate_spells": """
+        SELECT name, count(*) AS count FROM "WordSpell"
+        GROUP BY name HAVING count(*) > 1
+    """,
+    "primitives_without_sources": """
+        SELECT old_id, origin FROM "Words"
+        WHERE type = 'C-Prim' AND coalesce(origin, '') NOT LIKE '% | %'
+    """,
+    "unintelligible_ccc": """
+        SELECT DISTINCT s.name, y.name AS ccc FROM "WordSpell" s
+        JOIN "Syllable" y ON y.type = 'UnintelligibleCCC'
+            AND contains(s.name, y.name)
+    """,
+    "little_words_with_wrong_formula": """
+        SELECT s.old_id, s.name FROM "WordSpell" s
+        JOIN "Words" w ON w.old_id = s.old_id
+        WHERE w.type = 'LW' AND NOT regexp_full_match(
+            lower(s.name), '[bcdfghjklmnprstvz]?[aoeiu][aoeiu]?'
+        )
+    """,
+    "case_tags_mismatch": f"""
+        SELECT word_old_id, position, case_tags FROM "WordDefinition"
+        WHERE coalesce(case_tags, '') <> ''
+          AND regexp_extract_all(case_tags, '[{''.join(Definition.APPROVED_CASE_TAGS)}]')
+              <> list_filter(
+                  regexp_extract_all(body, '\\w+'),
+                  tag -> list_contains([{APPROVED_CASE_TAGS}], tag)
+              )
+    """,
+}
+
+
+def run_checks(
+    connection: duckdb.DuckDBPyConnection, names: list[str]
+) -> dict[str, list[tuple]]:
+    """
+    Runs the named checks.
+    Returns:
+        dict[str, list[tuple]]: Offending rows by check name.
+    Raises:
+        KeyError: If a check name is unknown.
+    """
+    results = {}
+    for name in names:
+        rows = connection.execute(CHECKS[name]).fetchall()
+        if rows:
+            log.warning("Check %s failed for %s rows", name, len(rows))
+        results[name] = rows
+    return results
+
+
+if __name__ == "__main__":
+    with duckdb.connect(sys.argv[1], read_only=True) as db:
+        for check_name, offending in run_checks(
+            db, sys.argv[2:] or list(CHECKS)
+        ).items():
+            print(f"{check_name}: {'OK' if not offending else len(offending)}")
+            for row in offending:
+                print(f"\t{row}")
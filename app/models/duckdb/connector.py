@@ -0,0 +1,50 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+import os
+
+import duckdb
+from sqlalchemy.orm import Session
+
+from app.connector import DatabaseConnector
+
+
+class DuckDBConnector(DatabaseConnector):
+    """
+    Connector to a DuckDB database file holding one table per Storage
+    container, with the columns of DEFAULT_TABLE_PROPERTIES_COLLECTION.
+    DuckDB is used through its own connections instead of SQLAlchemy.
+    """
+
+    def __init__(self, path: str, importing: bool = False):
+        self.is_path(path)
+        if not importing and path != ":memory:" and not os.path.exists(path):
+            raise FileNotFoundError(f"DuckDB database not found:\n\t{path}")
+        self.path = path
+        self.importing = importing
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(path="{self.path}")'
+
+    @property
+    def session(self) -> Session:
+        raise NotImplementedError("There is no session for DuckDBConnector.")
+
+    @property
+    def table_order(self) -> dict:
+        return {}
+
+    @staticmethod
+    def is_path(path: str) -> bool:
+        if not path:
+            raise ValueError("No DuckDB path provided. Please check your environment.")
+
+        if path == ":memory:":
+            return True
+
+        if not (path.endswith(".duckdb") or path.endswith(".db")):
+            raise ValueError(
+                f"Invalid DuckDB path. Must end with .duckdb or .db:\n\t{path}"
+            )
+        return True
+
+    def connect(self, read_only: bool = False) -> duckdb.DuckDBPyConnection:
+        return duckdb.connect(self.path, read_only=read_only)
@@ -0,0 +1,75 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from __future__ import annotations
+
+import duckdb
+
+from app.instrumentation import metrics
+from app.interface import DatabaseInterface
+from app.models.arrow import arrow_rows, container_to_arrow
+from app.models.duckdb.checks import CHECKS, run_checks
+from app.models.duckdb.connector import DuckDBConnector
+from app.properties import DEFAULT_TABLE_PROPERTIES_COLLECTION, ValidationMode
+from app.storage import Storage
+from logger import logging, logging_time
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
+
+
+class DuckDBInterface(DatabaseInterface):
+    """
+    Loads Storage tables into DuckDB through Arrow and exports them
+    with vectorised scans.
+    """
+
+    def __init__(self, connector: DuckDBConnector):
+        self.connector = connector
+        self.properties = {
+            properties.name: properties
+            for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION
+        }
+
+    @logging_time
+    def export_data(self) -> Storage:
+        s = Storage()
+        with self.connector.connect(read_only=True) as connection:
+            for name in s.names:
+                with metrics.stage(f"export_{name}"):
+                    table = self.read_table(connection, name)
+                    s.ingest(name, arrow_rows(table), ValidationMode.sampled)
+                    metrics.add_rows(table.num_rows)
+                log.info("Exported %s %s items\n", table.num_rows, name)
+        return s
+
+    def read_table(self, connection: duckdb.DuckDBPyConnection, name: str):
+        columns = ", ".join(f'"{column}"' for column in self.properties[name].columns)
+        return connection.execute(f'SELECT {columns} FROM "{name}"').to_arrow_table()
+
+    @logging_time
+    def import_data(self, data: Storage):
+        """
+        Replaces every table with the content of its container.
+        Each table is created from an Arrow table in a single statement.
+        """
+        with self.connector.connect() as connection:
+            for container in data.containers:
+                staging = container_to_arrow(container, self.properties[container.name])
+                connection.register("staging", staging)
+                connection.execute(
+                    f'CREATE OR REPLACE TABLE "{container.name}" '
+                    "AS SELECT * FROM staging"
+                )
+                connection.unregister("staging")
+                metrics.add_rows(staging.num_rows)
+                log.info("Imported %s %s items\n", staging.num_rows, container.name)
+
+    def check(self, names: list[str] | None = None) -> dict[str, list[tuple]]:
+        """
+        Runs validation checks as SQL against the database.
+        Parameters:
+            names (list[str] | None): Checks to run, all of CHECKS by default.
+        Returns:
+            dict[str, list[tuple]]: Offending rows by check name.
+        """
+        with self.connector.connect(read_only=True) as connection:
+            return run_checks(connection, names or list(CHECKS))
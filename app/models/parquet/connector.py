@@ -0,0 +1,18 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+import os
+
+from app.models.text.connector import TextConnector
+
+
+class ParquetConnector(TextConnector):
+    """
+    Connector to a directory with one <table name>.parquet file per table.
+    The directory is created when importing.
+    """
+
+    EXTENSION = "parquet"
+
+    def __init__(self, path: str, importing: bool = False):
+        if importing and path:
+            os.makedirs(path, exist_ok=True)
+        super().__init__(path, importing)
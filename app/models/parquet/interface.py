@@ -0,0 +1,63 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from __future__ import annotations
+
+import os
+
+from pyarrow import parquet
+
+from app.instrumentation import metrics
+from app.interface import DatabaseInterface
+from app.models.arrow import arrow_rows, container_to_arrow
+from app.models.parquet.connector import ParquetConnector
+from app.properties import DEFAULT_TABLE_PROPERTIES_COLLECTION, ValidationMode
+from app.storage import Storage
+from logger import logging, logging_time
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
+
+
+class ParquetInterface(DatabaseInterface):
+    def __init__(self, connector: ParquetConnector, compression: str = "zstd"):
+        self.connector = connector
+        self.compression = compression
+        self.properties = {
+            properties.name: properties
+            for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION
+        }
+
+    def read_table(self, name: str, columns: list[str] | None = None):
+        """
+        Reads a table as a pyarrow.Table, only with the given columns if any.
+        Parameters:
+            name (str): The table name, e.g. "Words".
+            columns (list[str] | None): Columns to read, all by default.
+        Returns:
+            pyarrow.Table: The table with columns in the requested order.
+        """
+        columns = columns or list(self.properties[name].columns)
+        return parquet.read_table(self.connector.path_by_name(name), columns=columns)
+
+    @logging_time
+    def export_data(self) -> Storage:
+        """
+        Reads all tables into a Storage. The Parquet schema guarantees
+        the types, so rows are only sampled for validation.
+        """
+        s = Storage()
+        for name in s.names:
+            with metrics.stage(f"export_{name}"):
+                table = self.read_table(name)
+                s.ingest(name, arrow_rows(table), ValidationMode.sampled)
+                metrics.add_rows(table.num_rows)
+            log.info("Exported %s %s items\n", table.num_rows, name)
+        return s
+
+    @logging_time
+    def import_data(self, data: Storage):
+        for container in data.containers:
+            table = container_to_arrow(container, self.properties[container.name])
+            path = os.path.join(self.connector.path, f"{container.name}.parquet")
+            parquet.write_table(table, path, compression=self.compression)
+            metrics.add_rows(table.num_rows)
+            log.info("Imported %s %s items\n", table.num_rows, container.name)
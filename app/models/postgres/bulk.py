@@ -0,0 +1,166 @@
+"""
+This module implements the bulk load mode of Postgres imports.
+
+Tables are created UNLOGGED with their primary keys only, so the load writes
+neither WAL nor secondary index entries. Once the rows are in, indexes and
+unique constraints are built in parallel connections, foreign keys are added
+one by one (each locks both of its tables), and the tables are switched to
+LOGGED, referenced tables first, as a logged table cannot reference an
+unlogged one.
+
+Functions:
+    bulk_table: Returns an UNLOGGED, primary key only copy of a table.
+    create_bulk_tables: Creates the bulk copies of the tables.
+    build_deferred: Builds the deferred indexes and constraints, then logs tables.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence
+
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    ForeignKeyConstraint,
+    MetaData,
+    Table,
+    UniqueConstraint,
+    inspect,
+    text,
+)
+from sqlalchemy.schema import AddConstraint, CreateIndex, ExecutableDDLElement
+
+from logger import log
+
+BULK_WORKERS = 4
+
+
+def bulk_table(table: Table, metadata: MetaData) -> Table:
+    """
+    Parameters:
+        table (Table): A dictionary table.
+        metadata (MetaData): MetaData to define the copy in.
+    Returns:
+        Table: An UNLOGGED table of the same columns, without constraints
+            other than the primary key and NOT NULL.
+    """
+    columns = [
+        Column(
+            column.name,
+            column.type,
+            primary_key=column.primary_key,
+            nullable=column.nullable,
+            autoincrement=column.autoincrement,
+        )
+        for column in table.columns
+    ]
+    return Table(table.name, metadata, *columns, prefixes=["UNLOGGED"])
+
+
+def create_bulk_tables(
+    connection: Connection, tables: Sequence[Table], checkfirst: bool = False
+):
+    """
+    Creates UNLOGGED copies of the tables with only their primary keys.
+    Parameters:
+        connection (Connection): Connection in a transaction.
+        tables (Sequence[Table]): Tables to create.
+        checkfirst (bool): Keep tables that already exist.
+    """
+    metadata = MetaData()
+    for table in tables:
+        bulk_table(table, metadata)
+    metadata.create_all(bind=connection, checkfirst=checkfirst)
+
+
+def existing_constraints(
+    connection: Connection, tables: Sequence[Table], schema: str | None = None
+) -> set[tuple]:
+    """
+    Returns the unique and foreign key constraints already in the database,
+    as (table, columns) and (table, columns, referred table) tuples.
+    """
+    inspector = inspect(connection)
+    existing: set[tuple] = set()
+    for table in tables:
+        for unique in inspector.get_unique_constraints(table.name, schema=schema):
+            existing.add((table.name, tuple(unique["column_names"])))
+        for key in inspector.get_foreign_keys(table.name, schema=schema):
+            columns = tuple(key["constrained_columns"])
+            existing.add((table.name, columns, key["referred_table"]))
+    return existing
+
+
+def constraint_key(constraint: UniqueConstraint | ForeignKeyConstraint) -> tuple:
+    """
+    Returns:
+        tuple: The constraint as compared with existing_constraints.
+    """
+    columns = tuple(column.name for column in constraint.columns)
+    if isinstance(constraint, ForeignKeyConstraint):
+        return constraint.table.name, columns, constraint.referred_table.name
+    return constraint.table.name, columns
+
+
+def execute_ddl(engine: Engine, statement: ExecutableDDLElement):
+    """
+    Executes a statement in its own connection and transaction,
+    as the parallel workers of build_deferred do.
+    """
+    with engine.begin() as connection:
+        connection.execute(statement)
+
+
+def build_deferred(
+    engine: Engine,
+    tables: Sequence[Table],
+    schema: str | None = None,
+    workers: int = BULK_WORKERS,
+):
+    """
+    Builds the indexes and constraints left out by create_bulk_tables and
+    switches the tables to LOGGED. Constraints that already exist are skipped,
+    so an interrupted build can be run again.
+    Parameters:
+        engine (Engine): Engine of the import target.
+        tables (Sequence[Table]): Tables in dependency order, referenced first.
+        schema (str | None): Schema of the tables if not the default one.
+        workers (int): Connections building indexes and unique constraints.
+    """
+    with engine.connect() as connection:
+        existing = existing_constraints(connection, tables, schema)
+
+    constraints = [
+        constraint
+        for table in tables
+        for constraint in table.constraints
+        if isinstance(constraint, (UniqueConstraint, ForeignKeyConstraint))
+        and constraint_key(constraint) not in existing
+    ]
+    parallel = [
+        CreateIndex(index, if_not_exists=True)
+        for table in tables
+        for index in table.indexes
+    ] + [
+        AddConstraint(constraint)
+        for constraint in constraints
+        if isinstance(constraint, UniqueConstraint)
+    ]
+
+    log.info("Building %s indexes and unique constraints", len(parallel))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(execute_ddl, engine, ddl) for ddl in parallel]
+        for future in futures:
+            future.result()
+
+    foreign_keys = [c for c in constraints if isinstance(c, ForeignKeyConstraint)]
+    log.info("Adding %s foreign keys", len(foreign_keys))
+    for constraint in foreign_keys:
+        execute_ddl(engine, AddConstraint(constraint))
+
+    with engine.begin() as connection:
+        for table in tables:
+            name = f'"{schema}"."{table.name}"' if schema else f'"{table.name}"'
+            connection.execute(text(f"ALTER TABLE {name} SET LOGGED"))
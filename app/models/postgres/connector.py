@@ -1,7 +1,6 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
 
 import re
-from datetime import datetime
 
 from loglan_core import (
     Author,
@@ -14,12 +13,24 @@ from loglan_core import (
     Syllable,
 )
 from loglan_core.base import BaseModel
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, make_url, Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.connector import DatabaseConnector
-from app.models.common import CommonEvent, CommonSetting
+from app.dates import parse_event_date, parse_setting_date
+from app.instrumentation import metrics
+from app.models.postgres.bulk import build_deferred, create_bulk_tables
+from app.models.postgres.schema import (
+    analyze_tables,
+    check_schema_name,
+    drop_retired_or_keep,
+    drop_shadow,
+    prepare_shadow,
+    shadow_name,
+    swap_tables,
+)
 from app.properties import ClassName
+from logger import log
 
 
 class Event(BaseEvent):
@@ -28,9 +39,7 @@ class Event(BaseEvent):
         date_index = 2
         args = list(args)
         if args and isinstance(args[date_index], str):
-            args[date_index] = datetime.strptime(
-                args[date_index], CommonEvent.DATE_FORMAT
-            )
+            args[date_index] = parse_event_date(args[date_index])
         super().__init__(*args, **kwargs)
 
 
@@ -40,24 +49,82 @@ class Setting(BaseSetting):
         date_index = 0
         args = list(args)
         if args and isinstance(args[date_index], str):
-            args[date_index] = datetime.strptime(
-                args[date_index], CommonSetting.DATE_FORMAT
-            )
+            args[date_index] = parse_setting_date(args[date_index])
         super().__init__(*args, **kwargs)
 
 
 class PostgresDatabaseConnector(DatabaseConnector):
-
-    def __init__(self, path: str, importing: bool = False):
+    ENGINE_OPTIONS = {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "query_cache_size": 1200,
+        "insertmanyvalues_page_size": 1000,
+    }
+    PSYCOPG2_OPTIONS = {
+        "executemany_mode": "values_plus_batch",
+        "executemany_batch_page_size": 500,
+    }
+    SCHEMA = "public"
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: str,
+        importing: bool = False,
+        *,
+        resume: bool = False,
+        shadow: bool = False,
+        bulk: bool = False,
+        **engine_options,
+    ):
+        """
+        Parameters:
+            path (str): Database path or URI.
+            importing (bool): Prepare the tables for an import.
+            resume (bool): Keep existing tables and data to resume
+                an interrupted import instead of recreating them.
+            shadow (bool): Import into a shadow schema, published in place
+                of SCHEMA by finish_import, instead of recreating live tables.
+            bulk (bool): Create UNLOGGED tables with primary keys only;
+                finish_import builds the rest and switches them to LOGGED.
+                Cannot resume, as UNLOGGED tables are emptied after a crash.
+        Raises:
+            ValueError: If both bulk and resume are requested.
+        """
+        if bulk and resume:
+            raise ValueError("A bulk import cannot resume.")
         if self.is_path(path):
             self.path = path
-            self.engine: Engine = self.get_engine(self.path)
-            if importing:
+            self.resume = resume
+            self.bulk = bulk
+            self.shadow_schema = shadow_name(self.SCHEMA) if shadow else None
+            self.engine: Engine = self.get_engine(self.path, **engine_options)
+            metrics.instrument_engine(self.engine)
+            if self.shadow_schema:
+                # unqualified loglan_core tables are created and filled in the shadow
+                self.engine = self.engine.execution_options(
+                    schema_translate_map={None: self.shadow_schema}
+                )
+            self.session_factory = sessionmaker(bind=self.engine, future=True)
+            if importing and self.shadow_schema:
+                self.create_shadow_tables()
+            elif importing and resume:
+                self.create_tables()
+            elif importing:
                 self.recreate_tables()
 
     @classmethod
-    def get_engine(cls, path: str) -> Engine:
-        return create_engine(path)
+    def get_engine(cls, path: str, **engine_options) -> Engine:
+        """
+        Creates an engine with the pool, statement cache and bulk insert
+        settings of ENGINE_OPTIONS, overridden by engine_options.
+        """
+        options = dict(cls.ENGINE_OPTIONS)
+        if make_url(path).get_driver_name() == "psycopg2":
+            options.update(cls.PSYCOPG2_OPTIONS)
+        options.update(engine_options)
+        return create_engine(path, **options)
 
     @property
     def table_order(self):
@@ -74,7 +141,15 @@ class PostgresDatabaseConnector(DatabaseConnector):
 
     @property
     def session(self) -> Session:
-        return sessionmaker(bind=self.engine, future=True)()
+        return self.session_factory()
+
+    @property
+    def batch_session(self) -> Session:
+        """
+        Session committing in batches. Loaded objects are not expired on
+        commit, so later batches do not reload them one row at a time.
+        """
+        return self.session_factory(expire_on_commit=False)
 
     @staticmethod
     def is_path(path: str) -> bool:
@@ -90,4 +165,43 @@ class PostgresDatabaseConnector(DatabaseConnector):
 
     def recreate_tables(self):
         BaseModel.metadata.drop_all(bind=self.engine)
-        BaseModel.metadata.create_all(bind=self.engine)
+        self.create_tables()
+
+    def create_tables(self):
+        if not self.bulk:
+            BaseModel.metadata.create_all(bind=self.engine)
+            return
+        with self.engine.begin() as connection:
+            create_bulk_tables(
+                connection, BaseModel.metadata.sorted_tables, checkfirst=True
+            )
+
+    def create_shadow_tables(self):
+        with self.engine.begin() as connection:
+            prepare_shadow(connection, self.shadow_schema, keep=self.resume)
+        self.create_tables()
+
+    def finish_import(self):
+        """
+        Completes a bulk or shadow import: builds the indexes and constraints
+        deferred by a bulk load and analyzes the tables, then moves the shadow
+        tables, if any, in place of those of SCHEMA and drops the old tables.
+        """
+        if not (self.bulk or self.shadow_schema):
+            return
+
+        tables = BaseModel.metadata.sorted_tables
+        schema = check_schema_name(self.SCHEMA)
+        if self.bulk:
+            build_deferred(self.engine, tables, self.shadow_schema)
+        log.info("Analyzing tables of %s", self.shadow_schema or schema)
+        with self.engine.begin() as connection:
+            analyze_tables(connection, self.shadow_schema or schema, tables)
+        if not self.shadow_schema:
+            return
+
+        with self.engine.begin() as connection:
+            swap_tables(connection, schema, self.shadow_schema, tables)
+        with self.engine.begin() as connection:
+            drop_retired_or_keep(connection, schema, tables)
+            drop_shadow(connection, self.shadow_schema)
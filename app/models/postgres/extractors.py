@@ -0,0 +1,350 @@
+"""
+This module exports the rows of the loglan_core models without the ORM.
+
+Every model of a table order gets an extractor that selects its columns
+with Core and formats them as the text fields of Exporter, without joining
+them into a string to split it again, so fields containing the separator
+stay intact. The authors and derivatives of words are read with one query
+per relation instead of lazy loads per word.
+
+Functions:
+    build_extractors: Returns the extractors of the models of a table order.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Callable
+
+from loglan_core.addons.exporter import Exporter
+from loglan_core.author import BaseAuthor
+from loglan_core.connect_tables import t_connect_authors, t_connect_words
+from loglan_core.definition import BaseDefinition
+from loglan_core.event import BaseEvent
+from loglan_core.setting import BaseSetting
+from loglan_core.syllable import BaseSyllable
+from loglan_core.type import BaseType
+from loglan_core.word import BaseWord
+from loglan_core.word_spell import BaseWordSpell
+from sqlalchemy import select
+from sqlalchemy.orm import Session, aliased
+
+Extractor = Callable[[Session], list[list[str]]]
+
+
+def field(value: Any) -> str:
+    """
+    Returns:
+        str: The value as a text field, empty for None and empty values.
+    """
+    return str(value or "")
+
+
+def extract_authors(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of abbreviation, full name and notes of the authors.
+    """
+    query = select(class_.abbreviation, class_.full_name, class_.notes).order_by(
+        class_.id
+    )
+
+    def extract(session: Session) -> list[list[str]]:
+        return [[field(value) for value in row] for row in session.execute(query)]
+
+    return extract
+
+
+def extract_events(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of the events, dates in Exporter.FORMAT_DATE_EVENT.
+    """
+    query = select(
+        class_.event_id,
+        class_.name,
+        class_.date,
+        class_.definition,
+        class_.annotation,
+        class_.suffix,
+    ).order_by(class_.id)
+
+    def extract(session: Session) -> list[list[str]]:
+        return [
+            [
+                field(event_id),
+                field(name),
+                date.strftime(Exporter.FORMAT_DATE_EVENT),
+                field(definition),
+                field(annotation),
+                field(suffix),
+            ]
+            for event_id, name, date, definition, annotation, suffix in session.execute(
+                query
+            )
+        ]
+
+    return extract
+
+
+def extract_types(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of the types, parentable as "True" or "False".
+    """
+    query = select(
+        class_.type_,
+        class_.type_x,
+        class_.group,
+        class_.parentable,
+        class_.description,
+    ).order_by(class_.id)
+
+    def extract(session: Session) -> list[list[str]]:
+        return [
+            [field(type_), field(type_x), field(group), str(parentable), field(desc)]
+            for type_, type_x, group, parentable, desc in session.execute(query)
+        ]
+
+    return extract
+
+
+def word_authors(session: Session) -> dict[int, str]:
+    """
+    Returns:
+        dict[int, str]: Sorted abbreviations of the authors of words, joined
+            with "/", by word id, read with one query for all words.
+    """
+    query = select(t_connect_authors.c.WID, BaseAuthor.abbreviation).join(
+        BaseAuthor, BaseAuthor.id == t_connect_authors.c.AID
+    )
+    authors = defaultdict(list)
+    for word_id, abbreviation in session.execute(query):
+        authors[word_id].append(abbreviation)
+    return {word_id: "/".join(sorted(names)) for word_id, names in authors.items()}
+
+
+def word_derivatives(session: Session) -> tuple[dict[int, str], dict[int, str]]:
+    """
+    Returns:
+        tuple[dict[int, str], dict[int, str]]: The affixes and the complexes
+            of words by word id, formatted as ExportWordConverter does.
+    """
+    child = aliased(BaseWord)
+    query = (
+        select(t_connect_words.c.parent_id, child.name, BaseType.type_x, BaseType.group)
+        .join(child, child.id == t_connect_words.c.child_id)
+        .join(BaseType, BaseType.id == child.type_id)
+        .order_by(t_connect_words.c.parent_id, child.id)
+    )
+    affixes, complexes = defaultdict(list), defaultdict(list)
+    for parent_id, name, type_x, group in session.execute(query):
+        if type_x == "Affix":
+            affixes[parent_id].append(name.replace("-", ""))
+        if group == "Cpx":
+            complexes[parent_id].append(name)
+    return (
+        {word_id: " ".join(names).strip() for word_id, names in affixes.items()},
+        {word_id: " | ".join(names) for word_id, names in complexes.items()},
+    )
+
+
+def extract_words(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of the words, with their authors, affixes and
+            complexes, and the author, year and rank notes appended to
+            the fields they annotate.
+    """
+    query = (
+        select(
+            class_.id,
+            class_.id_old,
+            BaseType.type_,
+            BaseType.type_x,
+            class_.match,
+            class_.year,
+            class_.rank,
+            class_.notes,
+            class_.origin,
+            class_.origin_x,
+            class_.tid_old,
+        )
+        .join(BaseType, BaseType.id == class_.type_id)
+        .order_by(class_.id)
+    )
+
+    def extract(session: Session) -> list[list[str]]:
+        authors = word_authors(session)
+        affixes, complexes = word_derivatives(session)
+        rows = []
+        for word in session.execute(query):
+            notes = word.notes or {}
+            source = f"{authors.get(word.id, '')} {notes.get('author', '')}"
+            year = f"{word.year.year} {notes.get('year', '')}" if word.year else ""
+            rows.append(
+                [
+                    field(word.id_old),
+                    field(word.type_),
+                    field(word.type_x),
+                    affixes.get(word.id, ""),
+                    field(word.match),
+                    source.strip(),
+                    year.strip(),
+                    f"{word.rank} {notes.get('rank', '')}".strip(),
+                    field(word.origin),
+                    field(word.origin_x),
+                    complexes.get(word.id, ""),
+                    field(word.tid_old),
+                ]
+            )
+        return rows
+
+    return extract
+
+
+def extract_word_spells(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of the word spells, with the search name, the case
+            pattern of the name and 9999 for spells without an end event.
+    """
+    event_end = aliased(BaseEvent)
+    query = (
+        select(class_.id_old, class_.name, class_.event_start_id, event_end.event_id)
+        .outerjoin(event_end, event_end.event_id == class_.event_end_id)
+        .order_by(class_.id)
+    )
+
+    def extract(session: Session) -> list[list[str]]:
+        return [
+            [
+                field(id_old),
+                field(name),
+                name.lower(),
+                "".join("0" if symbol.isupper() else "5" for symbol in name),
+                field(event_start_id),
+                field(9999 if event_end_id is None else event_end_id),
+                "",
+            ]
+            for id_old, name, event_start_id, event_end_id in session.execute(query)
+        ]
+
+    return extract
+
+
+def extract_definitions(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of the definitions, keyed by the old id of their word,
+            with slots and grammar code joined into one field.
+    """
+    query = (
+        select(
+            BaseWord.id_old,
+            class_.position,
+            class_.usage,
+            class_.slots,
+            class_.grammar_code,
+            class_.body,
+            class_.case_tags,
+        )
+        .join(BaseWord, BaseWord.id == class_.word_id)
+        .order_by(class_.id)
+    )
+
+    def extract(session: Session) -> list[list[str]]:
+        return [
+            [
+                field(id_old),
+                field(position),
+                field(usage),
+                f"{slots or ''}{grammar_code or ''}",
+                field(body),
+                "",
+                field(case_tags),
+            ]
+            for id_old, position, usage, slots, grammar_code, body, case_tags in (
+                session.execute(query)
+            )
+        ]
+
+    return extract
+
+
+def extract_settings(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of the settings, dates in Exporter.FORMAT_DATE_SETTING.
+    """
+    query = select(
+        class_.date, class_.db_version, class_.last_word_id, class_.db_release
+    ).order_by(class_.id)
+
+    def extract(session: Session) -> list[list[str]]:
+        return [
+            [
+                date.strftime(Exporter.FORMAT_DATE_SETTING),
+                field(db_version),
+                field(last_word_id),
+                field(db_release),
+            ]
+            for date, db_version, last_word_id, db_release in session.execute(query)
+        ]
+
+    return extract
+
+
+def extract_syllables(class_) -> Extractor:
+    """
+    Returns:
+        Extractor: Rows of name, type and allowed flag of the syllables.
+    """
+    query = select(class_.name, class_.type_, class_.allowed).order_by(class_.id)
+
+    def extract(session: Session) -> list[list[str]]:
+        return [
+            [field(name), field(type_), str(allowed)]
+            for name, type_, allowed in session.execute(query)
+        ]
+
+    return extract
+
+
+# Checked in order, as Exporter does: a word spell is a word as well
+EXTRACTOR_FACTORIES: tuple[tuple[type, Callable[[type], Extractor]], ...] = (
+    (BaseAuthor, extract_authors),
+    (BaseEvent, extract_events),
+    (BaseType, extract_types),
+    (BaseWordSpell, extract_word_spells),
+    (BaseWord, extract_words),
+    (BaseDefinition, extract_definitions),
+    (BaseSetting, extract_settings),
+    (BaseSyllable, extract_syllables),
+)
+
+
+def build_extractors(table_order: dict[str, type]) -> dict[type, Extractor]:
+    """
+    Parameters:
+        table_order (dict[str, type]): Models by table name, as in connectors.
+    Returns:
+        dict[type, Extractor]: Extractors by model, each returning the text
+            rows of its model for a session.
+    Raises:
+        ValueError: If a model has no extractor.
+    """
+    extractors = {}
+    for class_ in table_order.values():
+        factory = next(
+            (
+                factory
+                for base, factory in EXTRACTOR_FACTORIES
+                if issubclass(class_, base)
+            ),
+            None,
+        )
+        if factory is None:
+            raise ValueError(f"Unsupported object type: {class_}")
+        extractors[class_] = factory(class_)
+    return extractors
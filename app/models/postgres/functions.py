@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime
 
 from loglan_core import Word, WordSelector
 
+from app.dates import parse_year
 from app.properties import ClassName
 from app.storage import Storage
 
@@ -34,7 +34,7 @@ def get_grammar(str_grammar: str) -> dict:
 def get_year(str_date: str) -> dict:
     date_year = str_date.split(" ", 1)
     return {
-        "year": datetime.strptime(date_year[0], "%Y").date(),
+        "year": parse_year(date_year[0]),
         "notes": date_year[1] if len(date_year) > 1 else None,
     }
 
@@ -104,7 +104,8 @@ def get_elements_from_str(set_as_str: str, separator: str) -> list:
 
 
 def get_source_data_by_index(data: Storage, index: int) -> list:
-    words = [w for w in data.container_by_name(ClassName.words) if w[index]]
+    # one row per old id, as link_words links all words of an old id at once
+    words = [w for w in data.index(ClassName.words, "old_id").values() if w[index]]
     return words
 
 
@@ -129,6 +130,6 @@ def generate_djifoa_children(w: list, session):
 
 def generate_authors_data(data: Storage) -> dict:
     return {
-        int(w[0]): w[5].split(" ", 1)[0].split("/")
-        for w in data.container_by_name(ClassName.words)
+        int(old_id): w[5].split(" ", 1)[0].split("/")
+        for old_id, w in data.index(ClassName.words, "old_id").items()
     }
@@ -0,0 +1,248 @@
+"""
+This module prepares a shadow schema for Postgres imports and publishes its tables.
+
+An import into the shadow schema leaves the live dictionary untouched.
+When it is complete, the shadow tables are analyzed and moved into the live
+schema in a single transaction, the live dictionary tables being moved out
+to a retired schema first, so readers see either the old or the new
+dictionary, fully indexed, and never a partial one. Only the dictionary
+tables move: the live schema itself, its ownership, default privileges and
+every other object in it are left as they are, and table grants are copied
+from the replaced tables.
+
+Functions:
+    check_schema_name: Validates a schema name used in DDL.
+    shadow_name: Returns the shadow schema name of a schema.
+    prepare_shadow: Creates the shadow schema, dropping a stale one.
+    analyze_tables: Collects planner statistics of the imported tables.
+    swap_tables: Moves the shadow tables in place of the live ones.
+    drop_retired: Drops the tables replaced by the last swap.
+    drop_retired_or_keep: Drops those no other objects depend on.
+    drop_shadow: Drops the shadow schema once its tables are published.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from typing import Iterable, Sequence
+
+from sqlalchemy import Connection, Table, text
+from sqlalchemy.exc import DBAPIError
+
+from logger import log
+
+SCHEMA_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def check_schema_name(name: str) -> str:
+    """
+    Returns:
+        str: The name, safe to quote into DDL.
+    Raises:
+        ValueError: If the name is not a plain identifier.
+    """
+    if not SCHEMA_NAME.match(name):
+        raise ValueError(f"Invalid schema name '{name}'.")
+    return name
+
+
+def shadow_name(schema: str) -> str:
+    """
+    Returns:
+        str: The schema an import into the schema is loaded into.
+    """
+    return check_schema_name(f"{schema}_shadow")
+
+
+def retired_name(schema: str) -> str:
+    """
+    Returns:
+        str: The schema the tables replaced by a swap are moved to.
+    """
+    return check_schema_name(f"{schema}_retired")
+
+
+def qualified(schema: str, name: str) -> str:
+    """
+    Returns:
+        str: The quoted, schema qualified name of a relation.
+    """
+    return f'"{schema}"."{name}"'
+
+
+def schema_exists(connection: Connection, schema: str) -> bool:
+    """
+    Returns:
+        bool: Whether the schema exists in the database.
+    """
+    query = text("SELECT 1 FROM pg_namespace WHERE nspname = :schema")
+    return connection.execute(query, {"schema": schema}).first() is not None
+
+
+def table_exists(connection: Connection, schema: str, name: str) -> bool:
+    """
+    Returns:
+        bool: Whether the schema holds a relation of that name.
+    """
+    query = text("SELECT to_regclass(:relation)")
+    relation = qualified(schema, name)
+    return connection.execute(query, {"relation": relation}).scalar() is not None
+
+
+def prepare_shadow(connection: Connection, shadow: str, keep: bool = False):
+    """
+    Creates the shadow schema.
+    Parameters:
+        connection (Connection): Connection in a transaction.
+        shadow (str): Shadow schema name.
+        keep (bool): Keep an existing shadow schema, to resume an import into it.
+    """
+    if not keep:
+        connection.execute(text(f'DROP SCHEMA IF EXISTS "{shadow}" CASCADE'))
+    connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{shadow}"'))
+
+
+def analyze_tables(connection: Connection, shadow: str, tables: Iterable[Table]):
+    """
+    Collects planner statistics of the tables in a schema, so the first
+    queries after the import do not plan on empty tables.
+    """
+    for table in tables:
+        connection.execute(text(f"ANALYZE {qualified(shadow, table.name)}"))
+
+
+def copy_grants(connection: Connection, kind: str, source: str, target: str):
+    """
+    Grants on the target relation the privileges granted on the source one.
+    Parameters:
+        kind (str): TABLE or SEQUENCE.
+        source (str): Qualified name of the relation granting privileges.
+        target (str): Qualified name of the relation receiving them.
+    """
+    query = text(
+        "SELECT CASE WHEN acl.grantee = 0 THEN 'PUBLIC' "
+        "ELSE quote_ident(pg_get_userbyid(acl.grantee)) END AS grantee, "
+        "acl.privilege_type "
+        "FROM pg_class, aclexplode(relacl) AS acl "
+        "WHERE pg_class.oid = CAST(:relation AS regclass)"
+    )
+    for grantee, privilege in connection.execute(query, {"relation": source}):
+        connection.execute(text(f"GRANT {privilege} ON {kind} {target} TO {grantee}"))
+
+
+def copy_table_grants(connection: Connection, table: Table, source: str, target: str):
+    """
+    Copies the grants of a table and of its serial sequence between schemas.
+    """
+    copy_grants(
+        connection,
+        "TABLE",
+        qualified(source, table.name),
+        qualified(target, table.name),
+    )
+    column = table.autoincrement_column
+    if column is None:
+        return
+    query = text("SELECT pg_get_serial_sequence(:table, :column)")
+    sequences = [
+        connection.execute(
+            query, {"table": qualified(schema, table.name), "column": column.name}
+        ).scalar()
+        for schema in (source, target)
+    ]
+    if all(sequences):
+        copy_grants(connection, "SEQUENCE", *sequences)
+
+
+def swap_tables(
+    connection: Connection, schema: str, shadow: str, tables: Sequence[Table]
+):
+    """
+    Moves the live tables to the retired schema and the shadow tables into
+    the live schema. Runs in the transaction of the connection, so the swap
+    is atomic. Retired tables kept by an earlier swap are renamed with a
+    timestamp suffix, and those replaced now are left for drop_retired_or_keep,
+    to be called in a later transaction so readers do not wait on the drop.
+    Parameters:
+        connection (Connection): Connection in a transaction.
+        schema (str): Live schema name.
+        shadow (str): Shadow schema name.
+        tables (Sequence[Table]): The dictionary tables.
+    """
+    retired = retired_name(schema)
+    drop_retired_or_keep(connection, schema, tables)
+    connection.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{retired}"'))
+    for table in tables:
+        # tables kept by an earlier swap, as other objects depend on them
+        if table_exists(connection, retired, table.name):
+            keep_name = f"{table.name}_{int(time.time())}"
+            connection.execute(
+                text(
+                    f"ALTER TABLE {qualified(retired, table.name)} "
+                    f'RENAME TO "{keep_name}"'
+                )
+            )
+            log.warning("Renamed the kept %s.%s to %s", retired, table.name, keep_name)
+    for table in tables:
+        if table_exists(connection, schema, table.name):
+            copy_table_grants(connection, table, schema, shadow)
+            connection.execute(
+                text(
+                    f'ALTER TABLE {qualified(schema, table.name)} SET SCHEMA "{retired}"'
+                )
+            )
+        connection.execute(
+            text(f'ALTER TABLE {qualified(shadow, table.name)} SET SCHEMA "{schema}"')
+        )
+    log.info("Tables of %s replaced by the imported %s", schema, shadow)
+
+
+def drop_retired(connection: Connection, schema: str, tables: Sequence[Table]):
+    """
+    Drops the dictionary tables of the retired schema, then the schema if it
+    is empty. Nothing is dropped in cascade: if other objects, such as views,
+    still depend on the retired tables, the drop fails instead.
+    """
+    retired = retired_name(schema)
+    if not schema_exists(connection, retired):
+        return
+    names = ", ".join(qualified(retired, table.name) for table in tables)
+    connection.execute(text(f"DROP TABLE IF EXISTS {names}"))
+    connection.execute(text(f'DROP SCHEMA IF EXISTS "{retired}"'))
+
+
+def drop_shadow(connection: Connection, shadow: str):
+    """
+    Drops the shadow schema, left with the import progress only.
+    """
+    connection.execute(text(f'DROP SCHEMA IF EXISTS "{shadow}" CASCADE'))
+
+
+def drop_retired_or_keep(connection: Connection, schema: str, tables: Sequence[Table]):
+    """
+    Drops the dictionary tables of the retired schema one by one, dependents
+    first, each in a savepoint, keeping with a warning those other objects
+    still depend on. The schema is dropped once it is empty.
+    """
+    retired = retired_name(schema)
+    if not schema_exists(connection, retired):
+        return
+    for table in reversed(tables):
+        try:
+            with connection.begin_nested():
+                connection.execute(
+                    text(f"DROP TABLE IF EXISTS {qualified(retired, table.name)}")
+                )
+        except DBAPIError as error:
+            log.warning(
+                "Kept the replaced %s.%s, other objects depend on it: %s",
+                retired,
+                table.name,
+                error.orig,
+            )
+    try:
+        with connection.begin_nested():
+            connection.execute(text(f'DROP SCHEMA IF EXISTS "{retired}"'))
+    except DBAPIError:
+        log.warning("Kept %s, it still holds replaced tables", retired)
@@ -0,0 +1,72 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import sessionmaker
+
+from app.connector import DatabaseConnector
+from app.instrumentation import metrics
+from app.models.postgres.connector import PostgresDatabaseConnector
+
+
+class AsyncPostgresDatabaseConnector(DatabaseConnector):
+    DRIVER = "postgresql+asyncpg"
+    ENGINE_OPTIONS = {
+        "pool_size": 10,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "query_cache_size": 1200,
+        "insertmanyvalues_page_size": 1000,
+    }
+
+    def __init__(self, path: str, importing: bool = False, **engine_options):
+        if PostgresDatabaseConnector.is_path(path):
+            self.path = path
+            self.importing = importing
+            self.engine: AsyncEngine = self.get_engine(self.path, **engine_options)
+            self.session_factory = async_sessionmaker(
+                self.engine, expire_on_commit=False
+            )
+            self.bridge = BridgeConnector(self)
+            metrics.instrument_engine(self.engine.sync_engine)
+
+    @classmethod
+    def get_engine(cls, path: str, **engine_options) -> AsyncEngine:
+        """
+        Creates an asyncpg engine for a postgres:// or postgresql:// URI.
+        """
+        url = make_url(path).set(drivername=cls.DRIVER)
+        return create_async_engine(url, **{**cls.ENGINE_OPTIONS, **engine_options})
+
+    @property
+    def table_order(self):
+        return self.bridge.table_order
+
+    @property
+    def session(self) -> AsyncSession:  # type: ignore[override]
+        return self.session_factory()
+
+
+class BridgeConnector(PostgresDatabaseConnector):
+    """
+    Synchronous connector on top of the async engine.
+    Its sessions perform I/O through the event loop, so they may only be
+    used in a function run by greenlet_spawn, as AsyncPostgresInterface.run_sync
+    does, where the synchronous import and link steps of PostgresInterface
+    can be reused as they are.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, connector: AsyncPostgresDatabaseConnector
+    ):
+        self.path = connector.path
+        self.resume = False
+        self.shadow_schema = None
+        self.bulk = False
+        self.engine = connector.engine.sync_engine
+        self.session_factory = sessionmaker(bind=self.engine, future=True)
@@ -0,0 +1,105 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+import asyncio
+
+from sqlalchemy.util import greenlet_spawn
+
+from app.interface import DatabaseInterface
+from app.models.postgres.interface import PostgresInterface
+from app.models.postgres_async.connector import AsyncPostgresDatabaseConnector
+from app.properties import ValidationMode
+from app.storage import Storage
+from logger import logging, logging_time
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
+
+
+class AsyncPostgresInterface(DatabaseInterface):
+    """
+    Postgres interface running on an asyncio engine.
+    Tables are exported concurrently and independent import steps overlap,
+    while every single step reuses the PostgresInterface implementation.
+
+    Every step opens its own sessions on the bridge connector, so concurrent
+    steps share no session, connection or transaction, only the pool.
+    Steps run concurrently only when they write disjoint tables and read
+    nothing another running step writes:
+        - the exports of the eight tables, which only read;
+        - the imports of the SIMPLE_CLASSES, each into its own table;
+        - link_keys (connect_keys), link_authors (connect_authors) and
+          link_complexes followed by link_affixes (connect_words), which read
+          the words, definitions and keys imported before them.
+    import_words, import_definitions and add_keys read the rows of the
+    previous steps and run one after another.
+    """
+
+    def __init__(self, connector: AsyncPostgresDatabaseConnector):
+        """
+        Initialize the AsyncPostgresInterface object.
+        """
+        self.connector = connector
+        self.steps = PostgresInterface(connector.bridge)
+
+    @logging_time
+    def export_data(self) -> Storage:
+        return asyncio.run(self.export_data_async())
+
+    async def export_data_async(self) -> Storage:
+        s = Storage()
+        classes = self.connector.table_order.values()
+        try:
+            tables = await asyncio.gather(
+                *(self.run_sync(self.get_table_data, class_) for class_ in classes)
+            )
+        finally:
+            await self.connector.engine.dispose()
+
+        for container, data in zip(s.containers, tables):
+            container.ingest(data, ValidationMode.sampled)
+            log.info("Exported %s %s items\n", len(container), container.name)
+        return s
+
+    def get_table_data(self, class_) -> list:
+        log.info("Exporting %s", class_.__name__)
+        with self.steps.connector.session as session:
+            return self.steps.get_table_data(session, class_)
+
+    @logging_time
+    def import_data(self, data: Storage) -> None:
+        asyncio.run(self.import_data_async(data))
+
+    async def import_data_async(self, data: Storage) -> None:
+        try:
+            if self.connector.importing:
+                await self.run_sync(self.steps.connector.recreate_tables)
+
+            await asyncio.gather(
+                *(
+                    self.run_sync(self.steps.import_simple_class, data, class_name)
+                    for class_name in self.steps.SIMPLE_CLASSES
+                )
+            )
+            await self.run_sync(self.steps.import_words, data)
+            await self.run_sync(self.steps.import_definitions, data, "en")
+            await self.run_sync(self.steps.add_keys)
+            await asyncio.gather(
+                self.run_sync(self.steps.link_keys),
+                self.run_sync(self.steps.link_authors, data),
+                self.link_derivatives(data),
+            )
+        finally:
+            await self.connector.engine.dispose()
+
+    async def link_derivatives(self, data: Storage) -> None:
+        await self.run_sync(self.steps.link_complexes, data)
+        await self.run_sync(self.steps.link_affixes, data)
+
+    @staticmethod
+    async def run_sync(func, *args):
+        """
+        Runs a synchronous step on the bridge connector, letting other
+        steps proceed while this one waits for the database.
+        The step runs in a greenlet, as AsyncSession.run_sync does,
+        so the sessions of the bridge connector can await the driver.
+        """
+        return await greenlet_spawn(func, *args)
@@ -0,0 +1,63 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+import re
+
+from sqlalchemy.orm import Session
+
+from app.connector import DatabaseConnector
+from app.download import TABLES_URL, table_urls
+from app.properties import ClassName
+
+
+class RemoteTextConnector(DatabaseConnector):
+    EXTENSION = "txt"
+
+    @property
+    def session(self) -> Session:
+        raise NotImplementedError("There is no session for RemoteTextConnector.")
+
+    def __init__(self, path: str = TABLES_URL, importing: bool = False):
+        if importing:
+            raise ValueError("Remote text tables are read-only.")
+        self.is_path(path)
+        self.path = path
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(path="{self.path}")'
+
+    @property
+    def table_order(self) -> dict:
+        return {}
+
+    @staticmethod
+    def is_path(path: str) -> bool:
+        """
+        Checks if a given path is an HTTP(S) URL.
+        Parameters:
+            path (str): The base URL of the text tables.
+        Returns:
+            bool: True if the path is a URL.
+        Raises:
+            ValueError: If no URL or an invalid URL is provided.
+        """
+        if not path:
+            raise ValueError("No URL provided.")
+        if re.match(r"^https?://", path) is None:
+            raise ValueError(f"Invalid URL:\n\t{path}")
+        return True
+
+    @property
+    def urls(self) -> dict[str, str]:
+        """
+        Returns URLs of the text tables by their names.
+        """
+        return dict(zip(ClassName(), table_urls(self.path)))
+
+    def url_by_name(self, name: str) -> str:
+        """
+        Returns the URL of the text table with the given name.
+        Raises:
+            FileNotFoundError: If there is no table with the given name.
+        """
+        if name not in self.urls:
+            raise FileNotFoundError(f"File '{name}' not found.")
+        return self.urls[name]
@@ -0,0 +1,56 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+from app.download import stream_lines
+from app.instrumentation import metrics
+from app.interface import DatabaseInterface
+from app.models.remote_text.connector import RemoteTextConnector
+from app.properties import ClassName
+from app.storage import Storage
+from app.table_container import TableContainer
+from logger import logging, logging_time
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
+
+
+class RemoteTextInterface(DatabaseInterface):
+    def __init__(self, connector: RemoteTextConnector):
+        self.connector = connector
+
+    @logging_time
+    def export_data(self) -> Storage:
+        """
+        Streams all text tables concurrently, parsing each line
+        into its container as soon as it is received.
+        :return:
+        """
+        s = Storage()
+        names = list(ClassName())
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = [
+                # run in a copy of the context, to nest into the current stage
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self.export_table,
+                    s.container_by_name(name),
+                )
+                for name in names
+            ]
+            for future in futures:
+                future.result()
+        return s
+
+    def export_table(self, container: TableContainer):
+        url = self.connector.url_by_name(container.name)
+        log.info("Streaming %s", url)
+        with metrics.stage(f"export_{container.name}"):
+            container.extend(
+                line.strip().split(self.SEPARATOR) for line in stream_lines(url)
+            )
+            metrics.add_rows(len(container))
+        log.info("Exported %s %s items\n", len(container), container.name)
+
+    def import_data(self, data: Storage):
+        raise NotImplementedError("Remote text tables are read-only.")
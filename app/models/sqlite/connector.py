@@ -1,7 +1,5 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
 
-from datetime import datetime
-
 from loglan_core import (
     Author,
     Event as BaseEvent,
@@ -17,7 +15,8 @@ from sqlalchemy import create_engine, Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.connector import DatabaseConnector
-from app.models.common import CommonEvent, CommonSetting
+from app.dates import parse_event_date, parse_setting_date
+from app.instrumentation import metrics
 from app.properties import ClassName
 
 
@@ -27,9 +26,7 @@ class Event(BaseEvent):
         date_index = 2
         args = list(args)
         if args and isinstance(args[date_index], str):
-            args[date_index] = datetime.strptime(
-                args[date_index], CommonEvent.DATE_FORMAT
-            )
+            args[date_index] = parse_event_date(args[date_index])
         super().__init__(*args, **kwargs)
 
 
@@ -39,24 +36,49 @@ class Setting(BaseSetting):
         date_index = 0
         args = list(args)
         if args and isinstance(args[date_index], str):
-            args[date_index] = datetime.strptime(
-                args[date_index], CommonSetting.DATE_FORMAT
-            )
+            args[date_index] = parse_setting_date(args[date_index])
         super().__init__(*args, **kwargs)
 
 
 class SQLiteDatabaseConnector(DatabaseConnector):
-
-    def __init__(self, path: str, importing: bool = False):
+    ENGINE_OPTIONS = {
+        "query_cache_size": 1200,
+        "insertmanyvalues_page_size": 1000,
+    }
+
+    def __init__(
+        self,
+        path: str,
+        importing: bool = False,
+        resume: bool = False,
+        **engine_options,
+    ):
+        """
+        Parameters:
+            path (str): Database path or URI.
+            importing (bool): Prepare the tables for an import.
+            resume (bool): Keep existing tables and data to resume
+                an interrupted import instead of recreating them.
+        """
         if self.is_path(path):
             self.path = path
-            self.engine: Engine = self.get_engine(self.path)
-            if importing:
+            self.resume = resume
+            self.engine: Engine = self.get_engine(self.path, **engine_options)
+            self.session_factory = sessionmaker(bind=self.engine, future=True)
+            metrics.instrument_engine(self.engine)
+            if importing and resume:
+                self.create_tables()
+            elif importing:
                 self.recreate_tables()
 
     @classmethod
-    def get_engine(cls, path: str) -> Engine:
-        return create_engine(f"sqlite:///{path}")
+    def get_engine(cls, path: str, **engine_options) -> Engine:
+        """
+        Creates an engine with the statement cache and bulk insert
+        settings of ENGINE_OPTIONS, overridden by engine_options.
+        """
+        options = {**cls.ENGINE_OPTIONS, **engine_options}
+        return create_engine(f"sqlite:///{path}", **options)
 
     @property
     def table_order(self):
@@ -73,7 +95,15 @@ class SQLiteDatabaseConnector(DatabaseConnector):
 
     @property
     def session(self) -> Session:
-        return sessionmaker(bind=self.engine, future=True)()
+        return self.session_factory()
+
+    @property
+    def batch_session(self) -> Session:
+        """
+        Session committing in batches. Loaded objects are not expired on
+        commit, so later batches do not reload them one row at a time.
+        """
+        return self.session_factory(expire_on_commit=False)
 
     @staticmethod
     def is_path(path: str) -> bool:
@@ -92,3 +122,6 @@ class SQLiteDatabaseConnector(DatabaseConnector):
     def recreate_tables(self):
         BaseModel.metadata.drop_all(bind=self.engine)
         BaseModel.metadata.create_all(bind=self.engine)
+
+    def create_tables(self):
+        BaseModel.metadata.create_all(bind=self.engine)
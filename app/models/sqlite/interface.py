@@ -1,13 +1,16 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
 from collections import defaultdict
+from functools import partial
 
 from loglan_core import Author, Type, Word, Key, Definition, WordSelector, WordSpell
 from loglan_core.addons.definition_selector import DefinitionSelector
-from loglan_core.addons.exporter import Exporter
 from sqlalchemy import func, select
 
+from app.checkpoint import Checkpoint, CheckpointedImport
+from app.instrumentation import metrics
 from app.interface import DatabaseInterface
 from app.models.sqlite.connector import SQLiteDatabaseConnector
+from app.models.postgres.extractors import build_extractors
 from app.models.postgres.functions import (
     extract_keys,
     get_grammar,
@@ -27,51 +30,46 @@ log = logging.getLogger(__name__)
 log.level = logging.INFO
 
 
-class SQLiteInterface(DatabaseInterface):
+class SQLiteInterface(CheckpointedImport, DatabaseInterface):
     def __init__(self, connector: SQLiteDatabaseConnector):
         """
         Initialize the SQLiteInterface object.
         """
         self.connector = connector
+        self.checkpoint = Checkpoint()
+        self.extractors = build_extractors(connector.table_order)
 
     @logging_time
     def export_data(self) -> Storage:
-        return self.default_export(self.connector, self.get_data_from_objects)
+        return self.default_export(self.connector, self.get_table_data)
 
-    def get_data_from_objects(self, objects):
-        return [
-            Exporter.export(obj, self.SEPARATOR).split(self.SEPARATOR)
-            for obj in objects
-        ]
+    def get_table_data(self, session, class_) -> list[list[str]]:
+        return self.extractors[class_](session)
 
-    @logging_time
-    def import_data(self, data: Storage) -> None:
-        self.import_simple_classes(data)
-        self.import_words(data)
-        self.import_definitions(data, "en")
-        self.add_keys()
-        self.link_keys()
-        self.link_authors(data)
-        self.link_complexes(data)
-        self.link_affixes(data)
+    SIMPLE_CLASSES = (
+        ClassName.authors,
+        ClassName.events,
+        ClassName.types,
+        ClassName.settings,
+        ClassName.syllables,
+    )
 
     @logging_time
     def import_simple_classes(self, data):
-        for class_name in [
-            ClassName.authors,
-            ClassName.events,
-            ClassName.types,
-            ClassName.settings,
-            ClassName.syllables,
-        ]:
-            with self.connector.session as session:
-                class_ = self.connector.table_order.get(class_name)
-                log.info("Importing %s", class_.__name__)
-                container = data.container_by_name(class_name)
-                objects = [class_(*item).__dict__ for item in container]
-                session.bulk_insert_mappings(class_.__mapper__, objects)
-                session.commit()
-                log.info("Imported %s %s items\n", len(container), class_.__name__)
+        for class_name in self.SIMPLE_CLASSES:
+            self.import_simple_class(data, class_name)
+
+    def import_simple_class(self, data, class_name: str):
+        with self.connector.session as session:
+            class_ = self.connector.table_order.get(class_name)
+            log.info("Importing %s", class_.__name__)
+            container = data.container_by_name(class_name)
+            objects = [class_(*item).__dict__ for item in container]
+            session.bulk_insert_mappings(class_.__mapper__, objects)
+            self.checkpoint.mark(session, f"import_{class_name}")
+            session.commit()
+            metrics.add_rows(len(objects))
+            log.info("Imported %s %s items\n", len(container), class_.__name__)
 
     @logging_time
     def import_words(self, data):
@@ -114,7 +112,9 @@ class SQLiteInterface(DatabaseInterface):
         with self.connector.session as session:
             log.info("Saving list of %s to database", class_.__name__)
             session.bulk_insert_mappings(class_.__mapper__, words)
+            self.checkpoint.mark(session, "import_words")
             session.commit()
+            metrics.add_rows(len(words))
 
         log.info("Imported %s %s items\n", len(words), class_.__name__)
 
@@ -166,7 +166,9 @@ class SQLiteInterface(DatabaseInterface):
                 Definition.__mapper__,
                 all_definitions,
             )
+            self.checkpoint.mark(session, "import_definitions")
             session.commit()
+            metrics.add_rows(len(all_definitions))
 
     @logging_time
     def add_keys(self):
@@ -184,13 +186,15 @@ class SQLiteInterface(DatabaseInterface):
                 )
                 keys = extract_keys(bodies, language)
                 session.bulk_insert_mappings(Key.__mapper__, keys)
+                metrics.add_rows(len(keys))
+            self.checkpoint.mark(session, "add_keys")
             session.commit()
         log.info("Imported %s %s items\n", len(keys), Key.__name__)
 
     @logging_time
     def link_keys(self):
         log.info("Linking %s", Key.__name__)
-        with self.connector.session as session:
+        with self.connector.batch_session as session:
             languages = (
                 session.execute(select(Definition.language.distinct())).scalars().all()
             )
@@ -199,30 +203,50 @@ class SQLiteInterface(DatabaseInterface):
                     select(Key.word, Key).filter(Key.language == language)
                 ).all()
                 keys = dict(keys)
-                definitions = DefinitionSelector().by_language(language).all(session)
-
-                for definition in definitions:
-                    keys_str = get_unique_keys_strings(definition.body)
-                    keys_obj = [keys.get(key) for key in keys_str]
-                    definition.keys.extend(keys_obj)
+                definitions = (
+                    DefinitionSelector()
+                    .by_language(language)
+                    .order_by(Definition.id)
+                    .all(session)
+                )
+                # batches are numbered per language
+                stage = f"link_keys_{language}"
+                self.commit_batches(
+                    session, stage, definitions, partial(self._link_keys_of, keys)
+                )
+                metrics.add_rows(len(definitions))
+            self.checkpoint.mark(session, "link_keys")
             session.commit()
 
+    @staticmethod
+    def _link_keys_of(keys, definitions):
+        for definition in definitions:
+            keys_str = get_unique_keys_strings(definition.body)
+            keys_obj = [keys.get(key) for key in keys_str]
+            definition.keys.extend(keys_obj)
+
     @logging_time
     def link_authors(self, data: Storage):
         log.info("Linking %s", Author.__name__)
         authors_data = generate_authors_data(data)
 
-        with self.connector.session as session:
+        with self.connector.batch_session as session:
             all_authors = session.execute(select(Author)).scalars().all()
             author_by_abbr = dict(
                 (author.abbreviation, author) for author in all_authors
             )
 
-            for word in WordSelector().all(session):
-                authors_abbrs = authors_data[word.id_old]
-                authors = [author_by_abbr[abbr] for abbr in authors_abbrs]
-                word.authors.extend(authors)
+            def link(words):
+                for word in words:
+                    authors_abbrs = authors_data[word.id_old]
+                    authors = [author_by_abbr[abbr] for abbr in authors_abbrs]
+                    word.authors.extend(authors)
+
+            words = WordSelector().order_by(Word.id).all(session)
+            self.commit_batches(session, "link_authors", words, link)
+            metrics.add_rows(len(words))
 
+            self.checkpoint.mark(session, "link_authors")
             session.commit()
 
     @logging_time
@@ -230,21 +254,35 @@ class SQLiteInterface(DatabaseInterface):
         log.info("Linking Complexes")
         index_used_in = 10
         words = get_source_data_by_index(data, index_used_in)
-        self.link_words(words, generate_complex_children)
+        self.link_words(words, generate_complex_children, "link_complexes")
 
     @logging_time
     def link_affixes(self, data: Storage):
         log.info("Linking Affixes")
         index_affixes = 3
         words = get_source_data_by_index(data, index_affixes)
-        self.link_words(words, generate_djifoa_children)
-
-    def link_words(self, words, generate_children_func):
-        with self.connector.session as session:
-            for w in words:
-                parents = WordSelector().filter(Word.id_old == int(w[0])).all(session)
-
-                for parent in parents:
+        self.link_words(words, generate_djifoa_children, "link_affixes")
+
+    def link_words(self, words, generate_children_func, stage: str):
+        with self.connector.batch_session as session:
+
+            def link(chunk):
+                old_ids = [int(w[0]) for w in chunk]
+                parents_by_old_id = defaultdict(list)
+                for parent in (
+                    WordSelector().filter(Word.id_old.in_(old_ids)).all(session)
+                ):
+                    parents_by_old_id[parent.id_old].append(parent)
+
+                for w in chunk:
+                    parents = parents_by_old_id.get(int(w[0]))
+                    if not parents:
+                        continue
                     children = generate_children_func(w, session)
-                    parent.derivatives.extend(children)
+                    for parent in parents:
+                        parent.derivatives.extend(children)
+
+            self.commit_batches(session, stage, words, link)
+            self.checkpoint.mark(session, stage)
             session.commit()
+        metrics.add_rows(len(words))
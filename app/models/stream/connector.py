@@ -0,0 +1,25 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring
+import os
+
+from app.models.text.connector import TextConnector
+
+
+class StreamConnector(TextConnector):
+    """
+    Connector to a directory with one <table name>.<extension> file per table,
+    optionally gzip or zstd compressed (.gz, .zst).
+    The directory is created when importing.
+    """
+
+    def __init__(self, path: str, importing: bool = False):
+        if importing and path:
+            os.makedirs(path, exist_ok=True)
+        super().__init__(path, importing)
+
+
+class JsonLinesConnector(StreamConnector):
+    EXTENSION = "jsonl"
+
+
+class MessagePackConnector(StreamConnector):
+    EXTENSION = "msgpack"
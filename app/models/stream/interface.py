@@ -0,0 +1,132 @@
+# pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from __future__ import annotations
+
+import importlib
+import json
+import os
+from abc import abstractmethod
+from typing import IO, Any, Iterable, Iterator
+
+from app.compression import compressed_path, open_compressed
+from app.instrumentation import metrics
+from app.interface import DatabaseInterface
+from app.models.stream.connector import StreamConnector
+from app.properties import DEFAULT_TABLE_PROPERTIES_COLLECTION
+from app.storage import Storage
+from logger import logging, logging_time
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
+
+WRITE_BATCH = 1000
+
+
+class StreamInterface(DatabaseInterface):
+    """
+    Writes and reads tables row by row as records with typed fields
+    named after TableProperties.columns, so memory use does not depend
+    on the size of a table. Subclasses define the record encoding.
+    """
+
+    def __init__(
+        self,
+        connector: StreamConnector,
+        compression: str | None = None,
+        threads: int = 0,
+    ):
+        """
+        Parameters:
+            connector (StreamConnector): Connector to the directory of tables.
+            compression (str | None): "gzip" or "zstd" for written files.
+                Read files are decompressed according to their suffix.
+            threads (int): zstd compression threads, see open_compressed.
+        """
+        self.connector = connector
+        self.compression = compression
+        self.threads = threads
+        self.columns = {
+            properties.name: properties.columns
+            for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION
+        }
+
+    @abstractmethod
+    def encode_records(self, records: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+        """Encodes the records one by one."""
+
+    @abstractmethod
+    def read_records(self, file: IO[bytes]) -> Iterator[dict[str, Any]]:
+        """Decodes the records of the binary file one by one."""
+
+    def read_table(self, name: str) -> Iterator[list[Any]]:
+        """
+        Streams the rows of a table in the column order of its properties.
+        """
+        columns = self.columns[name]
+        with open_compressed(self.connector.path_by_name(name), "rb") as file:
+            for record in self.read_records(file):
+                yield [record.get(column) for column in columns]
+
+    @logging_time
+    def export_data(self) -> Storage:
+        s = Storage()
+        for name in s.names:
+            with metrics.stage(f"export_{name}"):
+                s.ingest(name, self.read_table(name))
+                metrics.add_rows(len(s.container_by_name(name)))
+            log.info("Exported %s %s items\n", len(s.container_by_name(name)), name)
+        return s
+
+    @logging_time
+    def import_data(self, data: Storage):
+        for container in data.containers:
+            columns = self.columns[container.name]
+            file_name = f"{container.name}.{self.connector.EXTENSION}"
+            path = compressed_path(
+                os.path.join(self.connector.path, file_name), self.compression
+            )
+            with open_compressed(
+                path, "wb", self.compression, threads=self.threads
+            ) as file:
+                records = (dict(zip(columns, row)) for row in container)
+                self.write_encoded(file, self.encode_records(records))
+            metrics.add_rows(len(container))
+            log.info("Imported %s %s items\n", len(container), container.name)
+
+    @staticmethod
+    def write_encoded(file: IO[bytes], chunks: Iterable[bytes]):
+        """Writes encoded records in batches of WRITE_BATCH."""
+        batch = []
+        for chunk in chunks:
+            batch.append(chunk)
+            if len(batch) == WRITE_BATCH:
+                file.write(b"".join(batch))
+                batch = []
+        file.write(b"".join(batch))
+
+
+class JsonLinesInterface(StreamInterface):
+    """One JSON object per line."""
+
+    def encode_records(self, records: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        for record in records:
+            yield f"{encoder.encode(record)}\n".encode("utf-8")
+
+    def read_records(self, file: IO[bytes]) -> Iterator[dict[str, Any]]:
+        decoder = json.JSONDecoder()
+        for line in file:
+            if line.strip():
+                yield decoder.decode(line.decode("utf-8"))
+
+
+class MessagePackInterface(StreamInterface):
+    """A stream of MessagePack maps. Requires the msgpack package."""
+
+    def encode_records(self, records: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+        packer = importlib.import_module("msgpack").Packer()
+        for record in records:
+            yield packer.pack(record)
+
+    def read_records(self, file: IO[bytes]) -> Iterator[dict[str, Any]]:
+        msgpack = importlib.import_module("msgpack")
+        yield from msgpack.Unpacker(file, raw=False)
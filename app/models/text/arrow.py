@@ -0,0 +1,101 @@
+"""
+This module reads LOD text tables with the vectorised CSV reader of pyarrow.
+
+pyarrow is an optional dependency: `pyarrow_available()` tells whether it is
+installed, and TextInterface falls back to the pure Python reader otherwise.
+
+Tables are read without quoting or header, integer and boolean columns are
+parsed by pyarrow, and the resulting rows go through the usual TableContainer
+conversion plan, where already typed values pass through. The first and last
+columns stay strings and are trimmed, like `line.strip()` does.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import Any
+
+from app.properties import TableProperties
+from app.table_container_functions import prepared_types
+
+TRUE_VALUES = ["true", "True", "TRUE"]
+FALSE_VALUES = ["false", "False", "FALSE"]
+
+
+def pyarrow_available() -> bool:
+    """
+    Returns:
+        bool: Whether the optional pyarrow package is installed.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def column_type(types: tuple[type, ...], edge: bool):
+    """Returns the pyarrow type to read a column of the prepared types as."""
+    import pyarrow  # pylint: disable=import-outside-toplevel
+
+    if edge:
+        return pyarrow.string()
+    if bool in types:
+        return pyarrow.bool_()
+    if int in types:
+        return pyarrow.int64()
+    return pyarrow.string()
+
+
+def read_table(
+    path: str, table_properties: TableProperties, separator: str
+) -> list[list[Any]]:
+    """
+    Reads a text table into rows of python values.
+    Parameters:
+        path (str): Path to the text table.
+        table_properties (TableProperties): Properties of the table.
+        separator (str): The field separator.
+    Returns:
+        list[list[Any]]: Rows ready for TableContainer.ingest.
+    Raises:
+        ValueError: If a line does not fit the number or types of columns.
+    """
+    # pylint: disable=import-outside-toplevel
+    import pyarrow
+    from pyarrow import compute, csv
+
+    pattern = [prepared_types(types) for types in table_properties.pattern]
+    names = [f"f{index}" for index in range(len(pattern))]
+    last = len(pattern) - 1
+    try:
+        table = csv.read_csv(
+            path,
+            read_options=csv.ReadOptions(column_names=names, encoding="utf-8"),
+            parse_options=csv.ParseOptions(
+                delimiter=separator,
+                quote_char=False,
+                double_quote=False,
+                escape_char=False,
+                ignore_empty_lines=True,
+            ),
+            convert_options=csv.ConvertOptions(
+                column_types={
+                    name: column_type(types, index in (0, last))
+                    for index, (name, types) in enumerate(zip(names, pattern))
+                },
+                null_values=[""],
+                strings_can_be_null=False,
+                true_values=TRUE_VALUES,
+                false_values=FALSE_VALUES,
+            ),
+        )
+    except pyarrow.ArrowInvalid as error:
+        raise ValueError(
+            f"Table '{table_properties.name}' is not suitable: {error}"
+        ) from error
+
+    columns = [column.to_pylist() for column in table.columns]
+    for index in (0, last):
+        # generated compute functions are unknown to pylint
+        trimmed = compute.utf8_trim_whitespace(  # pylint: disable=no-member
+            table.column(index)
+        )
+        columns[index] = trimmed.to_pylist()
+    return [list(row) for row in zip(*columns)]
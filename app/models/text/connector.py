@@ -3,12 +3,14 @@ import os
 
 from sqlalchemy.orm import Session
 
+from app.compression import SUFFIXES, open_compressed
 from app.connector import DatabaseConnector
 from app.storage import Storage
 
 
 class TextConnector(DatabaseConnector):
     EXTENSION = "txt"
+    SUFFIXES: tuple[str, ...] = ("", *SUFFIXES.values())
 
     @property
     def session(self) -> Session:
@@ -60,7 +62,7 @@ class TextConnector(DatabaseConnector):
         missing_files = [
             string
             for string in Storage().names
-            if not any(file.endswith(f"{string}.{cls.EXTENSION}") for file in files)
+            if not any(cls.is_table_file(file, string) for file in files)
         ]
 
         if missing_files:
@@ -76,9 +78,22 @@ class TextConnector(DatabaseConnector):
         return [
             os.path.join(self.path, file)
             for file in os.listdir(self.path)
-            if file.endswith(f".{self.EXTENSION}")
+            if any(
+                file.endswith(f".{self.EXTENSION}{suffix}") for suffix in self.SUFFIXES
+            )
         ]
 
+    @classmethod
+    def is_table_file(cls, file_name: str, name: str) -> bool:
+        """
+        Checks if the file name belongs to the table with the given name,
+        with any of the supported suffixes (e.g. compression extensions).
+        """
+        return any(
+            file_name.endswith(f"{name}.{cls.EXTENSION}{suffix}")
+            for suffix in cls.SUFFIXES
+        )
+
     def path_by_name(self, name: str) -> str:
         """
         Returns the file path associated with the given name.
@@ -90,7 +105,7 @@ class TextConnector(DatabaseConnector):
             FileNotFoundError: If the file with the given name is not found.
         """
         for file_path in self.files_paths:
-            if file_path.endswith(f"{name}.{self.EXTENSION}"):
+            if self.is_table_file(file_path, name):
                 return file_path
         raise FileNotFoundError(f"File '{name}' not found.")
 
@@ -101,5 +116,5 @@ class TextConnector(DatabaseConnector):
         Returns:
             str: The content of the file.
         """
-        with open(self.path_by_name(name), mode="r", encoding="utf-8") as file:
+        with open_compressed(self.path_by_name(name), "rt") as file:
             return file.read()
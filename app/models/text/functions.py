@@ -0,0 +1,93 @@
+# pylint: disable=missing-module-docstring
+from __future__ import annotations
+
+import io
+import os
+from typing import NamedTuple
+
+from app.compression import detect_compression, open_compressed
+from app.properties import TableProperties
+from app.table_container import TableContainer
+
+CHUNK_SIZE = 8 * 2**20
+PARSERS = ("python", "arrow")
+
+
+class TextOptions(NamedTuple):
+    """
+    How TextInterface reads and writes tables.
+    Attributes:
+        workers (int | None): Number of processes parsing the tables,
+            0 for one per CPU. None or 1 parses in this process.
+        chunk_size (int): Approximate size in bytes of the parts
+            large tables are split into for parallel parsing.
+        parser (str): "python" or "arrow" for the vectorised pyarrow
+            reader, which falls back to "python" if pyarrow is absent
+            and takes precedence over workers.
+        compression (str | None): "gzip" or "zstd" to compress written
+            tables. Read tables are decompressed according to their suffix.
+        threads (int): zstd compression threads per table, -1 for one
+            per CPU. Compressed tables are also written concurrently.
+    """
+
+    workers: int | None = None
+    chunk_size: int = CHUNK_SIZE
+    parser: str = "python"
+    compression: str | None = None
+    threads: int = -1
+
+
+def chunk_offsets(
+    path: str, chunk_size: int = CHUNK_SIZE
+) -> list[tuple[int, int | None]]:
+    """
+    Splits a file into byte ranges of about chunk_size bytes,
+    each one starting at the beginning of a line.
+    Compressed files cannot be split and make a single (0, None) range.
+    Parameters:
+        path (str): The file to split.
+        chunk_size (int): Approximate size of a range in bytes.
+    Returns:
+        list[tuple[int, int | None]]: Start and end offsets of the ranges.
+    """
+    if detect_compression(path):
+        return [(0, None)]
+
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, "rb") as file:
+        while offsets[-1] + chunk_size < size:
+            file.seek(offsets[-1] + chunk_size)
+            file.readline()
+            if file.tell() >= size:
+                break
+            offsets.append(file.tell())
+    offsets.append(size)
+    return list(zip(offsets, offsets[1:]))
+
+
+def parse_chunk(
+    path: str,
+    start: int,
+    end: int | None,
+    table_properties: TableProperties,
+    separator: str,
+) -> list[list]:
+    """
+    Parses, converts and validates the lines of a byte range of a text table,
+    or of the whole decompressed file if end is None.
+    Runs in worker processes, so it returns plain lists of rows.
+    """
+    container = TableContainer(table_properties)
+    if end is None:
+        with open_compressed(path, "rt") as lines:
+            container.extend(line.strip().split(separator) for line in lines)
+        return list(container)
+
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    with io.TextIOWrapper(io.BytesIO(data), encoding="utf-8") as lines:
+        container.extend(line.strip().split(separator) for line in lines)
+    return list(container)
@@ -1,46 +1,151 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
+from __future__ import annotations
+
+import contextvars
 import datetime
 import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
+from app.compression import compressed_path, open_compressed
+from app.instrumentation import metrics
 from app.interface import DatabaseInterface
 from app.models.text.connector import TextConnector
-from app.properties import ClassName
+from app.models.text.arrow import pyarrow_available, read_table
+from app.models.text.functions import (
+    PARSERS,
+    TextOptions,
+    chunk_offsets,
+    parse_chunk,
+)
+from app.profiling import profiler
+from app.properties import ClassName, DEFAULT_TABLE_PROPERTIES_COLLECTION
 from app.storage import Storage
+from logger import logging, logging_time
+
+log = logging.getLogger(__name__)
+log.level = logging.INFO
 
 
 class TextInterface(DatabaseInterface):
-    def __init__(self, connector: TextConnector):
+    def __init__(self, connector: TextConnector, options: TextOptions | None = None):
+        """
+        Parameters:
+            connector (TextConnector): Connector to the directory of tables.
+            options (TextOptions | None): Parsing, parallelism and compression
+                options, the defaults of TextOptions if None.
+        """
+        options = options or TextOptions()
+        if options.parser not in PARSERS:
+            raise ValueError(
+                f"Unknown parser '{options.parser}', expected one of {PARSERS}"
+            )
+        if options.parser == "arrow" and not pyarrow_available():
+            log.warning("pyarrow is not installed, using the python parser")
+            options = options._replace(parser="python")
+        if options.workers == 0:
+            options = options._replace(workers=os.cpu_count())
+
         self.connector = connector
+        self.options = options
 
+    @logging_time
     def export_data(self) -> Storage:
         """
         Export data from the TextConnector object.
         :return:
         """
+        if self.options.parser == "arrow":
+            return self.export_data_arrow()
+        if self.options.workers and self.options.workers > 1:
+            return self.export_data_parallel()
+
+        s = Storage()
+        with profiler.section("populate_storage_TextConnector"):
+            for class_name in ClassName():
+                path = self.connector.path_by_name(class_name)
+                with open_compressed(path, "rt") as f:
+                    split_lines = [line.strip().split(self.SEPARATOR) for line in f]
+                    s.container_by_name(class_name).extend(split_lines)
+                    metrics.add_rows(len(split_lines))
+        return s
+
+    def export_data_parallel(self) -> Storage:
+        """
+        Parses the tables in a process pool, large tables split into
+        line-aligned chunks, and merges the converted rows into a Storage.
+        """
+        s = Storage()
+        with profiler.section("populate_storage_TextConnector"):
+            with ProcessPoolExecutor(max_workers=self.options.workers) as executor:
+                futures = {}
+                for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION:
+                    path = self.connector.path_by_name(properties.name)
+                    futures[properties.name] = [
+                        executor.submit(
+                            parse_chunk, path, start, end, properties, self.SEPARATOR
+                        )
+                        for start, end in chunk_offsets(path, self.options.chunk_size)
+                    ]
+                for class_name, chunks in futures.items():
+                    container = s.container_by_name(class_name)
+                    for future in chunks:
+                        container.extend_directly(future.result())
+                    metrics.add_rows(len(container))
+        return s
+
+    def export_data_arrow(self) -> Storage:
+        """
+        Reads the tables with the pyarrow CSV reader and converts
+        the typed rows into a Storage.
+        """
         s = Storage()
-        for class_name in ClassName():
-            path = self.connector.path_by_name(class_name)
-            with open(path, "r", encoding="utf-8") as f:
-                split_lines = [
-                    line.strip().split(self.SEPARATOR) for line in f.readlines()
-                ]
-                s.container_by_name(class_name).extend(split_lines)
+        with profiler.section("populate_storage_TextConnector"):
+            for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION:
+                path = self.connector.path_by_name(properties.name)
+                rows = read_table(path, properties, self.SEPARATOR)
+                s.ingest(properties.name, rows)
+                metrics.add_rows(len(rows))
         return s
 
+    @logging_time
     def import_data(self, data: Storage):
         date_marker = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
         full_path = os.path.join(self.connector.path, date_marker)
         if not os.path.exists(full_path):
             os.makedirs(full_path)
 
-        for container_name in data.names:
-            file_content = self.generate_file_content(
-                container_name, data, self.SEPARATOR
-            )
-            file_name = f"{date_marker}_{container_name}.{self.connector.EXTENSION}"
-            file_path = os.path.join(full_path, file_name)
-            with open(file_path, "w", encoding="utf-8") as file:
-                file.write(file_content)
+        if not self.options.compression:
+            for container_name in data.names:
+                self.write_table(full_path, date_marker, container_name, data)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(data.names)) as executor:
+            futures = [
+                # run in a copy of the context, to count rows in the current stage
+                executor.submit(
+                    contextvars.copy_context().run,
+                    self.write_table,
+                    full_path,
+                    date_marker,
+                    container_name,
+                    data,
+                )
+                for container_name in data.names
+            ]
+            for future in futures:
+                future.result()
+
+    def write_table(self, full_path, date_marker, container_name, data):
+        file_content = self.generate_file_content(container_name, data, self.SEPARATOR)
+        file_name = f"{date_marker}_{container_name}.{self.connector.EXTENSION}"
+        file_path = compressed_path(
+            os.path.join(full_path, file_name), self.options.compression
+        )
+        with open_compressed(
+            file_path, "wt", self.options.compression, threads=self.options.threads
+        ) as file:
+            file.write(file_content)
+        metrics.add_rows(len(data.container_by_name(container_name)))
 
     @staticmethod
     def generate_file_content(container_name, data, separator):
@@ -0,0 +1,121 @@
+"""
+This module provides an opt-in profiler hook around Storage population.
+
+The hook is off unless a profiler is chosen with `profiler.configure()`,
+the `--profiler` option of convert.py or the LOD_PROFILER environment
+variable ("cprofile" or "pyinstrument"). Profiles are written to
+LOD_PROFILE_DIR (the current directory by default), one file per section:
+`<section>.prof` for cProfile (readable with pstats or snakeviz) and
+`<section>.html` for pyinstrument.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import importlib
+import os
+from contextlib import contextmanager
+from typing import Iterator
+
+from logger import log
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+
+class Profiler:
+    """
+    Wraps code sections into cProfile or pyinstrument when enabled.
+    Methods:
+        configure: Chooses the profiler and the output directory.
+        section: Context manager profiling the enclosed block.
+    """
+
+    def __init__(self, kind: str | None = None, directory: str | None = None):
+        self.kind: str | None = None
+        self.directory = "."
+        self.configure(kind, directory)
+
+    @classmethod
+    def from_environment(cls) -> Profiler:
+        """
+        Returns:
+            Profiler: A profiler configured by LOD_PROFILER and LOD_PROFILE_DIR.
+        """
+        return cls(os.getenv("LOD_PROFILER") or None, os.getenv("LOD_PROFILE_DIR"))
+
+    def configure(self, kind: str | None, directory: str | None = None):
+        """
+        Parameters:
+            kind (str | None): "cprofile", "pyinstrument" or None to disable.
+            directory (str | None): Where to write profiles.
+        Raises:
+            ValueError: If the profiler is unknown.
+            ImportError: If pyinstrument is chosen but not installed.
+        """
+        if kind is not None and kind not in PROFILERS:
+            raise ValueError(f"Unknown profiler '{kind}', expected one of {PROFILERS}")
+        if kind == "pyinstrument":
+            importlib.import_module("pyinstrument")
+        self.kind = kind
+        self.directory = directory or "."
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Returns:
+            bool: Whether a profiler is chosen.
+        """
+        return self.kind is not None
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """
+        Profiles the enclosed block with the chosen profiler, if any.
+        Parameters:
+            name (str): Name of the section and of its profile file.
+        """
+        if self.kind == "cprofile":
+            with self._cprofile(name):
+                yield
+        elif self.kind == "pyinstrument":
+            with self._pyinstrument(name):
+                yield
+        else:
+            yield
+
+    def path(self, name: str, extension: str) -> str:
+        """
+        Returns:
+            str: The path of the profile of a section, creating its directory.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        return os.path.join(self.directory, f"{name}.{extension}")
+
+    @contextmanager
+    def _cprofile(self, name: str) -> Iterator[None]:
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            path = self.path(name, "prof")
+            profile.dump_stats(path)
+            log.info("Profile of %s written to %s", name, path)
+
+    @contextmanager
+    def _pyinstrument(self, name: str) -> Iterator[None]:
+        pyinstrument = importlib.import_module("pyinstrument")
+        profile = pyinstrument.Profiler()
+        profile.start()
+        try:
+            yield
+        finally:
+            profile.stop()
+            path = self.path(name, "html")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write(profile.output_html())
+            log.info("Profile of %s written to %s", name, path)
+
+
+profiler = Profiler.from_environment()
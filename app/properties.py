@@ -31,9 +31,19 @@ class ClassName:  # pylint: disable=too-few-public-methods
         )
 
 
+class ValidationMode:  # pylint: disable=too-few-public-methods
+    full = "full"
+    sampled = "sampled"
+    none = "none"
+
+    def __iter__(self):
+        return iter((self.full, self.sampled, self.none))
+
+
 class TableProperties(NamedTuple):
     name: str
     pattern: list[Any]
+    columns: tuple[str, ...] = ()
 
 
 DEFAULT_TABLE_PROPERTIES_COLLECTION = (
@@ -44,6 +54,11 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             str | None,     # full_name
             str | None,     # notes
         ],
+        (
+            "abbreviation",
+            "full_name",
+            "notes",
+        ),
     ),
     TableProperties(
         ClassName.events,
@@ -55,6 +70,14 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             str | None,     # annotation
             str | None,     # suffix
         ],
+        (
+            "event_id",
+            "name",
+            "date",
+            "definition",
+            "annotation",
+            "suffix",
+        ),
     ),
     TableProperties(
         ClassName.types,
@@ -65,6 +88,13 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             bool,           # parentable
             str | None,     # description
         ],
+        (
+            "type_",
+            "type_x",
+            "group",
+            "parentable",
+            "description",
+        ),
     ),
     TableProperties(
         ClassName.words,
@@ -82,6 +112,20 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             str | None,     # usedin
             int | None,     # tid_old
         ],
+        (
+            "old_id",
+            "type",
+            "type_x",
+            "affixes",
+            "match",
+            "source",
+            "year",
+            "rank",
+            "origin",
+            "origin_x",
+            "usedin",
+            "tid_old",
+        ),
     ),
     TableProperties(
         ClassName.word_spells,
@@ -94,6 +138,15 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             int,            # event_end_id
             str | None,     # origin_x
         ],
+        (
+            "old_id",
+            "name",
+            "name_lower",
+            "code_name",
+            "event_start_id",
+            "event_end_id",
+            "origin_x",
+        ),
     ),
     TableProperties(
         ClassName.definitions,
@@ -106,6 +159,15 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             str | None,     # main
             str | None,     # case_tags
         ],
+        (
+            "word_old_id",
+            "position",
+            "usage",
+            "grammar",
+            "body",
+            "main",
+            "case_tags",
+        ),
     ),
     TableProperties(
         ClassName.settings,
@@ -115,6 +177,12 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             int,            # last_word_id
             str,            # db_release
         ],
+        (
+            "date",
+            "db_version",
+            "last_word_id",
+            "db_release",
+        ),
     ),
     TableProperties(
         ClassName.syllables,
@@ -123,5 +191,10 @@ DEFAULT_TABLE_PROPERTIES_COLLECTION = (
             str,            # type
             bool,           # allowed
         ],
+        (
+            "name",
+            "type",
+            "allowed",
+        ),
     ),
 )
@@ -0,0 +1,98 @@
+"""
+This module maps the data types of convert.py to their backends.
+
+Backends are referenced by name and imported only when their type is used,
+so the CLI starts without loading SQLAlchemy dialects, loglan_core or
+optional packages, and a backend whose dependencies are missing (pywin32
+for Access outside Windows, pyarrow, duckdb, msgpack) only fails when it
+is selected.
+
+Functions:
+    load: Imports an object from a "module:name" reference.
+    load_backend: Imports the connector and interface classes of a type.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, NamedTuple
+
+
+class Backend(NamedTuple):
+    """
+    "module:name" references of the connector and interface of a type.
+    """
+
+    connector: str
+    interface: str
+
+
+BACKENDS = {
+    "postgres": Backend(
+        "app.models.postgres.connector:PostgresDatabaseConnector",
+        "app.models.postgres.interface:PostgresInterface",
+    ),
+    "postgres-async": Backend(
+        "app.models.postgres_async.connector:AsyncPostgresDatabaseConnector",
+        "app.models.postgres_async.interface:AsyncPostgresInterface",
+    ),
+    "access": Backend(
+        "app.models.access.connector:AccessDatabaseConnector",
+        "app.models.access.interface:AccessInterface",
+    ),
+    "text": Backend(
+        "app.models.text.connector:TextConnector",
+        "app.models.text.interface:TextInterface",
+    ),
+    "remote-text": Backend(
+        "app.models.remote_text.connector:RemoteTextConnector",
+        "app.models.remote_text.interface:RemoteTextInterface",
+    ),
+    "sqlite": Backend(
+        "app.models.sqlite.connector:SQLiteDatabaseConnector",
+        "app.models.sqlite.interface:SQLiteInterface",
+    ),
+    "parquet": Backend(
+        "app.models.parquet.connector:ParquetConnector",
+        "app.models.parquet.interface:ParquetInterface",
+    ),
+    "duckdb": Backend(
+        "app.models.duckdb.connector:DuckDBConnector",
+        "app.models.duckdb.interface:DuckDBInterface",
+    ),
+    "jsonl": Backend(
+        "app.models.stream.connector:JsonLinesConnector",
+        "app.models.stream.interface:JsonLinesInterface",
+    ),
+    "msgpack": Backend(
+        "app.models.stream.connector:MessagePackConnector",
+        "app.models.stream.interface:MessagePackInterface",
+    ),
+}
+
+
+def load(reference: str) -> Any:
+    """
+    Parameters:
+        reference (str): A "module:name" reference.
+    Returns:
+        Any: The named object of the imported module.
+    """
+    module_name, _, name = reference.partition(":")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def load_backend(type_name: str) -> tuple[type, type]:
+    """
+    Parameters:
+        type_name (str): A type of BACKENDS.
+    Returns:
+        tuple[type, type]: The connector and interface classes.
+    Raises:
+        ValueError: If the type is unknown.
+        ImportError: If a dependency of the backend is missing.
+    """
+    if type_name not in BACKENDS:
+        raise ValueError(f"Unknown type '{type_name}'.")
+    backend = BACKENDS[type_name]
+    return load(backend.connector), load(backend.interface)
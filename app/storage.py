@@ -1,10 +1,12 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Any, Iterable
 
 from app.properties import (
+    ClassName,
     TableProperties,
+    ValidationMode,
     DEFAULT_TABLE_PROPERTIES_COLLECTION,
 )
 from app.table_container import TableContainer
@@ -29,6 +31,8 @@ class Storage:  # pylint: disable=too-many-instance-attributes
         if len(self.containers) != 8:
             raise ValueError("Insufficient table contents generated.")
 
+        self._containers_by_name = {c.name: c for c in self.containers}
+
     def __repr__(self):
         new_line = "\n\t"
         elements = new_line.join([repr(v) + "," for v in self.containers])
@@ -39,8 +43,36 @@ class Storage:  # pylint: disable=too-many-instance-attributes
         return [v.name for v in self.containers]
 
     def container_by_name(self, name) -> TableContainer:
-        for container in self.containers:
-            if container.name == name:
-                return container
+        container = self._containers_by_name.get(name)
+        if container is None:
+            raise ValueError(f"Container '{name}' not found.")
+        return container
+
+    def index(self, name: str, column: str) -> dict[Any, list[Any]]:
+        """Returns the cached TableContainer.index_by of the named container."""
+        return self.container_by_name(name).index_by(column)
+
+    def groups(self, name: str, column: str) -> dict[Any, list[list[Any]]]:
+        """Returns the cached TableContainer.group_by of the named container."""
+        return self.container_by_name(name).group_by(column)
+
+    def word_by_old_id(self, old_id: int) -> list[Any] | None:
+        return self.index(ClassName.words, "old_id").get(old_id)
+
+    def spell_by_name(self, name: str) -> list[Any] | None:
+        return self.index(ClassName.word_spells, "name").get(name)
 
-        raise ValueError(f"Container '{name}' not found.")
+    def spells_by_old_id(self, old_id: int) -> list[list[Any]]:
+        return self.groups(ClassName.word_spells, "old_id").get(old_id, [])
+
+    def definitions_by_word(self, old_id: int) -> list[list[Any]]:
+        return self.groups(ClassName.definitions, "word_old_id").get(old_id, [])
+
+    def ingest(
+        self,
+        name: str,
+        iterable: Iterable[Iterable[Any]],
+        validation: str = ValidationMode.full,
+    ):
+        """Adds items to the named container with TableContainer.ingest."""
+        self.container_by_name(name).ingest(iterable, validation)
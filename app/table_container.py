@@ -8,16 +8,20 @@ Classes:
 
 from __future__ import annotations
 
-from typing import Any, Iterable, SupportsIndex, overload
+from itertools import islice
+from typing import Any, Callable, Iterable, SupportsIndex, overload
 
-from app.properties import TableProperties
+from app.properties import TableProperties, ValidationMode
 from app.table_container_functions import (
     check_proper_pattern,
     prepared_types,
-    convert_element,
+    conversion_plan,
 )
 from logger import log
 
+BATCH_SIZE = 10_000
+SAMPLE_INTERVAL = 100
+
 
 class TableContainer(list):
     """
@@ -25,6 +29,9 @@ class TableContainer(list):
     Methods:
         append_directly: Appends an item to the collection without conversion.
         extend_directly: Extends the collection without conversion.
+        ingest: Extends the collection in batches with configurable validation.
+        index_by: Returns a cached hash index of the rows by a column.
+        group_by: Returns cached groups of the rows by a column.
     Properties:
         number_of_items: Property that returns the number of items in the 'pattern' attribute.
     """
@@ -34,14 +41,16 @@ class TableContainer(list):
         Initializes the object with properties from a TableProperties instance.
         Parameters:
             table_properties (TableProperties): An instance of TableProperties
-            containing order, name, and pattern attributes.
+            containing name, pattern and columns attributes.
         """
         super().__init__()
-        (
-            self.name,
-            self._pattern,
-        ) = table_properties
+        self.name = table_properties.name
+        self._pattern = table_properties.pattern
         self.pattern = [prepared_types(types) for types in self._pattern]
+        self.converters = conversion_plan(self.pattern)
+        self.columns = table_properties.columns
+        # cleared by the mutators, each index kept with the length it was built at
+        self._indexes: dict[tuple[str, str], tuple[int, dict]] = {}
 
     def __repr__(self):
         return f"{self.name}{self.__class__.__name__}({len(self)})"
@@ -101,6 +110,8 @@ class TableContainer(list):
                 f"Item of class '{self.name}' is not suitable for this collection."
             )
         super().append(item_to_append)
+        if self._indexes:
+            self._indexes.clear()
 
     def append_directly(self, item: Iterable[Any]):
         """
@@ -109,6 +120,8 @@ class TableContainer(list):
             item (list[Any]): A list of elements to be appended.
         """
         super().append(item)
+        if self._indexes:
+            self._indexes.clear()
 
     def extend(self, iterable: Iterable[Iterable[Any]]):
         """
@@ -126,6 +139,43 @@ class TableContainer(list):
             iterable: An iterable of list items to append to the list.
         """
         super().extend(iterable)
+        if self._indexes:
+            self._indexes.clear()
+
+    def ingest(
+        self,
+        iterable: Iterable[Iterable[Any]],
+        validation: str = ValidationMode.full,
+        batch_size: int = BATCH_SIZE,
+    ):
+        """
+        Extends the collection with converted items, batch by batch.
+        Sources whose schema already guarantees the types may lower
+        the validation: "sampled" checks every SAMPLE_INTERVAL-th item
+        of a batch, "none" checks nothing. Items are always converted.
+        Parameters:
+            iterable: An iterable of list items to append to the list.
+            validation (str): One of ValidationMode values.
+            batch_size (int): Number of items converted and added at once.
+        Raises:
+            ValueError: If the validation mode is unknown or a checked item
+                is not suitable. Items of the failed batch are not added.
+        """
+        if validation not in ValidationMode():
+            raise ValueError(f"Unknown validation mode '{validation}'.")
+
+        step = SAMPLE_INTERVAL if validation == ValidationMode.sampled else 1
+        items = iter(iterable)
+        while batch := list(islice(items, batch_size)):
+            converted = [self.convert_item_elements(item) for item in batch]
+            checked = converted[::step] if validation != ValidationMode.none else []
+            if not all(self._is_item_suitable(item) for item in checked):
+                raise ValueError(
+                    f"Item of class '{self.name}' is not suitable for this collection."
+                )
+            super().extend(converted)
+            if self._indexes:
+                self._indexes.clear()
 
     def insert(self, index: SupportsIndex, item: Iterable[Any]):
         """
@@ -139,6 +189,8 @@ class TableContainer(list):
         """
         if self._is_item_suitable(item):
             super().insert(index, item)
+            if self._indexes:
+                self._indexes.clear()
         else:
             raise ValueError("Item is not suitable for this collection.")
 
@@ -150,6 +202,8 @@ class TableContainer(list):
             item: The item to insert into the collection.
         """
         super().insert(index, item)
+        if self._indexes:
+            self._indexes.clear()
 
     @overload
     def __setitem__(self, index: SupportsIndex, item: Any) -> None: ...
@@ -196,6 +250,8 @@ class TableContainer(list):
         # Ensure all items in the iterable are suitable for the collection
         if all(self._is_item_suitable(i) for i in item):
             super().__setitem__(index, item)
+            if self._indexes:
+                self._indexes.clear()
         else:
             raise ValueError("One or more items are not suitable for this collection.")
 
@@ -203,20 +259,79 @@ class TableContainer(list):
         if not self._is_item_suitable(item):
             raise ValueError("Item is not suitable for this collection.")
         super().__setitem__(index, item)
+        if self._indexes:
+            self._indexes.clear()
+
+    def index_by(self, column: str) -> dict[Any, list[Any]]:
+        """
+        Returns the rows by the value of a column, built on first use and
+        cached until the collection changes. A repeated value maps to its last row.
+        Parameters:
+            column (str): A column name from TableProperties.columns.
+        Returns:
+            dict: Rows by column value.
+        Raises:
+            ValueError: If the column is unknown.
+        """
+        position = self._column_position(column)
+        return self._cached_index(
+            ("index", column), lambda: {row[position]: row for row in self}
+        )
+
+    def group_by(self, column: str) -> dict[Any, list[list[Any]]]:
+        """
+        Returns the lists of rows sharing each value of a column, in collection
+        order, built on first use and cached until the collection changes.
+        Parameters:
+            column (str): A column name from TableProperties.columns.
+        Returns:
+            dict: Lists of rows by column value.
+        Raises:
+            ValueError: If the column is unknown.
+        """
+        position = self._column_position(column)
+
+        def build():
+            groups: dict[Any, list[list[Any]]] = {}
+            for row in self:
+                groups.setdefault(row[position], []).append(row)
+            return groups
+
+        return self._cached_index(("group", column), build)
+
+    def _column_position(self, column: str) -> int:
+        if column not in self.columns:
+            raise ValueError(f"Unknown column '{column}' of '{self.name}'.")
+        return self.columns.index(column)
+
+    def _cached_index(self, key: tuple[str, str], build: Callable[[], dict]) -> dict:
+        """
+        Returns a cached index, rebuilt if a mutator cleared it or if the
+        length changed through a list method that does not clear it (pop, del).
+        """
+        cached = self._indexes.get(key)
+        if cached is None or cached[0] != len(self):
+            cached = (len(self), build())
+            self._indexes[key] = cached
+        return cached[1]
 
     def convert_item_elements(self, item: Iterable[Any]) -> list[Any]:
         """
-        Converts elements of a list to their respective data types. This static method takes a list
+        Converts elements of a list to their respective data types. This method takes a list
         of elements in a string format and converts each element to its actual data type (integers,
         booleans, or None). If the conversion is not applicable, it returns the element unchanged.
+        The per-column converters of the conversion plan skip values that already
+        have the proper type and columns that need no conversion at all.
         Parameters:
             item (list[Any]): A list of elements to convert.
         Returns:
             list[Any]: A list with elements converted to their proper
                 data types.
         """
-        check_pairs = zip(item, self.pattern)
-        return [convert_element(value, types) for value, types in check_pairs]
+        return [
+            value if convert is None else convert(value)
+            for value, convert in zip(item, self.converters)
+        ]
 
     def is_proper_pattern(self, item: Iterable[Any]) -> bool:
         """
@@ -4,7 +4,7 @@ This module contains functions that are used in the TableContainer class.
 
 from __future__ import annotations
 
-from typing import Iterable, Any, Type, get_args
+from typing import Iterable, Any, Callable, Type, get_args
 
 from logger import log
 
@@ -126,3 +126,60 @@ def is_int(value, types) -> bool:
         bool: True if the value is an integer and belongs to the specified types, False otherwise.
     """
     return int in types and str(value).isdigit()
+
+
+def conversion_plan(
+    pattern: list[tuple[Type, ...]],
+) -> tuple[Callable[[Any], Any] | None, ...]:
+    """
+    Builds a per-column conversion plan from prepared types.
+
+    Each column gets a converter with the same result as `convert_element`
+    for its types, or None when `convert_element` would return every value
+    unchanged. Converters return values that already have the target type
+    without converting them to strings and back.
+
+    Parameters:
+        pattern (list[tuple[Type, ...]]): Prepared types of each column.
+    Returns:
+        tuple: A converter or None for each column.
+    """
+    return tuple(column_converter(types) for types in pattern)
+
+
+def column_converter(types: tuple[Type, ...]) -> Callable[[Any], Any] | None:
+    """
+    Returns a converter equivalent to `convert_element(value, types)`,
+    or None if the conversion is the identity.
+    """
+    nullable = type(None) in types
+    integer = int in types
+    boolean = bool in types
+
+    if not (integer or boolean):
+        return _to_none if nullable else None
+
+    def convert(value):  # pylint: disable=too-many-return-statements
+        if nullable and not value:
+            return None
+        value_type = type(value)
+        if integer:
+            if value_type is int:
+                if value >= 0:
+                    return value
+            elif value_type is str:
+                if value.isdigit():
+                    return int(value)
+            elif str(value).isdigit():
+                return int(str(value))
+        if boolean:
+            if value_type is bool:
+                return value
+            return convert_boolean(value)
+        return value
+
+    return convert
+
+
+def _to_none(value):
+    return value if value else None
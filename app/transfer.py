@@ -1,59 +1,142 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
-from app.models.access.connector import AccessDatabaseConnector
-from app.models.access.interface import AccessInterface
+# Backends are loaded through app.registry when a function is called,
+# so importing this module does not import any of them.
+from app.registry import load_backend
 
-from app.models.postgres.connector import PostgresDatabaseConnector
-from app.models.postgres.interface import PostgresInterface
+DIRECT_COPY_TYPES = ("postgres", "sqlite")
 
-from app.models.text.connector import TextConnector
-from app.models.text.interface import TextInterface
 
-from app.models.sqlite.connector import SQLiteDatabaseConnector
-from app.models.sqlite.interface import SQLiteInterface
-
-
-def storage_from(path, connector, interface):
+def storage_from(path, connector, interface, **options):
     connector = connector(path)
-    interface = interface(connector)
+    interface = interface(connector, **options)
     return interface.export_data()
 
 
-def storage_to(path, storage, connector, interface):
-    connector = connector(path, importing=True)
-    interface = interface(connector)
+def storage_to(path, storage, connector, interface, connector_options=None, **options):
+    connector = connector(path, importing=True, **(connector_options or {}))
+    interface = interface(connector, **options)
     interface.import_data(storage)
 
 
 def storage_from_ac(path):
-    return storage_from(path, AccessDatabaseConnector, AccessInterface)
+    return storage_from(path, *load_backend("access"))
 
 
 def storage_from_pg(path):
-    return storage_from(path, PostgresDatabaseConnector, PostgresInterface)
+    return storage_from(path, *load_backend("postgres"))
+
+
+def storage_from_pg_async(path):
+    return storage_from(path, *load_backend("postgres-async"))
 
 
-def storage_from_txt(path):
-    return storage_from(path, TextConnector, TextInterface)
+def storage_from_txt(path, workers=None, parser="python"):
+    # pylint: disable-next=import-outside-toplevel
+    from app.models.text.functions import TextOptions
+
+    options = TextOptions(workers=workers, parser=parser)
+    return storage_from(path, *load_backend("text"), options=options)
+
+
+def storage_from_remote_txt(path):
+    return storage_from(path, *load_backend("remote-text"))
 
 
 def storage_to_ac(path, storage):
-    return storage_to(path, storage, AccessDatabaseConnector, AccessInterface)
+    return storage_to(path, storage, *load_backend("access"))
+
 
+def storage_to_pg(path, storage, resume=False, shadow=False, bulk=False):
+    return storage_to(
+        path,
+        storage,
+        *load_backend("postgres"),
+        connector_options={"resume": resume, "shadow": shadow, "bulk": bulk},
+    )
 
-def storage_to_pg(path, storage):
-    return storage_to(path, storage, PostgresDatabaseConnector, PostgresInterface)
 
+def storage_to_pg_async(path, storage):
+    return storage_to(path, storage, *load_backend("postgres-async"))
 
-def storage_to_txt(path, storage):
-    return storage_to(path, storage, TextConnector, TextInterface)
+
+def storage_to_txt(path, storage, compression=None):
+    # pylint: disable-next=import-outside-toplevel
+    from app.models.text.functions import TextOptions
+
+    options = TextOptions(compression=compression)
+    return storage_to(path, storage, *load_backend("text"), options=options)
 
 
 def storage_from_sqlite(path):
-    return storage_from(path, SQLiteDatabaseConnector, SQLiteInterface)
+    return storage_from(path, *load_backend("sqlite"))
+
+
+def storage_to_sqlite(path, storage, resume=False):
+    return storage_to(
+        path, storage, *load_backend("sqlite"), connector_options={"resume": resume}
+    )
+
+
+def storage_from_parquet(path):
+    return storage_from(path, *load_backend("parquet"))
+
+
+def storage_to_parquet(path, storage):
+    return storage_to(path, storage, *load_backend("parquet"))
+
+
+def storage_from_duckdb(path):
+    return storage_from(path, *load_backend("duckdb"))
+
+
+def storage_to_duckdb(path, storage):
+    return storage_to(path, storage, *load_backend("duckdb"))
+
+
+def storage_from_jsonl(path):
+    return storage_from(path, *load_backend("jsonl"))
+
+
+def storage_to_jsonl(path, storage, compression=None):
+    return storage_to(path, storage, *load_backend("jsonl"), compression=compression)
+
+
+def storage_from_msgpack(path):
+    return storage_from(path, *load_backend("msgpack"))
+
+
+def storage_to_msgpack(path, storage, compression=None):
+    return storage_to(path, storage, *load_backend("msgpack"), compression=compression)
+
+
+def copy_direct(
+    from_type, from_path, to_type, to_path, *, shadow=False, bulk=False
+):  # pylint: disable=too-many-arguments
+    """
+    Copies between the DIRECT_COPY_TYPES without a Storage.
+    Raises:
+        ValueError: If source and target are the same database, which the
+            target preparation would wipe before it is read.
+    """
+    # pylint: disable=import-outside-toplevel
+    from app.direct_copy import copy_database, database_identity
 
+    source_identity = database_identity(from_type, from_path)
+    if source_identity is not None and source_identity == database_identity(
+        to_type, to_path
+    ):
+        raise ValueError(f"Source and target are the same database: '{to_path}'.")
 
-def storage_to_sqlite(path, storage):
-    return storage_to(path, storage, SQLiteDatabaseConnector, SQLiteInterface)
+    connector_options = (
+        {"shadow": shadow, "bulk": bulk} if to_type == "postgres" else {}
+    )
+    source_connector, _ = load_backend(from_type)
+    target_connector, _ = load_backend(to_type)
+    source = source_connector(from_path)
+    target = target_connector(to_path, importing=True, **connector_options)
+    copy_database(source, target)
+    if to_type == "postgres":
+        target.finish_import()
 
 
 if __name__ == "__main__":
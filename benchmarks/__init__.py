@@ -0,0 +1,5 @@
+"""
+Offline benchmarks of end-to-end conversions on synthetic LOD-shaped data.
+
+Run `python -m benchmarks.run --help` for usage.
+"""
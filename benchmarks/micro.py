@@ -0,0 +1,241 @@
+"""
+Micro-benchmarks of the per-cell hot paths of TableContainer.
+
+Every case is timed with timeit on fixed inputs, taking the minimum of
+`--repeat` batches, so results are comparable between runs on the same
+machine. Container cases run for each class given with `--container`
+(`module:Class`, TableContainer by default) to compare implementations.
+
+Usage:
+    python -m benchmarks.micro
+    python -m benchmarks.micro --container app.table_container:TableContainer \
+        my_module:FastContainer --json micro.json
+    python -m benchmarks.micro --profiler cprofile --words 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import platform
+import sys
+import timeit
+from types import NoneType
+from typing import Callable, NamedTuple
+
+from app.profiling import PROFILERS, Profiler
+from app.properties import (
+    ClassName,
+    DEFAULT_TABLE_PROPERTIES_COLLECTION,
+    ValidationMode,
+)
+from app.storage import Storage
+from app.table_container import TableContainer
+from app.table_container_functions import (
+    check_proper_pattern,
+    column_converter,
+    convert_boolean,
+    convert_element,
+    is_int,
+)
+from benchmarks.synthetic import generate_tables, word_row
+
+DEFAULT_CONTAINER = "app.table_container:TableContainer"
+WORDS_PROPERTIES = next(
+    properties
+    for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION
+    if properties.name == ClassName.words
+)
+
+
+class Case(NamedTuple):
+    """A timed callable and the number of cells it processes per call."""
+
+    name: str
+    func: Callable[[], object]
+    cells: int
+
+
+class Timing(NamedTuple):
+    """Best time of a case, per call and per cell."""
+
+    case: str
+    container: str | None
+    number: int
+    seconds_per_call: float
+    nanoseconds_per_cell: float
+
+
+def load_container(reference: str) -> type[TableContainer]:
+    """Imports a container class from a "module:Class" reference."""
+    module_name, _, class_name = reference.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def function_cases() -> list[Case]:
+    """Returns the cases of the per-cell conversion functions."""
+    words = TableContainer(WORDS_PROPERTIES)
+    row = words.convert_item_elements(word_row(1, 10))
+    to_int = column_converter((int,))
+    to_bool = column_converter((bool,))
+    return [
+        Case("convert_element[int]", lambda: convert_element("1234", (int,)), 1),
+        Case(
+            "convert_element[none]",
+            lambda: convert_element("", (str, NoneType)),
+            1,
+        ),
+        Case("convert_element[bool]", lambda: convert_element("True", (bool,)), 1),
+        Case("convert_element[str]", lambda: convert_element("bakso", (str,)), 1),
+        Case("convert_element[typed int]", lambda: convert_element(1234, (int,)), 1),
+        Case("column_converter[int]", lambda: to_int("1234"), 1),
+        Case("column_converter[typed int]", lambda: to_int(1234), 1),
+        Case("column_converter[bool]", lambda: to_bool("True"), 1),
+        Case("is_int", lambda: is_int("1234", (int,)), 1),
+        Case("convert_boolean", lambda: convert_boolean("False"), 1),
+        Case(
+            "check_proper_pattern[Words]",
+            lambda: check_proper_pattern(row, words.pattern),
+            len(row),
+        ),
+    ]
+
+
+def container_cases(container_class: type[TableContainer]) -> list[Case]:
+    """Returns the cases of row conversion and population of a container class."""
+    raw = word_row(1, 10)
+    container = container_class(WORDS_PROPERTIES)
+    typed = container.convert_item_elements(raw)
+    tables = generate_tables(100)
+    table_cells = sum(len(row) for rows in tables.values() for row in rows)
+
+    def append():
+        if len(container) > 100_000:
+            container.clear()
+        container.append(raw)
+
+    def populate():
+        containers = container_class.generate_containers(
+            DEFAULT_TABLE_PROPERTIES_COLLECTION
+        )
+        for table in containers:
+            table.extend(tables[table.name])
+
+    def ingest():
+        containers = container_class.generate_containers(
+            DEFAULT_TABLE_PROPERTIES_COLLECTION
+        )
+        for table in containers:
+            table.ingest(tables[table.name], ValidationMode.sampled)
+
+    return [
+        Case(
+            "convert_item_elements[Words]",
+            lambda: container.convert_item_elements(raw),
+            len(raw),
+        ),
+        Case(
+            "convert_item_elements[Words, typed]",
+            lambda: container.convert_item_elements(typed),
+            len(raw),
+        ),
+        Case("append[Words]", append, len(raw)),
+        Case("populate[100 words]", populate, table_cells),
+        Case("ingest[100 words, sampled]", ingest, table_cells),
+    ]
+
+
+def time_case(case: Case, repeat: int, number: int | None = None) -> Timing:
+    """Times a case, calibrating the calls per batch if number is None."""
+    timer = timeit.Timer(case.func)
+    if number is None:
+        number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return Timing(case.name, None, number, best, best * 1e9 / case.cells)
+
+
+def run(
+    containers: list[str], repeat: int = 5, number: int | None = None
+) -> list[Timing]:
+    """Times the function cases and the cases of every container class."""
+    timings = [time_case(case, repeat, number) for case in function_cases()]
+    for reference in containers:
+        container_class = load_container(reference)
+        timings.extend(
+            time_case(case, repeat, number)._replace(container=reference)
+            for case in container_cases(container_class)
+        )
+    return timings
+
+
+def profile_population(kind: str, directory: str | None, words: int):
+    """
+    Profiles population of a Storage with a synthetic dictionary.
+    """
+    tables = generate_tables(words)
+    with Profiler(kind, directory).section(f"populate_storage_{words}_words"):
+        storage = Storage()
+        for name, rows in tables.items():
+            storage.container_by_name(name).extend(rows)
+
+
+def generate_parser():
+    """Returns the command line parser of the micro-benchmarks."""
+    parser = argparse.ArgumentParser(
+        description="Micro-benchmarks of TableContainer hot paths"
+    )
+    parser.add_argument(
+        "--container",
+        nargs="+",
+        default=[DEFAULT_CONTAINER],
+        help="container classes to compare, as module:Class",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed batches")
+    parser.add_argument(
+        "--number", type=int, help="calls per batch (calibrated if omitted)"
+    )
+    parser.add_argument("--json", help="write timings as JSON to the path")
+    parser.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        help="profile Storage population instead of timing the cases",
+    )
+    parser.add_argument("--profile-dir", help="directory of the profiles")
+    parser.add_argument(
+        "--words", type=int, default=10_000, help="words of the profiled dictionary"
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Prints the timings, or profiles Storage population with --profiler."""
+    args = generate_parser().parse_args(argv)
+    logging.disable(logging.INFO)
+
+    if args.profiler:
+        profile_population(args.profiler, args.profile_dir, args.words)
+        return 0
+
+    timings = run(args.container, args.repeat, args.number)
+    for timing in timings:
+        print(
+            f"{timing.case:<38} {timing.container or '':<40} "
+            f"{timing.seconds_per_call * 1e6:>10.3f} us/call "
+            f"{timing.nanoseconds_per_cell:>9.1f} ns/cell"
+        )
+
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timings": [timing._asdict() for timing in timings],
+        }
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
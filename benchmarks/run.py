@@ -0,0 +1,328 @@
+"""
+Benchmark runner for end-to-end conversions on synthetic dictionaries.
+
+Scenarios:
+    storage: Storage construction from raw text rows (conversion and validation).
+    text-sqlite: Text tables imported into a new SQLite database.
+    sqlite-text: SQLite database exported to text tables.
+    text-snapshot: Text tables exported to a dated text snapshot.
+
+Each scenario is timed on fresh inputs, keeping the best of `--repeat` runs,
+and measured once more with tracemalloc for its peak memory. Results are
+appended to a JSON lines history and compared with the median of previous
+runs of the same scenario and scale to detect regressions.
+
+Usage:
+    python -m benchmarks.run --words 10000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Callable, NamedTuple
+
+from app.instrumentation import metrics
+from app.models.sqlite.connector import SQLiteDatabaseConnector
+from app.models.sqlite.interface import SQLiteInterface
+from app.models.text.connector import TextConnector
+from app.models.text.interface import TextInterface
+from app.storage import Storage
+from benchmarks.synthetic import generate_tables, write_text_tables
+
+DEFAULT_HISTORY = os.path.join(os.path.dirname(__file__), "history.jsonl")
+DEFAULT_WORDS = (10_000,)
+HISTORY_WINDOW = 5
+MAX_SLOWDOWN = 0.2
+MAX_MEMORY_GROWTH = 0.2
+
+
+class Scenario(NamedTuple):
+    """A named conversion whose prepare function returns the timed callable."""
+
+    name: str
+    prepare: Callable[[str, dict], Callable[[], None]]
+
+
+class Result(NamedTuple):
+    """Best timing and peak memory of a scenario at one dictionary size."""
+
+    scenario: str
+    words: int
+    rows: int
+    duration: float
+    rows_per_second: float
+    peak_memory: int
+    stages: list
+
+
+def prepare_storage(_: str, tables: dict) -> Callable[[], None]:
+    """Times populating a Storage from the raw rows."""
+
+    def run():
+        storage = Storage()
+        for name, rows in tables.items():
+            storage.container_by_name(name).extend(rows)
+
+    return run
+
+
+def prepare_text_to_sqlite(directory: str, tables: dict) -> Callable[[], None]:
+    """Writes text tables, then times their import into a new SQLite database."""
+    source = write_text_tables(tables, os.path.join(directory, "source"))
+    target = os.path.join(directory, "target.db")
+
+    def run():
+        storage = TextInterface(TextConnector(source)).export_data()
+        SQLiteInterface(SQLiteDatabaseConnector(target, importing=True)).import_data(
+            storage
+        )
+
+    return run
+
+
+def prepare_sqlite_to_text(directory: str, tables: dict) -> Callable[[], None]:
+    """Builds a SQLite database, then times its export to text tables."""
+    source = os.path.join(directory, "source.db")
+    prepare_text_to_sqlite(directory, tables)()
+    os.replace(os.path.join(directory, "target.db"), source)
+    target = os.path.join(directory, "export")
+    os.makedirs(target)
+
+    def run():
+        storage = SQLiteInterface(SQLiteDatabaseConnector(source)).export_data()
+        TextInterface(TextConnector(target, importing=True)).import_data(storage)
+
+    return run
+
+
+def prepare_text_to_snapshot(directory: str, tables: dict) -> Callable[[], None]:
+    """Writes text tables, then times a text to text round trip."""
+    source = write_text_tables(tables, os.path.join(directory, "source"))
+    target = os.path.join(directory, "snapshots")
+    os.makedirs(target)
+
+    def run():
+        storage = TextInterface(TextConnector(source)).export_data()
+        TextInterface(TextConnector(target, importing=True)).import_data(storage)
+
+    return run
+
+
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario("storage", prepare_storage),
+        Scenario("text-sqlite", prepare_text_to_sqlite),
+        Scenario("sqlite-text", prepare_sqlite_to_text),
+        Scenario("text-snapshot", prepare_text_to_snapshot),
+    )
+}
+
+
+def measure(scenario: Scenario, tables: dict, track_memory: bool) -> dict:
+    """
+    Runs the scenario once on fresh inputs and returns the metrics report.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        run = scenario.prepare(directory, tables)
+        metrics.enable(track_memory=track_memory)
+        try:
+            with metrics.stage(scenario.name):
+                run()
+            return metrics.report()
+        finally:
+            metrics.disable()
+
+
+def run_scenario(scenario: Scenario, words: int, repeat: int = 3) -> Result:
+    """
+    Keeps the fastest of `repeat` untraced runs and measures peak memory
+    in one more run with tracemalloc.
+    """
+    tables = generate_tables(words)
+    reports = [measure(scenario, tables, track_memory=False) for _ in range(repeat)]
+    best = min(reports, key=lambda report: report["stages"][0]["duration"])
+    memory = measure(scenario, tables, track_memory=True)
+
+    duration = best["stages"][0]["duration"]
+    rows = sum(len(rows) for rows in tables.values())
+    return Result(
+        scenario=scenario.name,
+        words=words,
+        rows=rows,
+        duration=duration,
+        rows_per_second=round(rows / duration, 1),
+        peak_memory=memory["peak_memory"],
+        stages=best["stages"][1:],
+    )
+
+
+def read_history(path: str) -> list[dict]:
+    """Reads the recorded results, one JSON object per line."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def append_history(path: str, results: list[Result]):
+    """Records the results with the commit, Python version and platform."""
+    environment = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "commit": current_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+    with open(path, "a", encoding="utf-8") as file:
+        for result in results:
+            file.write(json.dumps({**environment, **result._asdict()}) + "\n")
+
+
+def current_commit() -> str | None:
+    """Returns the short hash of HEAD, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def find_regressions(
+    result: Result,
+    history: list[dict],
+    max_slowdown: float = MAX_SLOWDOWN,
+    max_memory_growth: float = MAX_MEMORY_GROWTH,
+) -> list[str]:
+    """
+    Compares the result with the median of the last runs of the same
+    scenario and scale.
+    Returns:
+        list[str]: Descriptions of exceeded thresholds.
+    """
+    previous = [
+        record
+        for record in history
+        if record["scenario"] == result.scenario and record["words"] == result.words
+    ][-HISTORY_WINDOW:]
+    if not previous:
+        return []
+
+    regressions = []
+    throughput = statistics.median(record["rows_per_second"] for record in previous)
+    if result.rows_per_second < throughput * (1 - max_slowdown):
+        regressions.append(
+            f"{result.scenario} ({result.words} words): "
+            f"{result.rows_per_second:.0f} rows/s, median {throughput:.0f} rows/s"
+        )
+    memory = statistics.median(record["peak_memory"] for record in previous)
+    if memory and result.peak_memory > memory * (1 + max_memory_growth):
+        regressions.append(
+            f"{result.scenario} ({result.words} words): "
+            f"peak memory {result.peak_memory} B, median {memory:.0f} B"
+        )
+    return regressions
+
+
+def generate_parser():
+    """Returns the command line parser of the runner."""
+    parser = argparse.ArgumentParser(
+        description="Benchmarks of conversions on synthetic dictionaries"
+    )
+    parser.add_argument(
+        "--words",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_WORDS),
+        help="dictionary sizes in words",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="scenarios to run",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="keep the converter logs"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="history file")
+    parser.add_argument(
+        "--no-record", action="store_true", help="do not append results to history"
+    )
+    parser.add_argument(
+        "--accept",
+        action="store_true",
+        help="record the results even if they regress, as the new reference",
+    )
+    parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=MAX_SLOWDOWN,
+        help="tolerated throughput drop against history, as a fraction",
+    )
+    parser.add_argument(
+        "--max-memory-growth",
+        type=float,
+        default=MAX_MEMORY_GROWTH,
+        help="tolerated peak memory growth against history, as a fraction",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the benchmarks and records them in the history. Regressed runs are
+    recorded only with --accept, so they do not lower the reference medians.
+    Returns:
+        int: 1 if a regression was found and not accepted, else 0.
+    """
+    args = generate_parser().parse_args(argv)
+    if not args.verbose:
+        logging.disable(logging.INFO)
+    history = read_history(args.history)
+
+    results, regressions = [], []
+    for words in args.words:
+        for name in args.scenarios:
+            result = run_scenario(SCENARIOS[name], words, args.repeat)
+            results.append(result)
+            regressions.extend(
+                find_regressions(
+                    result, history, args.max_slowdown, args.max_memory_growth
+                )
+            )
+            print(
+                f"{result.scenario:<14} {result.words:>8} words "
+                f"{result.duration:>9.3f} s {result.rows_per_second:>12.1f} rows/s "
+                f"{result.peak_memory / 2 ** 20:>9.1f} MiB"
+            )
+
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    if regressions and not args.accept:
+        if not args.no_record:
+            print("Results not recorded, rerun with --accept to record them")
+        return 1
+
+    if not args.no_record:
+        append_history(args.history, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+# pylint: disable=missing-function-docstring
+"""
+This module generates synthetic dictionaries shaped like the LOD text tables.
+
+Every table of DEFAULT_TABLE_PROPERTIES_COLLECTION gets a row factory producing
+the raw string fields of a text line. The data is consistent enough to pass
+a full import: types, authors and events referenced by words exist, affixes
+and complexes linked by words exist, and every definition has a grammar.
+
+Functions:
+    generate_tables: Generates the rows of all tables for a number of words.
+    write_text_tables: Writes generated tables as LOD text files.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Callable, Iterator
+
+from app.properties import ClassName, DEFAULT_TABLE_PROPERTIES_COLLECTION
+
+SEPARATOR = "@"
+CONSONANTS = "bcdfgjklmnprstvz"
+VOWELS = "aeiou"
+AUTHORS_COUNT = 20
+EVENTS_COUNT = 10
+FIRST_YEAR = 1975
+BLOCK = 10  # each block of ten words holds one affix, four primitives, five complexes
+
+TYPES = (
+    ("Afx", "Affix", "Afx", "False", "Affix"),
+    ("C-Prim", "Predicate", "Prim", "True", "Composite Primitive"),
+    ("2-Cpx", "Predicate", "Cpx", "True", "Two-term Complex"),
+)
+
+
+def syllables(number: int, length: int = 2) -> str:
+    """Spells a number as a unique sequence of CV syllables."""
+    base = len(CONSONANTS) * len(VOWELS)
+    result = []
+    for _ in range(length):
+        number, rest = divmod(number, base)
+        result.append(CONSONANTS[rest // len(VOWELS)] + VOWELS[rest % len(VOWELS)])
+    while number:
+        number, rest = divmod(number, base)
+        result.append(CONSONANTS[rest // len(VOWELS)] + VOWELS[rest % len(VOWELS)])
+    return "".join(reversed(result))
+
+
+def word_type(old_id: int) -> tuple[str, ...]:
+    position = old_id % BLOCK
+    if position == 0:
+        return TYPES[0]
+    return TYPES[1] if position < 5 else TYPES[2]
+
+
+def word_name(old_id: int) -> str:
+    type_ = word_type(old_id)[0]
+    if type_ == "Afx":
+        return f"{syllables(old_id, 1)}r-"
+    if type_ == "C-Prim":
+        return f"{syllables(old_id)}a"
+    return f"{syllables(old_id)}lo"
+
+
+def affix_of(old_id: int) -> int | None:
+    """Returns the old_id of the affix of the block, if it exists."""
+    affix = old_id - old_id % BLOCK
+    return affix or None
+
+
+def complexes_of(old_id: int, words: int) -> list[int]:
+    start = old_id - old_id % BLOCK + 5
+    return [i for i in (start, start + 1) if i <= words]
+
+
+def author_row(index: int, _: int) -> list[str]:
+    return [f"AU{index}", f"Author {index}", "" if index % 2 else "Notes"]
+
+
+def event_row(index: int, _: int) -> list[str]:
+    date = f"{index % 12 + 1:02d}/{index % 28 + 1:02d}/{FIRST_YEAR + index}"
+    return [
+        str(index),
+        f"Event {index}",
+        date,
+        f"Definition of event {index}",
+        f"Event{index}",
+        f"E{index}",
+    ]
+
+
+def type_row(index: int, _: int) -> list[str]:
+    return list(TYPES[index - 1])
+
+
+def word_row(old_id: int, words: int) -> list[str]:
+    type_, type_x = word_type(old_id)[:2]
+    is_prim = type_ == "C-Prim"
+    author = f"AU{old_id % AUTHORS_COUNT + 1}"
+    if old_id % 3 == 0:
+        author = f"{author}/AU{(old_id + 7) % AUTHORS_COUNT + 1}"
+    year = str(FIRST_YEAR + old_id % 40)
+    affix = affix_of(old_id) if is_prim else None
+    return [
+        str(old_id),
+        type_,
+        type_x,
+        word_name(affix)[:-1] if affix else "",
+        "",
+        author if old_id % 7 else f"{author} (notes)",
+        year if old_id % 11 else f"{year} (notes)",
+        f"{old_id % 9 + 1}+" if is_prim else "",
+        f"{syllables(old_id)} | origin" if is_prim else "",
+        "",
+        (
+            " | ".join(word_name(i) for i in complexes_of(old_id, words))
+            if is_prim
+            else ""
+        ),
+        "",
+    ]
+
+
+def word_spell_rows(old_id: int, _: int) -> Iterator[list[str]]:
+    name = word_name(old_id)
+    code_name = "5" * len(name)
+    if old_id % 50 == 0:
+        old_name = f"{name}h"
+        yield [str(old_id), old_name, old_name, code_name, "1", "2", ""]
+        yield [str(old_id), name, name, code_name, "2", "9999", ""]
+        return
+    yield [
+        str(old_id),
+        name,
+        name,
+        code_name,
+        str(old_id % EVENTS_COUNT + 1),
+        "9999",
+        "",
+    ]
+
+
+def definition_rows(old_id: int, _: int) -> Iterator[list[str]]:
+    type_ = word_type(old_id)[0]
+    grammar = "af" if type_ == "Afx" else f"{old_id % 3 + 1}n"
+    for position in range(1, old_id % 3 + 2):
+        key = f"{syllables(old_id * 3 + position)}y"
+        yield [
+            str(old_id),
+            str(position),
+            "",
+            grammar,
+            f"K is a «{key}» of L, see «{syllables(old_id // 2)}y»",
+            "",
+            "K" if position == 2 else "",
+        ]
+
+
+def setting_row(_: int, words: int) -> list[str]:
+    return ["25.10.2020 05:10:20", "2", str(words), "4.5.9"]
+
+
+def syllable_row(index: int, _: int) -> list[str]:
+    consonant, vowel = divmod(index - 1, len(VOWELS))
+    allowed = "False" if index % 9 == 0 else "True"
+    return [f"{CONSONANTS[consonant]}{VOWELS[vowel]}", "InitialCV", allowed]
+
+
+def _single(factory: Callable[[int, int], list[str]]):
+    def rows(index: int, words: int) -> Iterator[list[str]]:
+        yield factory(index, words)
+
+    return rows
+
+
+ROW_FACTORIES = {
+    ClassName.authors: (_single(author_row), lambda words: AUTHORS_COUNT),
+    ClassName.events: (_single(event_row), lambda words: EVENTS_COUNT),
+    ClassName.types: (_single(type_row), lambda words: len(TYPES)),
+    ClassName.words: (_single(word_row), lambda words: words),
+    ClassName.word_spells: (word_spell_rows, lambda words: words),
+    ClassName.definitions: (definition_rows, lambda words: words),
+    ClassName.settings: (_single(setting_row), lambda words: 1),
+    ClassName.syllables: (
+        _single(syllable_row),
+        lambda words: len(CONSONANTS) * len(VOWELS),
+    ),
+}
+
+
+def generate_tables(words: int) -> dict[str, list[list[str]]]:
+    """
+    Generates raw rows of all tables for the given number of words.
+    Parameters:
+        words (int): Number of words of the dictionary.
+    Returns:
+        dict[str, list[list[str]]]: Rows of string fields by table name.
+    Raises:
+        ValueError: If a row does not match the length of its table pattern.
+    """
+    tables = {}
+    for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION:
+        factory, count = ROW_FACTORIES[properties.name]
+        rows = [
+            row for index in range(1, count(words) + 1) for row in factory(index, words)
+        ]
+        for row in rows:
+            if len(row) != len(properties.pattern):
+                raise ValueError(
+                    f"Row of '{properties.name}' does not fit its pattern."
+                )
+        tables[properties.name] = rows
+    return tables
+
+
+def write_text_tables(tables: dict[str, list[list[str]]], directory: str) -> str:
+    """
+    Writes the tables as LOD text files into the directory.
+    Returns:
+        str: The directory path.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for name, rows in tables.items():
+        path = os.path.join(directory, f"{name}.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("\n".join(SEPARATOR.join(row) for row in rows))
+    return directory
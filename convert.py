@@ -1,14 +1,33 @@
 import argparse
+from functools import partial
 
 from rich_argparse import RichHelpFormatter
 
+from app.cache import resolve_cached_source
+from app.compression import COMPRESSIONS
+from app.instrumentation import metrics
+from app.models.text.functions import PARSERS
+from app.profiling import PROFILERS, profiler
 from app.transfer import (
+    DIRECT_COPY_TYPES,
+    copy_direct,
     storage_from_ac,
+    storage_from_duckdb,
+    storage_from_jsonl,
+    storage_from_msgpack,
     storage_from_pg,
+    storage_from_parquet,
+    storage_from_pg_async,
+    storage_from_remote_txt,
     storage_from_txt,
     storage_from_sqlite,
     storage_to_ac,
+    storage_to_duckdb,
+    storage_to_jsonl,
+    storage_to_msgpack,
     storage_to_pg,
+    storage_to_parquet,
+    storage_to_pg_async,
     storage_to_txt,
     storage_to_sqlite,
 )
@@ -16,41 +35,187 @@ from app.transfer import (
 
 def generate_parser():
 
-    supported_types = ["postgres", "access", "text", "sqlite"]
+    supported_types = [
+        "postgres",
+        "postgres-async",
+        "access",
+        "text",
+        "sqlite",
+        "parquet",
+        "duckdb",
+        "jsonl",
+        "msgpack",
+    ]
+    source_only_types = ["remote-text"]
 
     parser = argparse.ArgumentParser(
         description="Database Converter CLI Tool", formatter_class=RichHelpFormatter
     )
-    parser.add_argument("from_type", choices=supported_types, help="source type")
+    parser.add_argument(
+        "from_type", choices=supported_types + source_only_types, help="source type"
+    )
     parser.add_argument("from_path", help="source path")
     parser.add_argument("to_type", choices=supported_types, help="destination type")
     parser.add_argument("to_path", help="destination path")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="REPORT_PATH",
+        help="collect stage timings, row counts and round trips "
+        "and write a JSON report to the path (stdout if omitted)",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="trace peak memory in the --profile report (slows conversion down)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        metavar="N",
+        help="parse text tables in N processes (0: one per CPU)",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=PARSERS,
+        default="python",
+        help="text table reader; arrow needs pyarrow and falls back to python",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=COMPRESSIONS,
+        help="compress text, jsonl and msgpack output (zstd needs zstandard)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="resume an interrupted postgres or sqlite import, "
+        "skipping completed stages and keeping the imported data",
+    )
+    parser.add_argument(
+        "--shadow",
+        action="store_true",
+        help="import postgres into a shadow schema and swap it in "
+        "atomically when complete, keeping the live tables readable",
+    )
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="load postgres into UNLOGGED tables with primary keys only and "
+        "build indexes and foreign keys after the load",
+    )
+    parser.add_argument(
+        "--direct",
+        action="store_true",
+        help="copy tables directly between postgres and sqlite databases, "
+        "skipping the Storage validation and normalization",
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=PROFILERS,
+        help="profile Storage population with cProfile or pyinstrument "
+        "and write the profiles to LOD_PROFILE_DIR (current directory by default)",
+    )
     return parser
 
 
-def db_converter(from_type, from_path, to_type, to_path):
+def db_converter(
+    from_type,
+    from_path,
+    to_type,
+    to_path,
+    *,
+    profile=None,
+    profile_memory=False,
+    workers=None,
+    parser="python",
+    compress=None,
+    resume=False,
+    shadow=False,
+    direct=False,
+    bulk=False,
+):  # pylint: disable=too-many-arguments, too-many-locals
 
     from_functions = {
         "access": storage_from_ac,
         "postgres": storage_from_pg,
-        "text": storage_from_txt,
+        "postgres-async": storage_from_pg_async,
+        "text": partial(storage_from_txt, workers=workers, parser=parser),
         "sqlite": storage_from_sqlite,
+        "parquet": storage_from_parquet,
+        "duckdb": storage_from_duckdb,
+        "jsonl": storage_from_jsonl,
+        "msgpack": storage_from_msgpack,
+        "remote-text": storage_from_remote_txt,
     }
     to_functions = {
         "access": storage_to_ac,
-        "postgres": storage_to_pg,
-        "text": storage_to_txt,
-        "sqlite": storage_to_sqlite,
+        "postgres": partial(storage_to_pg, resume=resume, shadow=shadow, bulk=bulk),
+        "postgres-async": storage_to_pg_async,
+        "text": partial(storage_to_txt, compression=compress),
+        "sqlite": partial(storage_to_sqlite, resume=resume),
+        "parquet": storage_to_parquet,
+        "duckdb": storage_to_duckdb,
+        "jsonl": partial(storage_to_jsonl, compression=compress),
+        "msgpack": partial(storage_to_msgpack, compression=compress),
     }
 
     if from_type not in from_functions or to_type not in to_functions:
         raise ValueError("Invalid from_type or to_type")
 
-    storage = from_functions.get(from_type)(from_path)
-    to_functions.get(to_type)(to_path, storage)
+    if direct and (
+        resume or from_type not in DIRECT_COPY_TYPES or to_type not in DIRECT_COPY_TYPES
+    ):
+        raise ValueError(
+            f"--direct copies only between {' and '.join(DIRECT_COPY_TYPES)} "
+            "and cannot resume."
+        )
+
+    if bulk and resume:
+        raise ValueError(
+            "--bulk cannot resume: its UNLOGGED tables are emptied after a crash."
+        )
+
+    if profile:
+        metrics.enable(track_memory=profile_memory)
+
+    try:
+        if direct:
+            with metrics.stage("copy"):
+                copy_direct(
+                    from_type, from_path, to_type, to_path, shadow=shadow, bulk=bulk
+                )
+            return
+
+        from_path = resolve_cached_source(from_type, from_path)
+        with metrics.stage("export"):
+            storage = from_functions.get(from_type)(from_path)
+        with metrics.stage("import"):
+            to_functions.get(to_type)(to_path, storage)
+    finally:
+        if profile:
+            metrics.write_report(profile)
+            metrics.disable()
 
 
 if __name__ == "__main__":
     convert_parser = generate_parser()
     args = convert_parser.parse_args()
-    db_converter(args.from_type, args.from_path, args.to_type, args.to_path)
+    if args.profiler:
+        profiler.configure(args.profiler, profiler.directory)
+    db_converter(
+        args.from_type,
+        args.from_path,
+        args.to_type,
+        args.to_path,
+        profile=args.profile,
+        profile_memory=args.profile_memory,
+        workers=args.workers,
+        parser=args.parser,
+        compress=args.compress,
+        resume=args.resume,
+        shadow=args.shadow,
+        direct=args.direct,
+        bulk=args.bulk,
+    )
@@ -1,11 +1,20 @@
 import argparse
 from rich_argparse import RichHelpFormatter
 
+from app.cache import DownloadCache
+from app.download import download_file as fetch_file, download_txt_to_import
+
 SUPPORTED_TYPES = ["text", "empty-mdb", "filled-mdb"]
 
 
-def download_file(download_type, to_path, url):
-    pass
+def download_file(download_type, to_path, url, cache_dir=None):
+    if download_type not in SUPPORTED_TYPES:
+        raise ValueError(f"Invalid download type: {download_type}")
+
+    cache = DownloadCache(cache_dir) if cache_dir else None
+    if download_type == "text":
+        return download_txt_to_import(to_path, base_url=url, cache=cache)
+    return [fetch_file(url, to_path, cache=cache)]
 
 
 def generate_parser():
@@ -13,16 +22,25 @@ def generate_parser():
         description="File downloader", formatter_class=RichHelpFormatter
     )
     parser.add_argument(
-        "download-type",
+        "download_type",
+        metavar="download-type",
         choices=SUPPORTED_TYPES,
         help="type of downloading",
     )
     parser.add_argument("url", help="URL of the file to download")
-    parser.add_argument("to-path", help="Output directory for the downloaded file")
+    parser.add_argument(
+        "to_path",
+        metavar="to-path",
+        help="Output directory for the downloaded file",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="local cache directory to reuse previously downloaded files",
+    )
     return parser
 
 
 if __name__ == "__main__":
     download_parser = generate_parser()
     args = download_parser.parse_args()
-    download_file(args.download_type, args.to_path, args.url)
+    download_file(args.download_type, args.to_path, args.url, args.cache_dir)
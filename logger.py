@@ -2,10 +2,13 @@
 # pylint: disable=C0103
 
 """Configuration file"""
+
 import logging
 import time
 from functools import wraps
 
+from app.instrumentation import metrics
+
 detailed_format = "%(filename)s [LINE:%(lineno)03d] [%(asctime)s] %(levelname)-s %(funcName)s() %(message)s"
 short_format = "[%(asctime)s] %(message)s"
 
@@ -16,23 +19,29 @@ log = logging.getLogger(__name__)
 
 
 def logging_time(func):
+    """
+    Logs the duration of the function and measures it
+    as a stage of the performance report.
+    """
+
     @wraps(func)
     def wrapper(*args, **kwargs):
 
         start_time = time.time()
         log.info(
-            f"{func.__name__} - Start time:"
-            f" {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}"
+            "%s - Start time: %s",
+            func.__name__,
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start_time)),
         )
-        result = func(*args, **kwargs)
+        with metrics.stage(func.__name__):
+            result = func(*args, **kwargs)
         end_time = time.time()
         log.info(
-            f"{func.__name__} - End time:"
-            f" {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time))}"
-        )
-        log.info(
-            f"{func.__name__} - Duration:" f" {end_time - start_time:.2f} seconds\n"
+            "%s - End time: %s",
+            func.__name__,
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time)),
         )
+        log.info("%s - Duration: %.2f seconds\n", func.__name__, end_time - start_time)
         return result
 
     return wrapper
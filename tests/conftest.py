@@ -0,0 +1,99 @@
+"""Shared fixtures: a local HTTP stand-in for the LOD GitHub repository."""
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+LOD_TABLES = {
+    "Author": "JCB@James Cooke Brown@\nL4@Loglan 4&5@The printed-on-paper book\n",
+    "LexEvent": "1@Start@01/01/1975@The initial vocabulary@Initial@INIT\n",
+    "Type": (
+        "C-Prim@Predicate@Prim@True@Composite Primitive\n"
+        "2-Cpx@Predicate@Cpx@True@Two-term Complex\n"
+        "Afx@Affix@Afx@False@Affix\n"
+    ),
+    "Words": (
+        "1@C-Prim@Predicate@bak@@JCB@1975@7+@box | baks@@baksytoa@\n"
+        "2@2-Cpx@Predicate@@@L4@1975 (notes)@@bak+toa@@@\n"
+        "3@Afx@Affix@@@JCB@1975@@@@@\n"
+    ),
+    "WordSpell": (
+        "1@bakso@bakso@55555@1@9999@\n"
+        "2@baksytoa@baksytoa@55555555@1@9999@\n"
+        "3@bak-@bak-@5555@1@9999@\n"
+    ),
+    "WordDefinition": (
+        "1@1@@2n@K is a «box» of L@@\n"
+        "2@1@@2n@K is a «box-tool» for L@@K\n"
+        "3@1@@af@a combining form of «bakso»@@\n"
+    ),
+    "Settings": "25.10.2020 05:10:20@2@10141@4.5.9\n",
+    "Syllable": "ba@InitialCV@True\ncdz@UnintelligibleCCC@False\n",
+}
+
+
+class LODRequestHandler(BaseHTTPRequestHandler):
+    """Serves files from `server.files` with ETag, conditional and range support."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        server = self.server
+        server.requests.append((self.path, dict(self.headers)))
+
+        if server.failures.get(self.path):
+            server.failures[self.path] -= 1
+            self.send_error(503)
+            return
+
+        content = server.files.get(self.path)
+        if content is None:
+            self.send_error(404)
+            return
+
+        etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range", etag) == etag:
+            start = int(range_header.split("=")[1].split("-")[0])
+
+        body = content[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture
+def text_tables(tmp_path):
+    """Directory with a small but consistent set of LOD text tables."""
+    directory = tmp_path / "tables"
+    directory.mkdir()
+    for name, content in LOD_TABLES.items():
+        (directory / f"{name}.txt").write_text(content, encoding="utf-8")
+    return directory
+
+
+@pytest.fixture
+def lod_server():
+    """Local HTTP server. Fill `server.files` with {path: bytes}."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), LODRequestHandler)
+    server.files = {}
+    server.failures = {}
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,30 @@
+"""Tests of the Access import set, which need no Access driver."""
+
+from app.models.access.functions import unique_rows
+from app.models.access.model.author import AccessAuthor
+from app.models.access.model.type import AccessType
+from app.models.access.model.word import AccessWord
+
+
+def test_unique_rows_keep_first_position_and_last_value():
+    rows = [["a", "first"], ["b", "x"], ["a", "second"]]
+    unique, duplicates = unique_rows(rows, AccessAuthor.row_key)
+    assert unique == [["a", "second"], ["b", "x"]]
+    assert duplicates == [("a",)]
+
+
+def test_rows_without_natural_key_compare_by_values():
+    rows = [
+        ["C", "Compound", "Cpx", True, ""],
+        ["C", "Compound", "Cpx", True, None],
+        ["C", "Compound", "Cpx", True, "other"],
+    ]
+    unique, duplicates = unique_rows(rows, AccessType.row_key)
+    assert len(unique) == 2 and len(duplicates) == 1
+
+
+def test_words_are_unique_by_id():
+    rows = [[1, "C-Prim"], [2, "C-Prim"], [1, "Cpx"]]
+    unique, duplicates = unique_rows(rows, AccessWord.row_key)
+    assert [row[0] for row in unique] == [1, 2]
+    assert duplicates == [(1,)]
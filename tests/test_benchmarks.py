@@ -0,0 +1,107 @@
+"""Tests of the synthetic dictionaries and the benchmark runner."""
+
+import pytest
+
+from app.profiling import Profiler
+from app.properties import ClassName
+from app.storage import Storage
+from app.table_container import TableContainer
+from benchmarks import micro, run
+from benchmarks.run import (
+    SCENARIOS,
+    Result,
+    append_history,
+    find_regressions,
+    read_history,
+    run_scenario,
+)
+from benchmarks.synthetic import generate_tables
+
+
+@pytest.fixture(scope="module")
+def tables():
+    return generate_tables(120)
+
+
+def test_synthetic_tables_fit_storage(tables):
+    storage = Storage()
+    for name, rows in tables.items():
+        storage.container_by_name(name).extend(rows)
+    assert len(storage.container_by_name(ClassName.words)) == 120
+
+
+def test_synthetic_tables_are_consistent(tables):
+    types = {row[0] for row in tables[ClassName.types]}
+    authors = {row[0] for row in tables[ClassName.authors]}
+    names = {row[1] for row in tables[ClassName.word_spells]}
+    word_ids = {row[0] for row in tables[ClassName.words]}
+
+    for word in tables[ClassName.words]:
+        assert word[1] in types
+        assert set(word[5].split(" ")[0].split("/")) <= authors
+        if word[3]:
+            assert f"{word[3]}-" in names
+        if word[10]:
+            assert set(word[10].split(" | ")) <= names
+    assert {row[0] for row in tables[ClassName.definitions]} == word_ids
+    assert len(names) == len(tables[ClassName.word_spells])
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+def test_scenarios_run(scenario):
+    result = run_scenario(SCENARIOS[scenario], words=30, repeat=1)
+    assert result.rows > 30
+    assert result.duration > 0
+    assert result.peak_memory > 0
+
+
+def make_result(rows_per_second, peak_memory=1000):
+    return Result("storage", 10, 100, 1.0, rows_per_second, peak_memory, [])
+
+
+def test_history_and_regressions(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    append_history(path, [make_result(1000.0), make_result(1100.0)])
+    history = read_history(path)
+    assert len(history) == 2
+    assert history[0]["commit"] is None or isinstance(history[0]["commit"], str)
+
+    assert not find_regressions(make_result(950.0), history)
+    assert len(find_regressions(make_result(500.0), history)) == 1
+    assert len(find_regressions(make_result(500.0, peak_memory=5000), history)) == 2
+    assert not find_regressions(make_result(500.0)._replace(words=20), history)
+
+
+def test_regressed_runs_are_recorded_only_when_accepted(tmp_path, monkeypatch):
+    path = str(tmp_path / "history.jsonl")
+    append_history(path, [make_result(1000.0)])
+    monkeypatch.setattr(run, "run_scenario", lambda *_: make_result(500.0))
+    argv = ["--scenarios", "storage", "--words", "10", "--history", path]
+
+    assert run.main(argv) == 1
+    assert len(read_history(path)) == 1
+    assert run.main([*argv, "--accept"]) == 0
+    assert len(read_history(path)) == 2
+
+    monkeypatch.setattr(run, "run_scenario", lambda *_: make_result(1000.0))
+    assert run.main(argv) == 0
+    assert len(read_history(path)) == 3
+
+
+def test_micro_benchmarks_compare_containers():
+    reference = "app.table_container:TableContainer"
+    timings = micro.run([reference, reference], repeat=1, number=5)
+    container_timings = [t for t in timings if t.container == reference]
+    assert len(container_timings) == 2 * len(micro.container_cases(TableContainer))
+    assert all(timing.nanoseconds_per_cell > 0 for timing in timings)
+
+
+def test_profiler_writes_section_profile(tmp_path):
+    micro.profile_population("cprofile", str(tmp_path), words=20)
+    assert (tmp_path / "populate_storage_20_words.prof").exists()
+
+
+def test_profiler_is_off_by_default_and_checks_kind():
+    assert not Profiler().enabled
+    with pytest.raises(ValueError):
+        Profiler("perf")
@@ -0,0 +1,96 @@
+"""Tests for the content-addressed download cache."""
+
+import os
+
+import pytest
+
+from app.cache import DownloadCache, resolve_cached_source
+from app.download import DownloadStatus, download_file, download_txt_to_import
+from app.properties import ClassName
+
+
+class TestDownloadCache:
+    """Tests for DownloadCache used by the download functions."""
+
+    def test_second_download_is_served_from_cache(self, lod_server, tmp_path):
+        lod_server.files["/file.mdb"] = b"content"
+        cache = DownloadCache(str(tmp_path / "cache"))
+        url = f"{lod_server.url}/file.mdb"
+
+        first = download_file(url, str(tmp_path / "one"), cache=cache)
+        second = download_file(url, str(tmp_path / "two"), cache=cache)
+
+        assert first.status == DownloadStatus.downloaded
+        assert second.status == DownloadStatus.cached
+        assert (tmp_path / "two" / "file.mdb").read_bytes() == b"content"
+        assert "If-None-Match" in lod_server.requests[-1][1]
+
+    def test_fresh_entry_skips_network(self, lod_server, tmp_path):
+        lod_server.files["/file.mdb"] = b"content"
+        cache = DownloadCache(str(tmp_path / "cache"), max_age=3600)
+        url = f"{lod_server.url}/file.mdb"
+
+        download_file(url, str(tmp_path / "one"), cache=cache)
+        result = download_file(url, str(tmp_path / "two"), cache=cache)
+
+        assert result.status == DownloadStatus.cached
+        assert len(lod_server.requests) == 1
+
+    def test_identical_content_is_stored_once(self, lod_server, tmp_path):
+        lod_server.files["/a.mdb"] = b"content"
+        lod_server.files["/b.mdb"] = b"content"
+        cache = DownloadCache(str(tmp_path / "cache"))
+
+        download_file(f"{lod_server.url}/a.mdb", str(tmp_path / "out"), cache=cache)
+        download_file(f"{lod_server.url}/b.mdb", str(tmp_path / "out"), cache=cache)
+
+        assert cache.size == len(b"content")
+
+    def test_least_recently_used_is_evicted(self, lod_server, tmp_path):
+        for name in "abc":
+            lod_server.files[f"/{name}.mdb"] = name.encode() * 10
+        cache = DownloadCache(str(tmp_path / "cache"), max_size=25)
+
+        for name in "abc":
+            url = f"{lod_server.url}/{name}.mdb"
+            download_file(url, str(tmp_path / "out"), cache=cache)
+
+        assert cache.lookup(f"{lod_server.url}/a.mdb") is None
+        assert cache.lookup(f"{lod_server.url}/c.mdb") is not None
+        assert cache.size <= 25
+
+
+class TestResolveCachedSource:
+    """Tests for cache:// source paths."""
+
+    def test_plain_path_is_unchanged(self):
+        assert resolve_cached_source("text", "data/text") == "data/text"
+
+    def test_text_source_resolves_to_directory(self, lod_server, tmp_path):
+        for name in ClassName():
+            lod_server.files[f"/tables/{name}.txt"] = f"{name}@1".encode()
+        cache = DownloadCache(str(tmp_path / "cache"), link=True)
+
+        path = resolve_cached_source(
+            "text", f"cache://{lod_server.url}/tables/", cache=cache
+        )
+
+        assert sorted(os.listdir(path)) == sorted(
+            [f"{n}.txt" for n in ClassName()]
+            + [f"{n}.txt.meta.json" for n in ClassName()]
+        )
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(ValueError, match="not supported"):
+            resolve_cached_source("sqlite", "cache://")
+
+    def test_tables_download_uses_cache(self, lod_server, tmp_path):
+        for name in ClassName():
+            lod_server.files[f"/tables/{name}.txt"] = f"{name}@1".encode()
+        cache = DownloadCache(str(tmp_path / "cache"))
+        base_url = f"{lod_server.url}/tables"
+
+        download_txt_to_import(str(tmp_path / "one"), base_url, cache=cache)
+        results = download_txt_to_import(str(tmp_path / "two"), base_url, cache=cache)
+
+        assert {r.status for r in results} == {DownloadStatus.cached}
@@ -0,0 +1,111 @@
+"""Tests of checkpointed, resumable SQLite imports."""
+
+import pytest
+from loglan_core import Word
+from sqlalchemy import func, select
+
+from app.checkpoint import Checkpoint, progress_table
+from app.instrumentation import metrics
+from app.models.sqlite.connector import SQLiteDatabaseConnector
+from app.models.sqlite.interface import SQLiteInterface
+from app.properties import ClassName
+from app.storage import Storage
+from app.transfer import storage_to_sqlite
+from benchmarks.synthetic import generate_tables
+
+
+@pytest.fixture(name="storage")
+def fixture_storage():
+    storage = Storage()
+    for name, rows in generate_tables(30).items():
+        storage.container_by_name(name).extend(rows)
+    return storage
+
+
+def count_words(path):
+    connector = SQLiteDatabaseConnector(path)
+    with connector.session as session:
+        return session.scalar(select(func.count()).select_from(Word))
+
+
+def test_batches_skip_committed_ones(tmp_path):
+    connector = SQLiteDatabaseConnector(str(tmp_path / "target.db"), importing=True)
+    checkpoint = Checkpoint(connector.engine)
+    with connector.session as session:
+        checkpoint.mark(session, "stage", 0)
+        checkpoint.mark(session, "stage", 1)
+        session.commit()
+
+    resumed = Checkpoint(connector.engine, resume=True)
+    assert [number for number, _ in resumed.batches("stage", range(7), 2)] == [2, 3]
+    assert not resumed.completed("stage")
+    assert not list(Checkpoint(connector.engine).batches("stage", range(7), 2))[0][0]
+
+
+def test_resume_skips_completed_stages(tmp_path, storage, monkeypatch):
+    path = str(tmp_path / "target.db")
+    link_affixes = SQLiteInterface.link_affixes
+
+    def fail(*_):
+        raise ConnectionError("connection lost")
+
+    monkeypatch.setattr(SQLiteInterface, "link_affixes", fail)
+    with pytest.raises(ConnectionError):
+        storage_to_sqlite(path, storage)
+    words = count_words(path)
+    assert words
+
+    monkeypatch.setattr(SQLiteInterface, "link_affixes", link_affixes)
+    monkeypatch.setattr(SQLiteInterface, "import_words", fail)
+    storage_to_sqlite(path, storage, resume=True)
+    assert count_words(path) == words
+
+    checkpoint = Checkpoint(SQLiteDatabaseConnector(path).engine, resume=True)
+    assert checkpoint.completed("link_affixes")
+
+
+def test_resume_with_no_progress_starts_from_scratch(tmp_path, storage):
+    path = str(tmp_path / "target.db")
+    storage_to_sqlite(path, storage)
+    words = count_words(path)
+    with SQLiteDatabaseConnector(path).engine.begin() as connection:
+        connection.execute(progress_table.delete())
+
+    storage_to_sqlite(path, storage, resume=True)
+    assert count_words(path) == words
+    checkpoint = Checkpoint(SQLiteDatabaseConnector(path).engine, resume=True)
+    assert checkpoint.completed("link_affixes")
+
+
+BATCHES = Checkpoint.batches
+
+
+def link_round_trips(path, storage, monkeypatch, batch_size):
+    monkeypatch.setattr(
+        Checkpoint,
+        "batches",
+        lambda self, stage, items: BATCHES(self, stage, items, batch_size),
+    )
+    metrics.enable()
+    try:
+        storage_to_sqlite(path, storage)
+        stages = metrics.report()["stages"]
+    finally:
+        metrics.disable()
+    return {
+        stage["name"]: stage["round_trips"]
+        for stage in stages
+        if stage["name"] in ("link_keys", "link_authors", "link_complexes")
+    }
+
+
+def test_batch_commits_do_not_reload_objects(tmp_path, storage, monkeypatch):
+    single = link_round_trips(str(tmp_path / "single.db"), storage, monkeypatch, 1000)
+    batched = link_round_trips(str(tmp_path / "batched.db"), storage, monkeypatch, 5)
+
+    words = len(storage.container_by_name(ClassName.words))
+    definitions = len(storage.container_by_name(ClassName.definitions))
+    # a batch adds its progress update or insert, nothing is selected again
+    assert batched["link_authors"] <= single["link_authors"] + 2 * (words // 5 + 1)
+    assert batched["link_keys"] <= single["link_keys"] + 2 * (definitions // 5 + 2)
+    assert batched["link_complexes"] <= single["link_complexes"] + words
@@ -0,0 +1,25 @@
+"""Tests of the optional compression layer."""
+
+import pytest
+
+from app.compression import compressed_path, detect_compression, open_compressed
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_round_trip_by_suffix(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    path = compressed_path(str(tmp_path / "table.txt"), compression)
+    assert detect_compression(path) == compression
+
+    with open_compressed(path, "wt", compression, threads=2) as file:
+        file.write("bakso@box\nbaksytoa@box-tool\n")
+    with open_compressed(path, "rt") as file:
+        assert file.readlines() == ["bakso@box\n", "baksytoa@box-tool\n"]
+
+
+def test_unknown_compression_and_mode(tmp_path):
+    with pytest.raises(ValueError):
+        open_compressed(str(tmp_path / "table.txt"), "wb", "lzma")
+    with pytest.raises(ValueError):
+        open_compressed(str(tmp_path / "table.txt"), "ab")
@@ -0,0 +1,48 @@
+"""Tests of the cached fixed-format date parsers."""
+
+from datetime import datetime
+
+import pytest
+
+from app.dates import parse_datetime, parse_event_date, parse_setting_date, parse_year
+from app.models.common import CommonEvent, CommonSetting
+
+
+@pytest.mark.parametrize(
+    "value", ["01/02/1975", "1/2/1975", "12/31/2024", "02/29/2000", "1/2/0975"]
+)
+def test_event_dates_match_strptime(value):
+    expected = datetime.strptime(value, CommonEvent.DATE_FORMAT)
+    assert parse_event_date(value) == expected
+
+
+@pytest.mark.parametrize("value", ["05.04.2026 13:20:48", "5.4.2026 3:2:8"])
+def test_setting_dates_match_strptime(value):
+    expected = datetime.strptime(value, CommonSetting.DATE_FORMAT)
+    assert parse_setting_date(value) == expected
+
+
+def test_years_are_first_days():
+    assert parse_year("1975") == datetime(1975, 1, 1).date()
+    assert parse_year("0975") == datetime.strptime("0975", "%Y").date()
+
+
+@pytest.mark.parametrize(
+    "value, date_format",
+    [
+        ("13/01/1975", CommonEvent.DATE_FORMAT),
+        ("00/01/1975", CommonEvent.DATE_FORMAT),
+        ("31.02.2026 13:20:48", CommonSetting.DATE_FORMAT),
+        ("05.04.2026 25:20:48", CommonSetting.DATE_FORMAT),
+        ("02/30/1975", CommonEvent.DATE_FORMAT),
+        ("01/02/1975 ", CommonEvent.DATE_FORMAT),
+        ("05.04.2026", CommonSetting.DATE_FORMAT),
+        ("19x5", "%Y"),
+    ],
+)
+def test_invalid_values_raise_like_strptime(value, date_format):
+    with pytest.raises(ValueError) as expected:
+        datetime.strptime(value, date_format)
+    with pytest.raises(ValueError) as raised:
+        parse_datetime(value, date_format)
+    assert str(raised.value) == str(expected.value)
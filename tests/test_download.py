@@ -0,0 +1,109 @@
+"""Tests for the concurrent, resumable downloader."""
+
+import hashlib
+import os
+
+import pytest
+
+from app.download import (
+    DownloadStatus,
+    download_file,
+    download_txt_to_import,
+    write_meta,
+)
+from app.properties import ClassName
+
+
+def fill_tables(server):
+    contents = {}
+    for name in ClassName():
+        content = f"{name}@first\n{name}@second\n".encode("utf-8")
+        server.files[f"/tables/{name}.txt"] = content
+        contents[name] = content
+    return contents
+
+
+class TestDownloadTables:
+    """Tests for download_txt_to_import."""
+
+    def test_downloads_all_tables(self, lod_server, tmp_path):
+        contents = fill_tables(lod_server)
+        results = download_txt_to_import(str(tmp_path), f"{lod_server.url}/tables")
+
+        assert len(results) == 8
+        assert all(r.status == DownloadStatus.downloaded for r in results)
+        for name, content in contents.items():
+            assert (tmp_path / f"{name}.txt").read_bytes() == content
+
+    def test_second_run_is_not_modified(self, lod_server, tmp_path):
+        fill_tables(lod_server)
+        download_txt_to_import(str(tmp_path), f"{lod_server.url}/tables")
+        results = download_txt_to_import(str(tmp_path), f"{lod_server.url}/tables")
+
+        assert all(r.status == DownloadStatus.not_modified for r in results)
+        assert all("If-None-Match" in h for _, h in lod_server.requests[8:])
+
+    def test_changed_file_is_downloaded_again(self, lod_server, tmp_path):
+        fill_tables(lod_server)
+        download_txt_to_import(str(tmp_path), f"{lod_server.url}/tables")
+        lod_server.files["/tables/Author.txt"] = b"JCB@James Cooke Brown@"
+        results = download_txt_to_import(str(tmp_path), f"{lod_server.url}/tables")
+
+        statuses = {os.path.basename(r.path): r.status for r in results}
+        assert statuses.pop("Author.txt") == DownloadStatus.downloaded
+        assert set(statuses.values()) == {DownloadStatus.not_modified}
+
+
+class TestDownloadFile:
+    """Tests for download_file."""
+
+    def test_resumes_partial_download(self, lod_server, tmp_path):
+        content = b"0123456789" * 1000
+        lod_server.files["/file.mdb"] = content
+        url = f"{lod_server.url}/file.mdb"
+
+        first = download_file(url, str(tmp_path))
+        os.remove(first.path)
+        os.remove(f"{first.path}.meta.json")
+
+        part_path = f"{first.path}.part"
+        with open(part_path, "wb") as file:
+            file.write(content[:4000])
+        etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+        write_meta(part_path, {"url": url, "etag": etag})
+
+        result = download_file(url, str(tmp_path))
+
+        assert result.status == DownloadStatus.resumed
+        assert lod_server.requests[-1][1]["Range"] == "bytes=4000-"
+        assert (tmp_path / "file.mdb").read_bytes() == content
+        assert result.sha256 == hashlib.sha256(content).hexdigest()
+        assert not os.path.exists(part_path)
+
+    def test_checksum_mismatch_raises(self, lod_server, tmp_path):
+        lod_server.files["/file.mdb"] = b"content"
+
+        with pytest.raises(ValueError, match="Checksum mismatch"):
+            download_file(f"{lod_server.url}/file.mdb", str(tmp_path), "0" * 64)
+        assert not os.path.exists(tmp_path / "file.mdb")
+
+    def test_checksum_match(self, lod_server, tmp_path):
+        lod_server.files["/file.mdb"] = b"content"
+        expected = hashlib.sha256(b"content").hexdigest()
+
+        result = download_file(f"{lod_server.url}/file.mdb", str(tmp_path), expected)
+        assert result.sha256 == expected
+
+    def test_retries_server_errors(self, lod_server, tmp_path, monkeypatch):
+        monkeypatch.setattr("app.download.BACKOFF", 0)
+        lod_server.files["/file.mdb"] = b"content"
+        lod_server.failures["/file.mdb"] = 2
+
+        result = download_file(f"{lod_server.url}/file.mdb", str(tmp_path))
+        assert result.status == DownloadStatus.downloaded
+        assert len(lod_server.requests) == 3
+
+    def test_missing_file_is_not_retried(self, lod_server, tmp_path):
+        with pytest.raises(Exception, match="404"):
+            download_file(f"{lod_server.url}/missing.mdb", str(tmp_path))
+        assert len(lod_server.requests) == 1
@@ -0,0 +1,67 @@
+"""Tests of the DuckDB backend and its SQL checks."""
+
+import pytest
+
+pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+# pylint: disable=wrong-import-position
+from app.models.duckdb.checks import CHECKS
+from app.models.duckdb.connector import DuckDBConnector
+from app.models.duckdb.interface import DuckDBInterface
+from app.models.text.connector import TextConnector
+from app.models.text.interface import TextInterface
+
+
+def load(directory, database):
+    storage = TextInterface(TextConnector(str(directory))).export_data()
+    DuckDBInterface(DuckDBConnector(database, importing=True)).import_data(storage)
+    return storage
+
+
+def test_round_trip(text_tables, tmp_path):
+    database = str(tmp_path / "dictionary.duckdb")
+    storage = load(text_tables, database)
+    restored = DuckDBInterface(DuckDBConnector(database)).export_data()
+
+    for expected, actual in zip(storage.containers, restored.containers):
+        assert actual == expected, expected.name
+
+
+def test_import_replaces_tables(text_tables, tmp_path):
+    database = str(tmp_path / "dictionary.duckdb")
+    load(text_tables, database)
+    storage = load(text_tables, database)
+    restored = DuckDBInterface(DuckDBConnector(database)).export_data()
+    assert len(restored.containers[3]) == len(storage.containers[3])
+
+
+def test_checks_pass_on_consistent_data(text_tables, tmp_path):
+    database = str(tmp_path / "dictionary.duckdb")
+    load(text_tables, database)
+    results = DuckDBInterface(DuckDBConnector(database)).check()
+    assert set(results) == set(CHECKS)
+    assert not any(results.values())
+
+
+def test_checks_report_offending_rows(text_tables, tmp_path):
+    with open(text_tables / "Words.txt", "a", encoding="utf-8") as file:
+        file.write("4@D-Prim@Predicate@@@XX@1975@@@@@\n")
+    with open(text_tables / "WordSpell.txt", "a", encoding="utf-8") as file:
+        file.write("5@bakcdzi@bakcdzi@5@1@7@\n")
+    database = str(tmp_path / "dictionary.duckdb")
+    load(text_tables, database)
+
+    results = DuckDBInterface(DuckDBConnector(database)).check()
+    assert results["words_with_unknown_type"] == [(4, "D-Prim")]
+    assert results["words_with_unknown_author"] == [(4, "XX")]
+    assert results["spells_without_word"] == [(5, "bakcdzi")]
+    assert results["spells_with_unknown_event"] == [(5, "bakcdzi", 1, 7)]
+    assert results["unintelligible_ccc"] == [("bakcdzi", "cdz")]
+
+
+def test_connector_checks_path(tmp_path):
+    with pytest.raises(ValueError):
+        DuckDBConnector(str(tmp_path / "dictionary.txt"))
+    with pytest.raises(FileNotFoundError):
+        DuckDBConnector(str(tmp_path / "missing.duckdb"))
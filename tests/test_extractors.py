@@ -0,0 +1,50 @@
+"""Tests of the column extractors exporting the loglan_core models."""
+
+from loglan_core import Author, Definition
+from loglan_core.addons.exporter import Exporter
+
+from app.models.postgres.extractors import build_extractors
+from app.models.sqlite.connector import SQLiteDatabaseConnector
+from app.models.sqlite.interface import SQLiteInterface
+from app.properties import ClassName
+from app.storage import Storage
+from app.transfer import storage_to_sqlite
+from benchmarks.synthetic import generate_tables
+
+
+def sqlite_dictionary(tmp_path, words: int = 30) -> SQLiteDatabaseConnector:
+    storage = Storage()
+    for name, rows in generate_tables(words).items():
+        storage.container_by_name(name).extend(rows)
+    path = str(tmp_path / "dictionary.db")
+    storage_to_sqlite(path, storage)
+    return SQLiteDatabaseConnector(path)
+
+
+def test_extractors_match_exporter(tmp_path):
+    connector = sqlite_dictionary(tmp_path)
+    extractors = build_extractors(connector.table_order)
+
+    with connector.session as session:
+        for class_ in connector.table_order.values():
+            expected = [
+                Exporter.export(obj).split("@")
+                for obj in session.query(class_).order_by(class_.id).all()
+            ]
+            assert expected, class_.__name__
+            assert extractors[class_](session) == expected, class_.__name__
+
+
+def test_fields_keep_the_separator(tmp_path):
+    connector = sqlite_dictionary(tmp_path, words=10)
+    with connector.session as session:
+        session.query(Author).filter(Author.id == 1).update({"notes": "a@b"})
+        session.query(Definition).filter(Definition.id == 1).update(
+            {"body": "K is a @box"}
+        )
+        session.commit()
+
+    storage = SQLiteInterface(connector).export_data()
+
+    assert storage.container_by_name(ClassName.authors)[0][2] == "a@b"
+    assert storage.container_by_name(ClassName.definitions)[0][4] == "K is a @box"
@@ -0,0 +1,137 @@
+"""Tests of the performance instrumentation and the --profile report."""
+
+import json
+import tracemalloc
+
+import pytest
+
+from app.instrumentation import Instrumentation, metrics
+from app.models.remote_text.connector import RemoteTextConnector
+from app.models.remote_text.interface import RemoteTextInterface
+from app.properties import ClassName
+from tests.conftest import LOD_TABLES
+
+
+@pytest.fixture
+def collector():
+    instrumentation = Instrumentation()
+    instrumentation.enable(track_memory=False)
+    yield instrumentation
+    instrumentation.disable()
+
+
+def test_disabled_collector_records_nothing():
+    instrumentation = Instrumentation()
+    with instrumentation.stage("stage") as record:
+        instrumentation.add_rows(10)
+    assert record is None
+    assert not instrumentation.report()["stages"]
+
+
+def test_stages_nest_and_count_rows(collector):
+    with collector.stage("outer"):
+        collector.add_rows(1)
+        with collector.stage("inner"):
+            collector.add_rows(5)
+            collector.count_round_trip()
+
+    outer, inner = collector.report()["stages"]
+    assert (outer["name"], outer["depth"], outer["rows"]) == ("outer", 0, 1)
+    assert (inner["parent"], inner["depth"], inner["rows"]) == ("outer", 1, 5)
+    assert outer["round_trips"] == inner["round_trips"] == 1
+    assert collector.report()["round_trips"] == 1
+
+
+def test_memory_peak_is_attributed_to_open_stages():
+    instrumentation = Instrumentation()
+    instrumentation.enable(track_memory=True)
+    try:
+        with instrumentation.stage("allocate"):
+            data = [bytes(1024) for _ in range(1000)]
+        assert data
+        report = instrumentation.report()
+    finally:
+        instrumentation.disable()
+    assert report["stages"][0]["peak_memory"] >= 1024 * 1000
+
+
+def test_memory_is_not_traced_by_default():
+    instrumentation = Instrumentation()
+    instrumentation.enable()
+    try:
+        assert not instrumentation.track_memory
+        assert not tracemalloc.is_tracing()
+    finally:
+        instrumentation.disable()
+
+
+def test_profile_option_writes_report(text_tables, tmp_path):
+    convert = pytest.importorskip("convert")
+    report_path = tmp_path / "profile.json"
+    db_path = str(tmp_path / "import.db")
+    try:
+        convert.db_converter(
+            "text", str(text_tables), "sqlite", db_path, profile=str(report_path)
+        )
+    finally:
+        metrics.disable()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    stages = {stage["name"]: stage for stage in report["stages"]}
+    assert stages["export"]["rows"] == 0
+    assert stages["export_data"]["rows"] == sum(
+        len(table.splitlines()) for table in LOD_TABLES.values()
+    )
+    assert stages["import_words"]["rows"] == 3
+    assert stages["import"]["round_trips"] > 0
+    assert report["round_trips"] == stages["import"]["round_trips"]
+
+
+def test_rows_of_worker_threads_count_in_their_stage(text_tables, tmp_path):
+    convert = pytest.importorskip("convert")
+    report_path = tmp_path / "profile.json"
+    (tmp_path / "output").mkdir()
+    try:
+        convert.db_converter(
+            "text",
+            str(text_tables),
+            "text",
+            str(tmp_path / "output"),
+            profile=str(report_path),
+            workers=2,
+            compress="gzip",
+        )
+    finally:
+        metrics.disable()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    stages = {stage["name"]: stage for stage in report["stages"]}
+    total = sum(len(table.splitlines()) for table in LOD_TABLES.values())
+    assert stages["export_data"]["rows"] == total
+    assert stages["import_data"]["rows"] == total
+
+
+def test_remote_tables_nest_into_the_export_stage(lod_server):
+    for name, content in LOD_TABLES.items():
+        lod_server.files[f"/tables/{name}.txt"] = content.encode("utf-8")
+    connector = RemoteTextConnector(f"{lod_server.url}/tables/")
+
+    metrics.enable()
+    try:
+        RemoteTextInterface(connector).export_data()
+        records = {record.name: record for record in metrics.records}
+    finally:
+        metrics.disable()
+
+    tables = [records[f"export_{name}"] for name in ClassName()]
+    assert all(record.parent is records["export_data"] for record in tables)
+    assert sum(record.rows for record in tables) == sum(
+        len(table.splitlines()) for table in LOD_TABLES.values()
+    )
+
+
+def test_profile_option_defaults_to_stdout():
+    parser = pytest.importorskip("convert").generate_parser()
+    args = parser.parse_args(["text", "a", "sqlite", "b", "--profile"])
+    assert args.profile == "-"
+    assert parser.parse_args(["text", "a", "sqlite", "b"]).profile is None
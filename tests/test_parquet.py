@@ -0,0 +1,47 @@
+"""Tests of the Parquet backend."""
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+# pylint: disable=wrong-import-position
+from app.models.parquet.connector import ParquetConnector
+from app.models.arrow import table_schema
+from app.models.parquet.interface import ParquetInterface
+from app.models.text.connector import TextConnector
+from app.models.text.interface import TextInterface
+from app.properties import ClassName, DEFAULT_TABLE_PROPERTIES_COLLECTION
+
+
+@pytest.fixture
+def storage(text_tables):
+    return TextInterface(TextConnector(str(text_tables))).export_data()
+
+
+def test_schema_is_typed_and_nullable_by_pattern():
+    schema = table_schema(DEFAULT_TABLE_PROPERTIES_COLLECTION[3])
+    assert schema.names[:3] == ["old_id", "type", "type_x"]
+    assert str(schema.field("old_id").type) == "int64"
+    assert not schema.field("old_id").nullable
+    assert schema.field("tid_old").nullable
+
+
+def test_round_trip_keeps_types(tmp_path, storage):
+    path = str(tmp_path / "parquet")
+    ParquetInterface(ParquetConnector(path, importing=True)).import_data(storage)
+    restored = ParquetInterface(ParquetConnector(path)).export_data()
+
+    for expected, actual in zip(storage.containers, restored.containers):
+        assert actual == expected, expected.name
+    syllables = restored.container_by_name(ClassName.syllables)
+    assert syllables[0][2] is True
+
+
+def test_read_table_projects_columns(tmp_path, storage):
+    path = str(tmp_path / "parquet")
+    ParquetInterface(ParquetConnector(path, importing=True)).import_data(storage)
+    interface = ParquetInterface(ParquetConnector(path))
+
+    table = interface.read_table(ClassName.word_spells, columns=["name", "old_id"])
+    assert table.column_names == ["name", "old_id"]
+    assert table.column("old_id").to_pylist() == [1, 2, 3]
@@ -0,0 +1,37 @@
+"""Tests of the lazily imported backends of convert.py."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.registry import BACKENDS, load_backend
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_cli_imports_no_backend():
+    code = (
+        "import sys, convert; convert.generate_parser(); "
+        "print(' '.join(sorted(sys.modules)))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = result.stdout.split()
+    for prefix in ("sqlalchemy", "loglan_core", "win32com", "app.models.access"):
+        assert not any(module.startswith(prefix) for module in modules), prefix
+
+
+def test_load_backend_imports_the_selected_type():
+    connector, interface = load_backend("sqlite")
+    assert connector.__name__ == "SQLiteDatabaseConnector"
+    assert interface.__name__ == "SQLiteInterface"
+    assert {"postgres", "access", "text", "sqlite"} <= set(BACKENDS)
+    with pytest.raises(ValueError):
+        load_backend("oracle")
@@ -0,0 +1,58 @@
+"""Tests for the streaming remote-text source."""
+
+import pytest
+
+from app.models.remote_text.connector import RemoteTextConnector
+from app.models.remote_text.interface import RemoteTextInterface
+from app.models.text.connector import TextConnector
+from app.models.text.interface import TextInterface
+from app.properties import ClassName
+from tests.conftest import LOD_TABLES
+
+
+class TestRemoteTextConnector:
+    """Tests for RemoteTextConnector."""
+
+    def test_rejects_non_url(self):
+        with pytest.raises(ValueError, match="Invalid URL"):
+            RemoteTextConnector("data/text")
+
+    def test_is_read_only(self):
+        with pytest.raises(ValueError, match="read-only"):
+            RemoteTextConnector("https://example.com/tables/", importing=True)
+
+    def test_urls_cover_all_tables(self):
+        connector = RemoteTextConnector("https://example.com/tables")
+        assert connector.url_by_name(ClassName.words) == (
+            "https://example.com/tables/Words.txt"
+        )
+        assert len(connector.urls) == 8
+
+
+class TestRemoteTextInterface:
+    """Tests for RemoteTextInterface."""
+
+    def test_export_matches_text_interface(self, lod_server, text_tables):
+        for name, content in LOD_TABLES.items():
+            lod_server.files[f"/tables/{name}.txt"] = content.encode("utf-8")
+
+        connector = RemoteTextConnector(f"{lod_server.url}/tables/")
+        remote = RemoteTextInterface(connector).export_data()
+        local = TextInterface(TextConnector(str(text_tables))).export_data()
+
+        for remote_container, local_container in zip(
+            remote.containers, local.containers
+        ):
+            assert remote_container == local_container
+            assert len(remote_container) > 0
+
+    def test_multibyte_characters_split_across_chunks(self, lod_server, monkeypatch):
+        monkeypatch.setattr("app.download.CHUNK_SIZE", 3)
+        for name, content in LOD_TABLES.items():
+            lod_server.files[f"/tables/{name}.txt"] = content.encode("utf-8")
+
+        connector = RemoteTextConnector(f"{lod_server.url}/tables/")
+        storage = RemoteTextInterface(connector).export_data()
+
+        definitions = storage.container_by_name(ClassName.definitions)
+        assert definitions[0][4] == "K is a «box» of L"
@@ -51,6 +51,22 @@ class TestSQLiteDatabaseConnector:
         session = conn.session
         assert session is not None
 
+    def test_session_factory_is_built_once(self):
+        from app.models.sqlite.connector import SQLiteDatabaseConnector
+
+        conn = SQLiteDatabaseConnector(":memory:")
+        factory = conn.session_factory
+        with conn.session as first, conn.session as second:
+            assert first is not second
+            assert first.bind is second.bind is conn.engine
+        assert conn.session_factory is factory
+
+    def test_engine_options_override_defaults(self):
+        from app.models.sqlite.connector import SQLiteDatabaseConnector
+
+        conn = SQLiteDatabaseConnector(":memory:", insertmanyvalues_page_size=50)
+        assert conn.engine.dialect.insertmanyvalues_page_size == 50
+
     def test_is_path_validates_memory(self):
         from app.models.sqlite.connector import SQLiteDatabaseConnector
 
@@ -240,7 +256,7 @@ class TestCLIWiring:
         parser = generate_parser()
         for action in parser._actions:
             if action.dest in ("from_type", "to_type"):
-                assert set(action.choices) == {"postgres", "access", "text", "sqlite"}
+                assert {"postgres", "access", "text", "sqlite"} <= set(action.choices)
 
 
 class TestEnvConfig:
@@ -0,0 +1,56 @@
+"""Tests of the jsonl and msgpack streaming backends."""
+
+import json
+
+import pytest
+
+from app.models.stream.connector import JsonLinesConnector, MessagePackConnector
+from app.models.stream.interface import JsonLinesInterface, MessagePackInterface
+from app.models.text.connector import TextConnector
+from app.models.text.interface import TextInterface
+from app.properties import ClassName
+
+BACKENDS = {
+    "jsonl": (JsonLinesConnector, JsonLinesInterface),
+    "msgpack": (MessagePackConnector, MessagePackInterface),
+}
+
+
+@pytest.fixture
+def storage(text_tables):
+    return TextInterface(TextConnector(str(text_tables))).export_data()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+@pytest.mark.parametrize("backend", list(BACKENDS))
+def test_round_trip(tmp_path, storage, backend, compression):
+    if backend == "msgpack":
+        pytest.importorskip("msgpack")
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    connector, interface = BACKENDS[backend]
+    path = str(tmp_path / backend)
+
+    interface(connector(path, importing=True), compression=compression).import_data(
+        storage
+    )
+    restored = interface(connector(path)).export_data()
+
+    for expected, actual in zip(storage.containers, restored.containers):
+        assert actual == expected, expected.name
+
+
+def test_jsonl_records_are_typed_and_named(tmp_path, storage):
+    path = tmp_path / "jsonl"
+    JsonLinesInterface(JsonLinesConnector(str(path), importing=True)).import_data(
+        storage
+    )
+    lines = (path / "Syllable.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0]) == {"name": "ba", "type": "InitialCV", "allowed": True}
+
+
+def test_read_table_streams_rows(tmp_path, storage):
+    path = str(tmp_path / "jsonl")
+    JsonLinesInterface(JsonLinesConnector(path, importing=True)).import_data(storage)
+    rows = JsonLinesInterface(JsonLinesConnector(path)).read_table(ClassName.authors)
+    assert next(rows) == ["JCB", "James Cooke Brown", None]
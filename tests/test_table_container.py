@@ -0,0 +1,93 @@
+"""Tests of TableContainer ingestion, validation modes and cached indexes."""
+
+import pytest
+
+from app.properties import ClassName, DEFAULT_TABLE_PROPERTIES_COLLECTION
+from app.storage import Storage
+from app.table_container import SAMPLE_INTERVAL, TableContainer
+
+SYLLABLES = DEFAULT_TABLE_PROPERTIES_COLLECTION[7]
+
+
+def rows(count):
+    return [[f"s{i}", "InitialCV", "True"] for i in range(count)]
+
+
+@pytest.mark.parametrize("validation", ["full", "sampled", "none"])
+def test_ingest_converts_in_batches(validation):
+    container = TableContainer(SYLLABLES)
+    container.ingest(rows(25), validation, batch_size=10)
+    assert len(container) == 25
+    assert container[24] == ["s24", "InitialCV", True]
+
+
+def test_full_validation_rejects_any_bad_item():
+    container = TableContainer(SYLLABLES)
+    items = rows(5) + [["s5", 1, True]]
+    with pytest.raises(ValueError):
+        container.ingest(items, "full")
+    assert not container
+
+
+def test_sampled_validation_checks_every_interval():
+    bad = ["s", 1, True]
+    checked = TableContainer(SYLLABLES)
+    with pytest.raises(ValueError):
+        checked.ingest([bad] + rows(SAMPLE_INTERVAL))
+
+    skipped = TableContainer(SYLLABLES)
+    skipped.ingest(rows(1) + [bad], "sampled")
+    assert skipped[1] == bad
+
+
+def test_no_validation_trusts_items():
+    container = TableContainer(SYLLABLES)
+    container.ingest([["s", 1, True]], "none")
+    assert container == [["s", 1, True]]
+
+
+def test_unknown_validation_mode():
+    with pytest.raises(ValueError):
+        TableContainer(SYLLABLES).ingest(rows(1), "partial")
+
+
+def test_storage_ingest_by_name():
+    storage = Storage()
+    storage.ingest(ClassName.syllables, rows(3), "sampled")
+    assert len(storage.container_by_name(ClassName.syllables)) == 3
+
+
+def test_mutations_invalidate_cached_indexes():
+    container = TableContainer(SYLLABLES)
+    container.ingest(rows(3))
+    index = container.index_by("name")
+    assert index["s1"] == ["s1", "InitialCV", True]
+    assert container.index_by("name") is index
+
+    container.append(["s3", "InitialCV", "False"])
+    assert "s3" in container.index_by("name")
+    container.ingest([["s4", "InitialCV", "True"]])
+    assert "s4" in container.index_by("name")
+    container[0] = ["t0", "InitialCV", False]
+    assert set(container.group_by("name")) == {"t0", "s1", "s2", "s3", "s4"}
+
+    container.pop()
+    del container[0]
+    assert set(container.index_by("name")) == {"s1", "s2", "s3"}
+    with pytest.raises(ValueError):
+        container.index_by("unknown")
+
+
+def test_storage_lookups_by_natural_keys():
+    storage = Storage()
+    storage.container_by_name(ClassName.word_spells).extend_directly(
+        [[1, "Ba", "ba", "05", 1, 9999, ""], [1, "Bab", "bab", "055", 1, 9999, ""]]
+    )
+    storage.container_by_name(ClassName.definitions).extend_directly(
+        [[1, 1, "", "2n", "body", "", ""], [2, 1, "", "", "other", "", ""]]
+    )
+
+    assert [spell[1] for spell in storage.spells_by_old_id(1)] == ["Ba", "Bab"]
+    assert storage.spell_by_name("Bab")[2] == "bab"
+    assert [d[4] for d in storage.definitions_by_word(2)] == ["other"]
+    assert storage.word_by_old_id(1) is None and storage.spells_by_old_id(5) == []
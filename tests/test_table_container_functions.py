@@ -0,0 +1,72 @@
+"""Tests of the per-column conversion plan against convert_element."""
+
+import pytest
+
+from app.properties import DEFAULT_TABLE_PROPERTIES_COLLECTION
+from app.table_container import TableContainer
+from app.table_container_functions import (
+    column_converter,
+    conversion_plan,
+    convert_element,
+    prepared_types,
+)
+
+TYPES = sorted(
+    {
+        prepared_types(types)
+        for properties in DEFAULT_TABLE_PROPERTIES_COLLECTION
+        for types in properties.pattern
+    }
+    | {(int, bool), (int, bool, type(None))},
+    key=str,
+)
+VALUES = [
+    None,
+    "",
+    "0",
+    "12",
+    "-12",
+    " 12",
+    "²",
+    "True",
+    "false",
+    "TRUE",
+    "yes",
+    "text",
+    0,
+    12,
+    -12,
+    True,
+    False,
+    1.5,
+    b"12",
+]
+
+
+def outcome(func, value):
+    try:
+        result = func(value)
+    except ValueError as error:
+        return ValueError, str(error)
+    return type(result), result
+
+
+@pytest.mark.parametrize("types", TYPES, ids=str)
+def test_column_converter_matches_convert_element(types):
+    convert = column_converter(types) or (lambda value: value)
+    for value in VALUES:
+        expected = outcome(lambda v: convert_element(v, types), value)
+        assert outcome(convert, value) == expected, value
+
+
+def test_plain_columns_need_no_conversion():
+    assert column_converter((str,)) is None
+    assert conversion_plan([(str,), (int,)])[0] is None
+
+
+def test_container_converts_typed_and_raw_rows_alike():
+    words = TableContainer(DEFAULT_TABLE_PROPERTIES_COLLECTION[3])
+    raw = ["1", "C-Prim", "Predicate", "", "", "JCB", "1975", "", "", "", "", "7"]
+    typed = words.convert_item_elements(raw)
+    assert typed[0] == 1 and typed[3] is None and typed[11] == 7
+    assert words.convert_item_elements(typed) == typed
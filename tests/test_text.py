@@ -0,0 +1,95 @@
+"""Tests of sequential and parallel parsing of text tables."""
+
+import pytest
+
+from app.models.text import interface as text_interface
+from app.models.text.connector import TextConnector
+from app.models.text.functions import TextOptions, chunk_offsets
+from app.models.text.interface import TextInterface
+from benchmarks.synthetic import generate_tables, write_text_tables
+
+
+def test_chunks_start_at_line_beginnings(tmp_path):
+    path = tmp_path / "table.txt"
+    lines = [f"{i}@{'x' * (i % 7)}\n" for i in range(200)]
+    path.write_text("".join(lines), encoding="utf-8")
+    data = path.read_bytes()
+
+    offsets = chunk_offsets(str(path), chunk_size=100)
+    assert len(offsets) > 1
+    assert offsets[0][0] == 0 and offsets[-1][1] == len(data)
+    for start, end in offsets:
+        assert start == 0 or data[start - 1 : start] == b"\n"
+    assert b"".join(data[start:end] for start, end in offsets) == data
+
+
+def test_parallel_export_matches_sequential(tmp_path):
+    directory = write_text_tables(generate_tables(300), str(tmp_path))
+    sequential = TextInterface(TextConnector(directory)).export_data()
+    parallel = TextInterface(
+        TextConnector(directory), TextOptions(workers=2, chunk_size=2048)
+    ).export_data()
+
+    for expected, actual in zip(sequential.containers, parallel.containers):
+        assert actual == expected, expected.name
+
+
+@pytest.mark.parametrize("words", [0, 300])
+def test_arrow_parser_matches_python(tmp_path, text_tables, words):
+    pytest.importorskip("pyarrow")
+    directory = (
+        write_text_tables(generate_tables(words), str(tmp_path / "synthetic"))
+        if words
+        else str(text_tables)
+    )
+    expected = TextInterface(TextConnector(directory)).export_data()
+    actual = TextInterface(
+        TextConnector(directory), TextOptions(parser="arrow")
+    ).export_data()
+
+    for python_rows, arrow_rows in zip(expected.containers, actual.containers):
+        assert arrow_rows == python_rows, python_rows.name
+
+
+def test_arrow_parser_rejects_unsuitable_lines(text_tables):
+    pytest.importorskip("pyarrow")
+    (text_tables / "Syllable.txt").write_text("ba@InitialCV\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        TextInterface(
+            TextConnector(str(text_tables)), TextOptions(parser="arrow")
+        ).export_data()
+
+
+def test_arrow_parser_falls_back_without_pyarrow(text_tables, monkeypatch):
+    monkeypatch.setattr(text_interface, "pyarrow_available", lambda: False)
+    interface = TextInterface(
+        TextConnector(str(text_tables)), TextOptions(parser="arrow")
+    )
+    assert interface.options.parser == "python"
+    with pytest.raises(ValueError):
+        TextInterface(TextConnector(str(text_tables)), TextOptions(parser="pandas"))
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+@pytest.mark.parametrize("options", [{}, {"workers": 2}, {"parser": "arrow"}])
+def test_compressed_tables_round_trip(tmp_path, compression, options):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    if options.get("parser") == "arrow":
+        pytest.importorskip("pyarrow")
+    directory = write_text_tables(generate_tables(300), str(tmp_path / "plain"))
+    expected = TextInterface(TextConnector(directory)).export_data()
+
+    target = tmp_path / "compressed"
+    target.mkdir()
+    TextInterface(
+        TextConnector(str(target), importing=True), TextOptions(compression=compression)
+    ).import_data(expected)
+    (written,) = target.iterdir()
+    assert all(path.suffix in (".gz", ".zst") for path in written.iterdir())
+
+    actual = TextInterface(
+        TextConnector(str(written)), TextOptions(**options)
+    ).export_data()
+    for expected_rows, actual_rows in zip(expected.containers, actual.containers):
+        assert actual_rows == expected_rows, expected_rows.name